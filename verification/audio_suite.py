@@ -0,0 +1,265 @@
+"""Check 10-audio-processing worker output against NumPy and time it.
+
+The audio workers in this tree do not process sample buffers: the ones that
+return waveforms synthesize them from parameters (903 oscillators, 916
+flanger, 917 phaser, 918 tanh distortion) and the rest compute control
+values (pan law, delay taps, limiter, pitch ratio, tempo from taps). Each
+case posts the message its ``main.js`` would to the example's own
+``worker.js`` from inside its page and compares the reply with a NumPy
+reference. Workers that answer with ``Math.random()`` (901, 902, 909, 910,
+911, 921, 922) cannot be checked and are listed as such.
+
+Waveform cases also repeat their message ``--repeat`` times in one worker
+and report a real-time factor: seconds of audio returned, at
+``--sample-rate``, per second from ``postMessage`` to the reply.
+
+    python verification/audio_suite.py --serve
+    python verification/audio_suite.py --serve --filter 918 --repeat 1000 --sample-rate 44100
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from engine import VerificationEngine
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+TIMEOUT_MS = 60000
+CATEGORY = "10-audio-processing"
+ATOL = 1e-9
+UNVERIFIABLE = {
+    f"{CATEGORY}/{name}": "answers with Math.random()"
+    for name in ("901-audio-visualizer", "902-frequency-analyzer", "909-beat-detector", "910-spectrum-analyzer",
+                 "911-audio-compressor", "921-audio-meter", "922-waveform-display")
+}
+
+RUN_MESSAGES = """
+async ({ example, messages, repeat, timeoutMs }) => {
+  const worker = new Worker(`/examples/${example}/worker.js`);
+  const request = (message) => new Promise((resolve, reject) => {
+    const timer = setTimeout(() => reject(new Error(`worker did not answer within ${timeoutMs} ms`)), timeoutMs);
+    worker.onmessage = (event) => { clearTimeout(timer); resolve(event.data); };
+    worker.onerror = (event) => { clearTimeout(timer); reject(new Error(event.message)); };
+    worker.postMessage(message);
+  });
+  try {
+    const replies = [];
+    for (const message of messages) replies.push(await request(message));
+    const round_trips = [];
+    for (let i = 0; i < repeat; i++) {
+      const started = performance.now();
+      await request(messages[messages.length - 1]);
+      round_trips.push(performance.now() - started);
+    }
+    return { replies, round_trips };
+  } finally {
+    worker.terminate();
+  }
+}
+"""
+
+
+def js_round(values):
+    """``Math.round``: halves round up, unlike NumPy's round-half-to-even."""
+    return np.floor(np.asarray(values, dtype=np.float64) + 0.5)
+
+
+def oscillator(kind):
+    x = np.arange(400, dtype=np.float64)
+    phase = x * 4 / 400
+    sine = np.sin(x * np.pi * 2 * 4 / 400)
+    if kind == "square":
+        return np.where(sine > 0, 1.0, -1.0), np.abs(sine) < 1e-9
+    if kind == "sawtooth":
+        return (phase % 1) * 2 - 1, None
+    if kind == "triangle":
+        return np.abs((phase % 1) * 4 - 2) - 1, None
+    return sine, None
+
+
+def delay_echoes(time_ms, feedback):
+    echoes, level = [], 100
+    for i in range(1, 6):
+        if level <= 5:
+            break
+        level = int(js_round(level * feedback / 100))
+        echoes.append({"time": time_ms * i, "level": level})
+    return echoes
+
+
+def _case(example, name, messages, expected, field=None, ambiguous=None, samples=None):
+    """``expected`` is compared with ``reply[field]`` (or the whole reply) of the last message.
+
+    ``ambiguous`` masks samples where the sign of a value within rounding of
+    zero decides the output, so JS and NumPy may legitimately differ.
+    """
+    return {"example": f"{CATEGORY}/{example}", "name": name, "messages": messages, "expected": expected,
+            "field": field, "ambiguous": ambiguous, "samples": samples}
+
+
+def build_cases():
+    cases = []
+    for kind in ("sine", "square", "sawtooth", "triangle"):
+        expected, ambiguous = oscillator(kind)
+        cases.append(_case("903-waveform-generator", kind, [{"type": kind}], expected,
+                           ambiguous=ambiguous, samples=len(expected)))
+    for drive in (0, 50, 100):
+        x = np.sin(np.arange(300) / 15)
+        cases.append(_case("918-distortion", f"drive {drive}", [{"drive": drive}],
+                           np.tanh(x * (drive / 100 * 5 + 1)), field="wave", samples=300))
+    for rate, depth in ((1, 10), (5, 50)):
+        # The worker advances its LFO by 0.05 per message; a fresh one answers at t = 0.05.
+        wave = np.sin(np.arange(300) / 20 + np.sin(0.05 * rate) * depth / 50)
+        cases.append(_case("916-flanger", f"rate {rate} depth {depth}", [{"rate": rate, "depth": depth}],
+                           wave, field="wave", samples=300))
+    for stages, speed in ((4, 1), (8, 5)):
+        t = speed * 0.1
+        phases = np.sin(t + np.arange(stages) * np.pi / stages) * 45
+        cases.append(_case("917-phaser", f"{stages} stages speed {speed}", [{"stages": stages, "speed": speed}],
+                           phases, field="phases", samples=stages))
+    for pan in (-100, -50, 0, 50, 100):
+        angle = (pan + 100) / 200 * np.pi / 2
+        cases.append(_case("920-stereo-panner", f"pan {pan}", [{"pan": pan}],
+                           {"left": js_round(100 * np.cos(angle)), "right": js_round(100 * np.sin(angle))}))
+    for time_ms, feedback in ((250, 50), (100, 90), (500, 0)):
+        cases.append(_case("914-delay-effect", f"{time_ms} ms feedback {feedback}",
+                           [{"time": time_ms, "feedback": feedback}], delay_echoes(time_ms, feedback), field="echoes"))
+    for semitones in (-12, -7, 0, 7, 12):
+        cases.append(_case("907-pitch-shifter", f"{semitones:+d} semitones", [{"semitones": semitones}],
+                           2.0 ** (semitones / 12), field="ratio"))
+    for volumes in ((100, 100, 100), (50, 25, 0), (0, 0, 0)):
+        mean = np.mean(np.array(volumes) / 100)
+        cases.append(_case("904-audio-mixer", "volumes " + "/".join(map(str, volumes)),
+                           [{"channels": [{"volume": volume} for volume in volumes]}],
+                           20 * np.log10(mean) if mean > 0 else -60.0, field="master"))
+    for ceiling, level in ((-1, -3), (-1, 2)):
+        cases.append(_case("919-limiter", f"ceiling {ceiling} input {level}", [{"ceiling": ceiling, "input": level}],
+                           {"output": min(level, ceiling), "limiting": level > ceiling}))
+        cases.append(_case("912-noise-gate", f"threshold {ceiling} level {level}",
+                           [{"threshold": ceiling, "level": level}], level > ceiling, field="open"))
+    for bpm in (60, 120, 174):
+        interval = 60000 / bpm
+        taps = [{"time": 1_000_000 + round(i * interval)} for i in range(8)]
+        cases.append(_case("908-tempo-analyzer", f"{bpm} bpm taps", taps, bpm, field="bpm"))
+    cases.append(_case("906-equalizer", "bass preset", [{"type": "preset", "name": "bass"}],
+                       [6, 5, 4, 2, 0, 0, 0, 0, 0, 0], field="values"))
+    cases.append(_case("906-equalizer", "set", [{"type": "set", "values": list(range(-5, 5))}],
+                       list(range(-5, 5)), field="values"))
+    return cases
+
+
+def compare(actual, expected, ambiguous=None):
+    """Return a description of how ``actual`` differs from ``expected``, or ``None``."""
+    if isinstance(expected, dict):
+        for key, value in expected.items():
+            mismatch = compare(actual.get(key) if isinstance(actual, dict) else None, value)
+            if mismatch:
+                return f"{key}: {mismatch}"
+        return None
+    if isinstance(expected, bool) or (isinstance(expected, list) and expected and isinstance(expected[0], dict)):
+        return None if actual == expected else f"{actual!r} != {expected!r}"
+    try:
+        observed = np.asarray(actual, dtype=np.float64)
+    except (TypeError, ValueError):
+        return f"{actual!r} is not numeric"
+    reference = np.asarray(expected, dtype=np.float64)
+    if observed.shape != reference.shape:
+        return f"shape {observed.shape} != {reference.shape}"
+    close = np.isclose(observed, reference, rtol=ATOL, atol=ATOL)
+    if ambiguous is not None:
+        close |= ambiguous
+    if close.all():
+        return None
+    errors = np.abs(observed - reference)
+    return f"{int((~close).sum())} of {close.size} values differ, max abs error {float(errors.max()):.3g}"
+
+
+async def check_case(page, case, options):
+    result = {"example": case["example"], "case": case["name"]}
+    repeat = options.repeat if case["samples"] else 0
+    try:
+        run = await page.evaluate(RUN_MESSAGES, {"example": case["example"], "messages": case["messages"],
+                                                 "repeat": repeat, "timeoutMs": TIMEOUT_MS})
+        reply = run["replies"][-1]
+        actual = reply.get(case["field"]) if case["field"] and isinstance(reply, dict) else reply
+        mismatch = compare(actual, case["expected"], case["ambiguous"])
+        result["status"] = "failed" if mismatch else "passed"
+        if mismatch:
+            result["mismatch"] = mismatch
+        if run["round_trips"]:
+            round_trip_ms = statistics.median(run["round_trips"])
+            result["samples"] = case["samples"]
+            result["round_trip_ms"] = round(round_trip_ms, 4)
+            result["real_time_factor"] = round(case["samples"] / options.sample_rate / (round_trip_ms / 1000), 1)
+    except Exception as e:
+        result.update(status="failed", mismatch=str(e))
+    return result
+
+
+async def run_all(cases, options):
+    async def job(page, case):
+        await page.goto(f"{options.base_url}/examples/{case['example']}/index.html")
+        return await check_case(page, case, options)
+
+    results = []
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for result in engine.imap(job, cases):
+            results.append(result)
+            rtf = f" RTF {result['real_time_factor']}x" if "real_time_factor" in result else ""
+            print(f"{result['status'].upper()} {result['example']} [{result['case']}]{rtf}")
+            if result.get("mismatch"):
+                print(f"  {result['mismatch']}")
+    return sorted(results, key=lambda result: (result["example"], result["case"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check 10-audio-processing worker output against NumPy.")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run examples whose id contains this text (repeatable)")
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="timed repetitions of each waveform message (default: 200)")
+    parser.add_argument("--sample-rate", type=int, default=48000,
+                        help="sample rate the real-time factor assumes (default: 48000)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    def selected(example):
+        return not args.filter or any(text in example for text in args.filter)
+
+    cases = [case for case in build_cases() if selected(case["example"])]
+    unverifiable = {example: reason for example, reason in UNVERIFIABLE.items() if selected(example)}
+    for example, reason in sorted(unverifiable.items()):
+        print(f"UNVERIFIABLE {example}: {reason}")
+    if not cases:
+        print("No audio cases selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Running {len(cases)} audio cases...")
+    results = asyncio.run(run_all(cases, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "audio.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "sample_rate": args.sample_rate,
+              "results": results, "unverifiable": unverifiable}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] == "failed")
+    print("-" * 20)
+    print(f"{len(results) - failed} passed, {failed} failed, {len(unverifiable)} unverifiable; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+"""Push a batch of images through image-processing workers without reloading.
+
+Loading a page per image mostly measures page start-up. This loads each
+selected 03-image-processing example once, drives it through one image the
+way ``pixel_golden.py`` does (file input, process button) and lets
+``init_scripts/batch.js`` record the message the page sent its worker and
+the reply that finished it. Every image in the batch is then decoded in the
+page and posted to the same worker with that message, its pixel buffers
+transferred, waiting for the same reply before sending the next one.
+
+The batch is a directory of images (``--images``) or, by default, a seeded
+set from ``fixtures.test_image``. The report gives images per second and
+per-image latency percentiles from ``postMessage`` to the reply, with
+decoding timed separately.
+
+    python verification/batch_images.py --serve --range 284-299
+    python verification/batch_images.py --serve --filter sobel --images ~/photos --repeat 3
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+from benchmarks import percentile
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT, INIT_SCRIPTS_DIR, wait_for_completion
+from engine import VerificationEngine
+from fixtures import test_image
+from manifest import load_manifest, parse_range
+from pixel_golden import DEFAULT_RANGE, parse_size, pipeline
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+BATCH_SCRIPT = (INIT_SCRIPTS_DIR / "batch.js").read_text()
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif"}
+CONTENT_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg"}
+TIMEOUT_MS = 60000
+
+RUN_BATCH = """
+async ({ count, timeoutMs }) => {
+  const decodes = [];
+  const latencies = [];
+  const started = performance.now();
+  for (let i = 0; i < count; i++) {
+    const decodeStarted = performance.now();
+    const blob = await (await fetch(`/__batch/${i}`)).blob();
+    const bitmap = await createImageBitmap(blob);
+    const canvas = new OffscreenCanvas(bitmap.width, bitmap.height);
+    const context = canvas.getContext('2d');
+    context.drawImage(bitmap, 0, 0);
+    const image = context.getImageData(0, 0, bitmap.width, bitmap.height);
+    const sent = performance.now();
+    await window.__batch.process(image, bitmap, timeoutMs);
+    decodes.push(sent - decodeStarted);
+    latencies.push(performance.now() - sent);
+  }
+  return { total_ms: performance.now() - started, decode_ms: decodes, latency_ms: latencies };
+}
+"""
+
+
+def batch_images(directory, count, size, seed):
+    """The image files to push through each example, in order."""
+    if directory is None:
+        return [test_image(*size, seed=seed + i) for i in range(count)]
+    paths = sorted(path for path in Path(directory).expanduser().iterdir() if path.suffix.lower() in IMAGE_SUFFIXES)
+    return paths[:count] if count else paths
+
+
+async def serve_batch(page, images):
+    """Answer ``/__batch/<i>`` on the example's origin with the i-th image."""
+    async def handle(route):
+        index = int(route.request.url.rsplit("/", 1)[1])
+        path = images[index]
+        await route.fulfill(body=path.read_bytes(),
+                            content_type=CONTENT_TYPES.get(path.suffix.lower(), f"image/{path.suffix[1:].lower()}"))
+
+    await page.route("**/__batch/*", handle)
+
+
+async def run_example(page, entry, steps, images, options):
+    result = {"example": entry["id"], "images": len(images)}
+    try:
+        started = time.perf_counter()
+        await page.goto(f"{options.base_url}/examples/{entry['id']}/index.html")
+        result["page_load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        await page.set_input_files(steps["file_input"], str(images[0]))
+        if steps["button"]:
+            await page.wait_for_selector(f"{steps['button']}:enabled", timeout=10000)
+            await page.click(steps["button"])
+        await wait_for_completion(page)
+        if not await page.evaluate("() => window.__batch.ready()"):
+            raise RuntimeError("the page never posted an image to a worker and got a reply")
+        result["protocol"] = await page.evaluate("() => window.__batch.describe()")
+
+        await serve_batch(page, images)
+        runs = [await page.evaluate(RUN_BATCH, {"count": len(images), "timeoutMs": options.timeout})
+                for _ in range(options.repeat)]
+        latencies = [latency for run in runs for latency in run["latency_ms"]]
+        result.update(
+            status="passed",
+            images_per_s=round(statistics.median(len(images) / (run["total_ms"] / 1000) for run in runs), 2),
+            decode_ms=round(statistics.median(d for run in runs for d in run["decode_ms"]), 2),
+            latency_ms={name: round(percentile(latencies, fraction), 2)
+                        for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0))},
+        )
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    return result
+
+
+async def run_all(jobs, images, options):
+    async def job(page, item):
+        entry, steps = item
+        return await run_example(page, entry, steps, images, options)
+
+    results = []
+    # One example at a time so the latencies are not skewed by other pages' workers.
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT, BATCH_SCRIPT]) as engine:
+        async for result in engine.imap(job, jobs):
+            results.append(result)
+            print_result(result)
+    return sorted(results, key=lambda result: result["example"])
+
+
+def print_result(result):
+    if result["status"] != "passed":
+        print(f"FAILED {result['example']}: {result['error']}")
+        return
+    latency = result["latency_ms"]
+    print(f"{result['example']}: {result['images_per_s']} images/s, latency p50 {latency['p50']} ms, "
+          f"p99 {latency['p99']} ms (page load {result['page_load_ms']} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Push a batch of images through image-processing workers.")
+    parser.add_argument("--range", type=parse_range, default=DEFAULT_RANGE,
+                        help="example numbers to run (default: 284-395)")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run examples whose id contains this text (repeatable)")
+    parser.add_argument("--images", type=Path, help="directory of images to push (default: seeded test images)")
+    parser.add_argument("--count", type=int, default=32,
+                        help="number of images (default: 32; all of --images when 0)")
+    parser.add_argument("--size", type=parse_size, default=(512, 384), help="seeded image size (default: 512x384)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the batch per example")
+    parser.add_argument("--timeout", type=int, default=TIMEOUT_MS, help="per-image reply timeout in ms")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    images = batch_images(args.images, args.count, args.size, args.seed)
+    if not images:
+        print(f"No images found in {args.images}.")
+        return 1
+    entries = load_manifest().select(categories=["03-image-processing"], numbers=args.range, contains=args.filter)
+    jobs = []
+    for entry in entries:
+        steps, reason = pipeline(entry)
+        if steps is None:
+            print(f"SKIPPED {entry['id']}: {reason}")
+        else:
+            jobs.append((entry, steps))
+    if not jobs:
+        print("No image examples selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Pushing {len(images)} images x {args.repeat} through {len(jobs)} examples...")
+    results = asyncio.run(run_all(jobs, images, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "batch-images.json"
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "images": [str(path) for path in images],
+        "repeat": args.repeat,
+        "results": results,
+    }
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] != "passed")
+    print("-" * 20)
+    print(f"{len(results) - failed} examples measured, {failed} failed; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
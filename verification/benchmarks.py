@@ -0,0 +1,200 @@
+"""Run the 05-performance-tools benchmarks headlessly and record their timings.
+
+Every benchmark page with the standard ``#run-btn`` / ``#result-stats``
+layout is driven automatically; pages with their own layout are described in
+``benchmarks.json``. Each benchmark runs ``--warmup`` discarded iterations and
+then ``--iterations`` measured ones on a freshly loaded page, one benchmark at
+a time so they do not compete for CPU. Results are written as JSON and CSV to
+``verification/output/benchmarks/``.
+
+    python verification/benchmarks.py --iterations 10
+    python verification/benchmarks.py --range 501-509 --iterations 5
+"""
+import argparse
+import asyncio
+import csv
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from engine import VerificationEngine
+from manifest import EXAMPLES_DIR, load_manifest, parse_range
+from serve import serve_base_url
+from steps import perform_steps
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = Path(__file__).resolve().parent / "benchmarks.json"
+OUTPUT_DIR = REPO_ROOT / "verification" / "output" / "benchmarks"
+BASE_URL = "http://localhost:8080"
+CATEGORY = "05-performance-tools"
+
+STANDARD_STEPS = [
+    {"action": "click", "selector": "#run-btn"},
+    {"action": "wait_for", "selector": "#result-section:not(.hidden)", "timeout": 300000},
+    {"action": "read_stats", "selector": "#result-stats"},
+]
+
+
+def is_standard_benchmark(example_id):
+    index_html = (EXAMPLES_DIR / example_id / "index.html").read_text(encoding="utf-8", errors="replace")
+    return all(f'id="{element}"' in index_html for element in ("run-btn", "result-section", "result-stats"))
+
+
+def benchmark_steps(selected):
+    """Map each selected example id to the steps that run its benchmark once."""
+    overrides = json.loads(CONFIG_PATH.read_text())
+    steps = {}
+    for entry in selected:
+        if entry["id"] in overrides:
+            steps[entry["id"]] = overrides[entry["id"]]["steps"]
+        elif is_standard_benchmark(entry["id"]):
+            steps[entry["id"]] = STANDARD_STEPS
+    return steps
+
+
+def percentile(samples, fraction):
+    """Linearly interpolated percentile of a non-empty list."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples):
+    return {
+        "n": len(samples),
+        "mean": statistics.fmean(samples),
+        "p50": percentile(samples, 0.50),
+        "p95": percentile(samples, 0.95),
+        "min": min(samples),
+        "max": max(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+
+def machine_fingerprint(browser_version=""):
+    """Describe the hardware and browser a run was measured on."""
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "browser": browser_version,
+    }
+
+
+async def run_benchmark(page, example_id, steps, iterations, warmup, base_url):
+    """Run one benchmark repeatedly; return ``{metric: {"unit", "samples"}}``."""
+    metrics = {}
+    for iteration in range(warmup + iterations):
+        await page.goto(f"{base_url}/examples/{example_id}/index.html")
+        started = time.perf_counter()
+        readings = await perform_steps(page, steps)
+        readings["Wall Time"] = {"value": (time.perf_counter() - started) * 1000, "unit": "ms"}
+        if iteration < warmup:
+            continue
+        for name, reading in readings.items():
+            metric = metrics.setdefault(name, {"unit": reading["unit"], "samples": []})
+            metric["samples"].append(reading["value"])
+    return metrics
+
+
+async def run_all(steps_by_id, iterations, warmup, base_url):
+    results, errors = {}, {}
+
+    async def job(page, example_id):
+        try:
+            metrics = await run_benchmark(page, example_id, steps_by_id[example_id], iterations, warmup, base_url)
+            return example_id, metrics, None
+        except Exception as e:
+            return example_id, None, str(e)
+
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        browser_version = engine.browser.version
+        async for example_id, metrics, error in engine.imap(job, sorted(steps_by_id)):
+            if error:
+                errors[example_id] = error
+                print(f"FAILED {example_id}: {error}")
+                continue
+            results[example_id] = {
+                name: dict(summarize(metric["samples"]), unit=metric["unit"])
+                for name, metric in metrics.items()
+            }
+            wall = results[example_id]["Wall Time"]
+            print(f"{example_id}: wall time mean {wall['mean']:.1f} ms, p95 {wall['p95']:.1f} ms")
+    return results, errors, browser_version
+
+
+def write_reports(report, output_dir):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = time.strftime("benchmark-%Y%m%d-%H%M%S")
+    json_path = output_dir / f"{stem}.json"
+    json_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    csv_path = output_dir / f"{stem}.csv"
+    columns = ["n", "mean", "p50", "p95", "min", "max", "stdev"]
+    with csv_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["example", "metric", "unit", *columns, "browser", "machine"])
+        machine = report["machine"]
+        for example_id, metrics in sorted(report["results"].items()):
+            for name, summary in metrics.items():
+                writer.writerow([
+                    example_id, name, summary["unit"],
+                    *(round(summary[column], 4) for column in columns),
+                    machine["browser"], f"{machine['system']}-{machine['machine']}-{machine['cpu_count']}cpu",
+                ])
+    return json_path, csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the 05-performance-tools benchmarks headlessly.")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--range", type=parse_range, help="example numbers, e.g. 501-509")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run examples whose id contains this text (repeatable)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    selected = manifest.select(categories=[CATEGORY], numbers=args.range, contains=args.filter)
+    steps_by_id = benchmark_steps(selected)
+    if not steps_by_id:
+        print("No benchmarks selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Running {len(steps_by_id)} benchmarks x {args.iterations} iterations ({args.warmup} warm-up)...")
+    results, errors, browser_version = asyncio.run(
+        run_all(steps_by_id, args.iterations, args.warmup, args.base_url)
+    )
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "machine": machine_fingerprint(browser_version),
+        "results": results,
+        "errors": errors,
+    }
+    json_path, csv_path = write_reports(report, args.output_dir)
+    print("-" * 20)
+    print(f"{len(results)} benchmarks measured, {len(errors)} failed; saved {json_path} and {csv_path}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,37 @@
+"""Wait for an example to finish instead of sleeping for a fixed time.
+
+``INIT_SCRIPT`` must be installed before the page loads (for example with
+``context.add_init_script``). It implements the completion protocol described
+in ``init_scripts/completion.js`` and falls back to worker-message
+quiescence for examples that do not signal completion themselves.
+"""
+from pathlib import Path
+
+INIT_SCRIPTS_DIR = Path(__file__).resolve().parent / "init_scripts"
+INIT_SCRIPT = (INIT_SCRIPTS_DIR / "completion.js").read_text()
+
+QUIET_MS = 500
+TIMEOUT_MS = 15000
+
+
+async def wait_for_completion(page, timeout=TIMEOUT_MS, quiet_ms=QUIET_MS):
+    """Wait until the page signals completion or its workers go quiet.
+
+    Workers only count as quiet once every message posted to them has been
+    answered, so ``timeout`` is the only bound on a worker that never replies.
+
+    Returns ``"signal"`` or ``"quiet"`` depending on how completion was
+    detected, or ``"timeout"`` if neither happened within ``timeout`` ms.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        handle = await page.wait_for_function(
+            "(quietMs) => window.__verification && window.__verification.settled(quietMs)",
+            arg=quiet_ms,
+            timeout=timeout,
+            polling=100,
+        )
+    except PlaywrightTimeoutError:
+        return "timeout"
+    return await handle.json_value()
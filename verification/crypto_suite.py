@@ -0,0 +1,433 @@
+"""Check 08-cryptography workers against Python's hashlib and measure throughput.
+
+Every case posts a message to the example's own ``worker.js`` from inside
+its page, the way its ``main.js`` would, and compares the answer with
+``hashlib``/``hmac``. Known-answer vectors (FIPS 180, RFC 4231, RFC 7914,
+Unicode text) check correctness; seeded inputs of ``--sizes`` MB, or KDF
+iteration counts, measure throughput. Large inputs are generated inside the
+page from a seed rather than sent from Python.
+
+Each throughput case also reports how fast Python (OpenSSL) computed the
+reference and, for digests, how fast native WebCrypto hashed the same bytes
+in the page, so slow pure-JS implementations stand out.
+
+791 derives its key with 100k PBKDF2 iterations on every message, which
+dwarfs encrypting a few KB, so the page times the same derivation natively
+and AES MB/s is computed from the worker's time minus that (``kdf_ms``).
+
+AES (791/792) uses a random IV, so its ciphertext is checked by decrypting it
+in Python when the ``cryptography`` package is installed, and by feeding it
+to the 792 decrypt worker otherwise. 791 base64-encodes its ciphertext by
+spreading every byte into one ``String.fromCharCode`` call, which overflows
+the call stack long before 1 MB, so its throughput is measured on
+``AES_MAX_BYTES`` and larger ``--sizes`` are reported as skipped.
+
+    python verification/crypto_suite.py --serve
+    python verification/crypto_suite.py --serve --filter 781 --sizes 1,16,64
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+from pathlib import Path
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from engine import VerificationEngine
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+TIMEOUT_MS = 300000
+CATEGORY = "08-cryptography"
+# The key derivation 791/792 hard-code for AES-GCM.
+AES_SALT = b"aes-salt"
+AES_ITERATIONS = 100000
+# Largest plaintext 791 can encrypt: it spreads the ciphertext into
+# String.fromCharCode(...), which exceeds the call stack somewhere past 100k
+# bytes, depending on the engine.
+AES_MAX_BYTES = 64 * 1024
+# Flag implementations this many times slower than native WebCrypto.
+SLOW_RATIO = 2.0
+
+RUN_CASE = """
+async ({ example, message, seed, native, kdf, timeoutMs }) => {
+  const generate = (size) => {
+    let block = '';
+    for (let i = 0; i < 4096; i++) block += String.fromCharCode(((i * 31 + seed * 17) % 95) + 32);
+    return block.repeat(Math.ceil(size / 4096)).slice(0, size);
+  };
+  const fill = (value) => {
+    if (!value || typeof value !== 'object') return value;
+    if ('$generate' in value) return generate(value.$generate);
+    return Object.fromEntries(Object.entries(value).map(([key, item]) => [key, fill(item)]));
+  };
+  const filled = fill(message);
+
+  const reply = await new Promise((resolve, reject) => {
+    const worker = new Worker(`/examples/${example}/worker.js`);
+    let started;
+    const timer = setTimeout(() => {
+      worker.terminate();
+      reject(new Error(`worker did not answer within ${timeoutMs} ms`));
+    }, timeoutMs);
+    const finish = (callback, value) => {
+      clearTimeout(timer);
+      worker.terminate();
+      callback(value);
+    };
+    worker.onmessage = (event) => {
+      const { type, payload } = event.data;
+      if (type === 'RESULT') finish(resolve, { payload, wall_ms: performance.now() - started });
+      else if (type === 'ERROR') finish(reject, new Error(payload.message));
+    };
+    worker.onerror = (event) => finish(reject, new Error(event.message));
+    started = performance.now();
+    worker.postMessage(filled);
+  });
+
+  if (native) {
+    const data = new TextEncoder().encode(filled.payload.text);
+    const started = performance.now();
+    await crypto.subtle.digest(native, data);
+    reply.native_ms = performance.now() - started;
+  }
+  if (kdf) {
+    // The median of a few native derivations, to subtract from the worker's time.
+    const encoder = new TextEncoder();
+    const times = [];
+    for (let i = 0; i < 3; i++) {
+      const started = performance.now();
+      const material = await crypto.subtle.importKey('raw', encoder.encode(kdf.password), 'PBKDF2', false, ['deriveKey']);
+      await crypto.subtle.deriveKey(
+        { name: 'PBKDF2', salt: encoder.encode(kdf.salt), iterations: kdf.iterations, hash: 'SHA-256' },
+        material, { name: 'AES-GCM', length: kdf.keySize }, false, ['encrypt']);
+      times.push(performance.now() - started);
+    }
+    reply.kdf_ms = times.sort((a, b) => a - b)[1];
+  }
+  return reply;
+}
+"""
+
+
+def generated_text(size, seed=0):
+    """The same seeded printable-ASCII text ``RUN_CASE`` generates in the page."""
+    block = "".join(chr((i * 31 + seed * 17) % 95 + 32) for i in range(4096))
+    return (block * -(-size // 4096))[:size]
+
+
+def _text(value, seed):
+    return generated_text(value["$generate"], seed) if isinstance(value, dict) else value
+
+
+def _timed(function):
+    started = time.perf_counter()
+    value = function()
+    return value, (time.perf_counter() - started) * 1000
+
+
+def _expect(field, compute):
+    """A check that ``payload[field]`` equals ``compute(seed)``, timing the reference."""
+    def check(payload, seed):
+        expected, reference_ms = _timed(lambda: compute(seed))
+        actual = payload.get(field)
+        mismatch = None if actual == expected else f"{field} {str(actual)[:24]}... != {expected[:24]}..."
+        return mismatch, reference_ms
+    return check
+
+
+def _case(example, name, message, check, size=None, iterations=None, native=None, kdf=None):
+    return {"example": f"{CATEGORY}/{example}", "name": name, "message": message, "check": check,
+            "bytes": size, "iterations": iterations, "native": native, "kdf": kdf}
+
+
+# Known-answer inputs for the digests: empty, FIPS 180 "abc" and 448-bit
+# messages, a pangram, multi-byte UTF-8 and a million repeated "a".
+HASH_VECTORS = [
+    ("empty", ""),
+    ("abc", "abc"),
+    ("448-bit", "abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq"),
+    ("pangram", "The quick brown fox jumps over the lazy dog"),
+    ("utf-8", "密碼學 🔐 ünïcödé"),
+    ("million-a", "a" * 1000000),
+]
+HASHES = [
+    ("781-md5-hash", "md5", None),
+    ("782-sha1-hash", "sha1", "SHA-1"),
+    ("783-sha256-hash", "sha256", "SHA-256"),
+    ("784-sha384-hash", "sha384", "SHA-384"),
+    ("785-sha512-hash", "sha512", "SHA-512"),
+]
+# WebCrypto rejects zero-length HMAC keys, so only the message is ever empty.
+HMAC_VECTORS = [
+    ("empty-message", "key", ""),
+    ("rfc4231-2", "Jefe", "what do ya want for nothing?"),
+    ("pangram", "key", "The quick brown fox jumps over the lazy dog"),
+]
+# (password, salt, iterations, key bytes); the first two are from RFC 7914 section 11.
+PBKDF2_VECTORS = [("passwd", "salt", 1, 64), ("Password", "NaCl", 80000, 64), ("密碼", "鹽", 1000, 32)]
+# (password, salt, N, r, p, key bytes) from RFC 7914 section 12.
+SCRYPT_VECTORS = [("", "", 16, 1, 1, 64), ("password", "NaCl", 1024, 8, 16, 64)]
+
+
+def hash_cases(sizes):
+    cases = []
+    for example, algorithm, native in HASHES:
+        def digest(text, seed, algorithm=algorithm):
+            return hashlib.new(algorithm, _text(text, seed).encode()).hexdigest()
+
+        for name, text in HASH_VECTORS:
+            cases.append(_case(example, name, {"type": "HASH", "payload": {"text": text}},
+                               _expect("hash", lambda seed, text=text, digest=digest: digest(text, seed))))
+        for size in sizes:
+            text = {"$generate": size}
+            cases.append(_case(example, f"{size // 1024 // 1024} MB", {"type": "HASH", "payload": {"text": text}},
+                               _expect("hash", lambda seed, text=text, digest=digest: digest(text, seed)),
+                               size=size, native=native))
+    return cases
+
+
+def hmac_cases(sizes):
+    cases = []
+    for algorithm in ("SHA-256", "SHA-384", "SHA-512"):
+        digestmod = algorithm.replace("-", "").lower()
+
+        def mac(key, message, seed, digestmod=digestmod):
+            return hmac.new(key.encode(), _text(message, seed).encode(), digestmod).hexdigest()
+
+        for name, key, message in HMAC_VECTORS:
+            cases.append(_case("786-hmac", f"{algorithm} {name}",
+                               {"type": "HMAC", "payload": {"message": message, "key": key, "algorithm": algorithm}},
+                               _expect("hmac", lambda seed, key=key, message=message, mac=mac: mac(key, message, seed))))
+        for size in sizes:
+            message = {"$generate": size}
+            cases.append(_case("786-hmac", f"{algorithm} {size // 1024 // 1024} MB",
+                               {"type": "HMAC", "payload": {"message": message, "key": "key", "algorithm": algorithm}},
+                               _expect("hmac", lambda seed, message=message, mac=mac: mac("key", message, seed)),
+                               size=size))
+    return cases
+
+
+def pbkdf2_cases(iteration_counts):
+    cases = []
+    vectors = [(f"{password!r}/{salt!r}/{iterations}", password, salt, iterations, length, None)
+               for password, salt, iterations, length in PBKDF2_VECTORS]
+    vectors += [(f"{iterations} iterations", "mySecurePassword123", "randomSaltValue", iterations, 32, iterations)
+                for iterations in iteration_counts]
+    for algorithm in ("SHA-256", "SHA-512"):
+        digestmod = algorithm.replace("-", "").lower()
+        for name, password, salt, iterations, length, timed in vectors:
+            message = {"type": "DERIVE", "payload": {"password": password, "salt": salt, "iterations": iterations,
+                                                     "keyLength": length * 8, "algorithm": algorithm}}
+            cases.append(_case("787-pbkdf2", f"{algorithm} {name}", message, _expect(
+                "key", lambda seed, password=password, salt=salt, iterations=iterations, length=length,
+                digestmod=digestmod: hashlib.pbkdf2_hmac(digestmod, password.encode(), salt.encode(),
+                                                         iterations, length).hex(),
+            ), iterations=timed))
+    return cases
+
+
+def scrypt_cases(costs):
+    vectors = [(f"{password!r}/{salt!r} N={n} r={r} p={p}", password, salt, n, r, p, length, None)
+               for password, salt, n, r, p, length in SCRYPT_VECTORS]
+    vectors += [(f"N={n} r=8 p=1", "mySecurePassword", "randomSalt123", n, 8, 1, 64, n) for n in costs]
+    cases = []
+    for name, password, salt, n, r, p, length, timed in vectors:
+        message = {"type": "DERIVE", "payload": {"password": password, "salt": salt, "N": n, "r": r, "p": p,
+                                                 "dkLen": length}}
+        cases.append(_case("788-scrypt", name, message, _expect(
+            "key", lambda seed, password=password, salt=salt, n=n, r=r, p=p, length=length: hashlib.scrypt(
+                password.encode(), salt=salt.encode(), n=n, r=r, p=p, dklen=length, maxmem=1024 ** 3,
+            ).hex(),
+        ), iterations=timed))
+    return cases
+
+
+def aes_key(password, key_size):
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), AES_SALT, AES_ITERATIONS, key_size // 8)
+
+
+def _decrypt_check(plaintext, password, key_size):
+    """Check a 791 ciphertext by decrypting it in Python."""
+    def check(payload, seed):
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        key = aes_key(password, key_size)
+
+        def decrypt():
+            return AESGCM(key).decrypt(bytes.fromhex(payload["iv"]), base64.b64decode(payload["ciphertext"]), None)
+
+        try:
+            recovered, reference_ms = _timed(decrypt)
+        except Exception as e:
+            return f"ciphertext does not decrypt: {e!r}", None
+        expected = _text(plaintext, seed).encode()
+        return (None if recovered == expected else "decrypted plaintext differs"), reference_ms
+    return check
+
+
+def aes_cases(sizes):
+    try:
+        import cryptography  # noqa: F401
+        have_cryptography = True
+    except ImportError:
+        have_cryptography = False
+
+    inputs = [("short", "Attack at dawn"), ("utf-8", "密碼學 🔐 ünïcödé")]
+    inputs += [(f"{AES_MAX_BYTES // 1024} KB", {"$generate": AES_MAX_BYTES})]
+    cases = []
+    for key_size in (128, 256):
+        for size in sizes:
+            if size > AES_MAX_BYTES:
+                case = _case("791-aes-encrypt", f"AES-{key_size} {size // 1024 // 1024} MB", None, None, size=size)
+                case["skip"] = f"791 overflows the call stack base64-encoding over {AES_MAX_BYTES // 1024} KB"
+                cases.append(case)
+        for name, plaintext in inputs:
+            size = plaintext["$generate"] if isinstance(plaintext, dict) else None
+            message = {"type": "ENCRYPT", "payload": {"plaintext": plaintext, "password": "pw", "keySize": key_size}}
+            if have_cryptography:
+                check = _decrypt_check(plaintext, "pw", key_size)
+            else:
+                check = {"round_trip": plaintext, "password": "pw", "keySize": key_size}
+            kdf = {"password": "pw", "salt": AES_SALT.decode(), "iterations": AES_ITERATIONS, "keySize": key_size}
+            cases.append(_case("791-aes-encrypt", f"AES-{key_size} {name}", message, check, size=size,
+                               kdf=kdf if size else None))
+    return cases
+
+
+def build_cases(sizes, pbkdf2_iterations, scrypt_costs):
+    return (hash_cases(sizes) + hmac_cases(sizes) + pbkdf2_cases(pbkdf2_iterations)
+            + scrypt_cases(scrypt_costs) + aes_cases(sizes))
+
+
+async def run_in_page(page, case, message, seed, native=None, kdf=None):
+    return await page.evaluate(RUN_CASE, {"example": case["example"], "message": message, "seed": seed,
+                                          "native": native, "kdf": kdf, "timeoutMs": TIMEOUT_MS})
+
+
+async def round_trip(page, case, reply, seed):
+    """Check a 791 ciphertext by decrypting it with the 792 worker."""
+    spec = case["check"]
+    decrypt = {"type": "DECRYPT", "payload": {"ciphertext": reply["payload"]["ciphertext"],
+                                              "iv": reply["payload"]["iv"],
+                                              "password": spec["password"], "keySize": spec["keySize"]}}
+    back = await run_in_page(page, dict(case, example=f"{CATEGORY}/792-aes-decrypt"), decrypt, seed)
+    expected = _text(spec["round_trip"], seed)
+    return None if back["payload"]["plaintext"] == expected else "792 decrypted a different plaintext"
+
+
+async def check_case(page, case, options):
+    result = {"example": case["example"], "case": case["name"]}
+    if case.get("skip"):
+        result.update(status="skipped", reason=case["skip"])
+        return result
+    try:
+        reply = await run_in_page(page, case, case["message"], options.seed, case["native"], case["kdf"])
+        if isinstance(case["check"], dict):
+            mismatch, reference_ms = await round_trip(page, case, reply, options.seed), None
+        else:
+            mismatch, reference_ms = case["check"](reply["payload"], options.seed)
+        duration_ms = reply["payload"].get("duration") or reply["wall_ms"]
+        result.update(status="failed" if mismatch else "passed", wall_ms=round(reply["wall_ms"], 2),
+                      worker_ms=round(duration_ms, 2))
+        if mismatch:
+            result["mismatch"] = mismatch
+        if "kdf_ms" in reply:
+            # Only the time left after key derivation is spent on the data.
+            result["kdf_ms"] = round(reply["kdf_ms"], 2)
+            duration_ms -= reply["kdf_ms"]
+            if duration_ms <= 0:
+                result["note"] = "encryption time is within the noise of the key derivation"
+        if case["bytes"] and duration_ms > 0:
+            megabytes = case["bytes"] / 1024 / 1024
+            result["mb_per_s"] = round(megabytes / (duration_ms / 1000), 2)
+            if reference_ms:
+                result["reference_mb_per_s"] = round(megabytes / (reference_ms / 1000), 2)
+            if reply.get("native_ms"):
+                result["native_mb_per_s"] = round(megabytes / (reply["native_ms"] / 1000), 2)
+        if case["iterations"]:
+            result["iterations_per_s"] = round(case["iterations"] / (duration_ms / 1000))
+            if reference_ms:
+                result["reference_iterations_per_s"] = round(case["iterations"] / (reference_ms / 1000))
+    except Exception as e:
+        result.update(status="failed", mismatch=str(e))
+    return result
+
+
+async def run_all(cases, options):
+    async def job(page, case):
+        await page.goto(f"{options.base_url}/examples/{case['example']}/index.html")
+        return await check_case(page, case, options)
+
+    # One case at a time: throughput cases are CPU-bound and would slow each other down.
+    results = []
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for result in engine.imap(job, cases):
+            results.append(result)
+            print_result(result)
+    return sorted(results, key=lambda result: (result["example"], result["case"]))
+
+
+def print_result(result):
+    line = f"{result['status'].upper()} {result['example']} [{result['case']}]"
+    if "mb_per_s" in result:
+        line += f" {result['mb_per_s']} MB/s"
+        if "native_mb_per_s" in result:
+            ratio = result["native_mb_per_s"] / result["mb_per_s"]
+            line += f" (WebCrypto {result['native_mb_per_s']} MB/s"
+            line += f", {ratio:.1f}x faster)" if ratio >= SLOW_RATIO else ")"
+    if "kdf_ms" in result:
+        line += f" (after {result['kdf_ms']} ms key derivation)"
+    if "iterations_per_s" in result:
+        line += f" {result['iterations_per_s']} iterations/s"
+    print(line)
+    detail = result.get("mismatch") or result.get("reason") or result.get("note")
+    if detail:
+        print(f"  {detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check 08-cryptography workers against hashlib and measure throughput.")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run examples whose id contains this text (repeatable)")
+    parser.add_argument("--sizes", default="1,8,32", help="comma-separated input sizes in MB (default: 1,8,32)")
+    parser.add_argument("--pbkdf2-iterations", default="10000,100000,600000",
+                        help="comma-separated PBKDF2 iteration counts (default: 10000,100000,600000)")
+    parser.add_argument("--scrypt-n", default="1024,4096,16384",
+                        help="comma-separated scrypt N costs with r=8, p=1 (default: 1024,4096,16384)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated inputs")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    sizes = [int(size) * 1024 * 1024 for size in args.sizes.split(",")]
+    cases = build_cases(sizes, [int(n) for n in args.pbkdf2_iterations.split(",")],
+                        [int(n) for n in args.scrypt_n.split(",")])
+    cases = [case for case in cases if not args.filter or any(text in case["example"] for text in args.filter)]
+    if not cases:
+        print("No cryptography cases selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Running {len(cases)} cryptography cases...")
+    results = asyncio.run(run_all(cases, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "crypto.json"
+    report_path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] == "failed")
+    skipped = sum(1 for result in results if result["status"] == "skipped")
+    print("-" * 20)
+    print(f"{len(results) - failed - skipped} passed, {failed} failed, {skipped} skipped; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,241 @@
+"""Measure 07-data-processing parser throughput on large generated datasets.
+
+Each parser is fed a seeded dataset from ``fixtures.py`` (CSV, JSON, XML or
+MessagePack, typically hundreds of MB) instead of its built-in sample. The
+page fetches the file from the example server and builds the same message
+its ``main.js`` would. The harness then resets the renderer's peak-RSS
+counter and times the example's own ``worker.js`` from ``postMessage`` to
+its ``RESULT``. The report gives MB/s, the worker's self-reported parse
+time, the renderer's peak memory growth (Linux) and how many records the
+parser saw compared with how many were written; a parser that saw fewer
+fails and gets no MB/s.
+
+    python verification/data_throughput.py --size-mb 256
+    python verification/data_throughput.py --filter 702 --size-mb 512 --repeat 3
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from engine import VerificationEngine
+from fixtures import FIXTURES_DIR, dataset
+from process_memory import chromium_processes, peak_rss_bytes, reset_peak, rss_bytes
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+TIMEOUT_MS = 600000
+
+# How to turn a fetched dataset into each worker's PARSE message, and how
+# many records the worker reports having parsed.
+PARSERS = {
+    "07-data-processing/701-json-parser": {
+        "format": "json",
+        "read": "text",
+        "message": "(text) => ({ type: 'PARSE', payload: { jsonString: text } })",
+        "records": "(result) => Array.isArray(result.parsed) ? result.parsed.length : null",
+    },
+    "07-data-processing/702-csv-parser": {
+        "format": "csv",
+        "read": "text",
+        "message": "(text) => ({ type: 'PARSE', payload: { csvString: text, delimiter: ',', hasHeader: true } })",
+        "records": "(result) => result.rowCount",
+    },
+    "07-data-processing/703-xml-parser": {
+        "format": "xml",
+        "read": "text",
+        # Every record is one element with five child elements, plus the root.
+        "message": "(text) => ({ type: 'PARSE', payload: { xmlString: text } })",
+        "records": "(result) => (result.stats.elements - 1) / 6",
+    },
+    "07-data-processing/707-msgpack-parser": {
+        "format": "msgpack",
+        "read": "arrayBuffer",
+        "message": "(buffer) => ({ type: 'PARSE', payload: { bytes: buffer } })",
+        "transfer": True,
+        "records": "(result) => result.stats.objects",
+    },
+    "07-data-processing/709-parquet-reader": {
+        "format": "json",
+        "read": "text",
+        # main.js parses the JSON on the main thread and posts the rows.
+        "message": "(text) => ({ type: 'PARSE', payload: { data: JSON.parse(text) } })",
+        "records": "(result) => result.stats.rows",
+    },
+}
+
+PREPARE = """
+async ({ url, read, message }) => {
+  const started = performance.now();
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+  const input = read === 'arrayBuffer' ? await response.arrayBuffer() : await response.text();
+  const loaded = performance.now();
+  window.__dataset = { message: (0, eval)(message)(input), transfer: read === 'arrayBuffer' ? [input] : [] };
+  return { fetch_ms: loaded - started, prepare_ms: performance.now() - loaded };
+}
+"""
+
+PARSE = """
+async ({ records, timeoutMs }) => new Promise((resolve, reject) => {
+  const { message, transfer } = window.__dataset;
+  window.__dataset = null;
+  const worker = new Worker('worker.js');
+  const timer = setTimeout(() => {
+    worker.terminate();
+    reject(new Error(`worker did not answer within ${timeoutMs} ms`));
+  }, timeoutMs);
+  let started;
+  worker.onmessage = (event) => {
+    const { type, payload } = event.data;
+    if (type !== 'RESULT' && type !== 'ERROR') return;
+    const parse_ms = performance.now() - started;
+    clearTimeout(timer);
+    worker.terminate();
+    if (type === 'ERROR') {
+      reject(new Error(payload.message));
+      return;
+    }
+    let parsed = null;
+    try {
+      parsed = (0, eval)(records)(payload);
+    } catch (e) {}
+    resolve({ parse_ms, worker_ms: payload.duration ?? null, records: parsed });
+  };
+  worker.onerror = (event) => {
+    clearTimeout(timer);
+    reject(new Error(event.message));
+  };
+  started = performance.now();
+  worker.postMessage(message, transfer);
+})
+"""
+
+
+def fixture_url(base_url, path):
+    return f"{base_url}/{path.relative_to(REPO_ROOT).as_posix()}"
+
+
+async def measure(page, example_id, spec, path, expected, base_url):
+    await page.goto(f"{base_url}/examples/{example_id}/index.html")
+    timings = await page.evaluate(
+        PREPARE, {"url": fixture_url(base_url, path), "read": spec["read"], "message": spec["message"]}
+    )
+    renderers = chromium_processes("renderer")
+    baseline = rss_bytes(renderers)
+    reset_peak(renderers)
+    result = await page.evaluate(PARSE, {"records": spec.get("records", "() => null"), "timeoutMs": TIMEOUT_MS})
+    peaks = peak_rss_bytes(renderers)
+    growth = [peaks[pid] - baseline[pid] for pid in peaks if pid in baseline]
+    size = path.stat().st_size
+    return {
+        **timings,
+        **result,
+        "mb_per_s": size / 1024 / 1024 / (result["parse_ms"] / 1000) if result["parse_ms"] else None,
+        "peak_rss_growth": max(growth) if growth else None,
+        "records_expected": expected,
+    }
+
+
+async def run_all(jobs, base_url, repeat):
+    async def job(page, item):
+        example_id, spec, path, expected = item
+        runs, error = [], None
+        for _ in range(repeat):
+            try:
+                runs.append(await measure(page, example_id, spec, path, expected, base_url))
+            except Exception as e:
+                error = str(e)
+                break
+        return example_id, path, runs, error
+
+    results = {}
+    # One parser at a time: they are memory-bound and would skew each other's peaks.
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for example_id, path, runs, error in engine.imap(job, jobs):
+            results[example_id] = summarize(path, runs, error)
+            print_result(example_id, results[example_id])
+    return results
+
+
+def summarize(path, runs, error):
+    """Fold the runs of one parser into its report entry.
+
+    A parser that saw fewer records than were written did not do the work
+    being timed, so it fails and gets no MB/s figure.
+    """
+    summary = {"dataset": path.name, "bytes": path.stat().st_size, "runs": runs, "error": error,
+               "status": "failed" if error or not runs else "passed"}
+    if runs:
+        growth = [run["peak_rss_growth"] for run in runs if run["peak_rss_growth"] is not None]
+        summary["peak_rss_growth"] = max(growth) if growth else None
+        summary["complete"] = all(run["records"] == run["records_expected"] for run in runs)
+        if summary["complete"]:
+            summary["mb_per_s"] = statistics.median(run["mb_per_s"] for run in runs)
+        else:
+            summary["status"] = "failed"
+    return summary
+
+
+def print_result(example_id, summary):
+    if summary["error"]:
+        print(f"FAILED {example_id} ({summary['dataset']}): {summary['error']}")
+        return
+    last = summary["runs"][-1]
+    if not summary["complete"]:
+        print(f"FAILED {example_id} ({summary['dataset']}): "
+              f"parsed {last['records']} of {last['records_expected']} records")
+        return
+    memory = (f", peak RSS +{summary['peak_rss_growth'] / 1024 / 1024:.0f} MiB"
+              if summary["peak_rss_growth"] is not None else "")
+    print(f"{example_id}: {summary['mb_per_s']:.1f} MB/s on {summary['bytes'] / 1024 / 1024:.0f} MiB{memory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure data-processing parser throughput on large datasets.")
+    parser.add_argument("--size-mb", type=int, default=256, help="dataset size (default: 256)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run parsers whose id contains this text (repeatable)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    selected = {
+        example_id: spec for example_id, spec in PARSERS.items()
+        if not args.filter or any(text in example_id for text in args.filter)
+    }
+    if not selected:
+        print("No parsers selected.")
+        return 0
+
+    jobs = []
+    for example_id, spec in selected.items():
+        path, expected = dataset(spec["format"], args.size_mb, args.seed)
+        jobs.append((example_id, spec, path, expected))
+    print(f"Datasets ready in {FIXTURES_DIR}; measuring {len(jobs)} parsers x {args.repeat} runs...")
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    results = asyncio.run(run_all(jobs, args.base_url, args.repeat))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "data-throughput.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "size_mb": args.size_mb, "results": results}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = sum(1 for summary in results.values() if summary["status"] == "failed")
+    print("-" * 20)
+    print(f"{len(results) - failed} parsers measured, {failed} failed; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
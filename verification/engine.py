@@ -0,0 +1,90 @@
+"""Asyncio verification engine built on one long-lived Chromium.
+
+The engine owns a single browser and a pool of ``BrowserContext`` objects.
+Every job borrows a context, opens a fresh page in it and hands the context
+back when it is done, so dozens of examples can load at once while the
+browser start-up cost is paid only once.
+
+    async with VerificationEngine(concurrency=16) as engine:
+        async for result in engine.imap(check, examples):
+            ...
+"""
+import asyncio
+
+
+class VerificationEngine:
+    def __init__(self, concurrency=16, headless=True, max_context_uses=50,
+                 context_options=None, init_scripts=(), launch_args=()):
+        self.concurrency = concurrency
+        self.headless = headless
+        self.max_context_uses = max_context_uses
+        self.context_options = context_options or {}
+        self.init_scripts = list(init_scripts)
+        self.launch_args = list(launch_args)
+        self._playwright = None
+        self.browser = None
+        self._pool = None
+        self._uses = {}
+
+    async def __aenter__(self):
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+        self._pool = asyncio.Queue()
+        for _ in range(self.concurrency):
+            await self._pool.put(await self._new_context())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        while not self._pool.empty():
+            await self._pool.get_nowait().close()
+        await self.browser.close()
+        await self._playwright.stop()
+
+    async def _new_context(self):
+        context = await self.browser.new_context(**self.context_options)
+        for script in self.init_scripts:
+            await context.add_init_script(script)
+        self._uses[context] = 0
+        return context
+
+    async def _release(self, context, healthy):
+        """Return a context to the pool, recycling it when worn out or broken."""
+        self._uses[context] += 1
+        if not healthy or self._uses[context] >= self.max_context_uses:
+            del self._uses[context]
+            await context.close()
+            context = await self._new_context()
+        else:
+            await context.clear_cookies()
+        await self._pool.put(context)
+
+    async def run(self, job, item):
+        """Run ``job(page, item)`` on a fresh page from a pooled context.
+
+        The pool size is the concurrency limit: callers wait here until a
+        context is free.
+        """
+        context = await self._pool.get()
+        healthy = False
+        try:
+            page = await context.new_page()
+            try:
+                result = await job(page, item)
+            finally:
+                await page.close()
+            healthy = True
+            return result
+        finally:
+            await self._release(context, healthy)
+
+    async def imap(self, job, items):
+        """Yield ``job`` results as soon as each item finishes."""
+        tasks = [asyncio.ensure_future(self.run(job, item)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
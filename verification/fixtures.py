@@ -0,0 +1,281 @@
+"""Deterministic input files for driving examples.
+
+Fixtures are generated from a seed on first use and kept in
+``verification/.cache/fixtures/``, so repeated runs upload byte-identical
+files without storing them in the repository.
+
+Datasets for the 07-data-processing parsers are streamed to disk a chunk of
+records at a time, so a multi-hundred-MB file takes no more memory than a
+small one:
+
+    python verification/fixtures.py --format csv --size-mb 512
+    python verification/fixtures.py --format msgpack --size-mb 256 --seed 1
+
+Text corpora for the 04-text-processing examples mix Latin and CJK lines the
+same way:
+
+    python verification/fixtures.py --format text --size-mb 16
+"""
+import argparse
+import json
+import random
+import struct
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / ".cache" / "fixtures"
+FORMATS = ("csv", "json", "xml", "msgpack")
+CHUNK_RECORDS = 10000
+
+_FIRST_NAMES = ["Alice", "Bob", "Carol", "David", "Eve", "Frank", "Grace", "Heidi", "Ivan", "Judy", "王小明", "佐藤"]
+_DEPARTMENTS = ["Engineering", "Sales", "Marketing", "Support", "Finance", "Research"]
+FIELDS = ["id", "name", "email", "age", "department", "score", "active"]
+TEXT_FORMAT = "text"
+
+# Corpus vocabularies, most frequent first. The CJK words include the
+# dictionary of 448-chinese-word-segmentation so its segmenter finds matches.
+_LATIN_WORDS = [
+    "the", "of", "and", "to", "a", "in", "is", "data", "worker", "text", "message", "thread", "for", "with",
+    "search", "web", "main", "error", "code", "runs", "without", "blocking", "page", "quick", "fox", "index",
+    "result", "value", "string", "word", "line", "secret", "bad", "fail", "buffer", "parallel", "browser",
+    "JavaScript", "Unicode", "R&D", "a<b", "2024", "v8",
+]
+_CJK_WORDS = [
+    "的", "是", "在", "了", "我們", "中文", "處理", "數據", "分析", "今天", "天氣", "真好", "一起", "去", "公園",
+    "散步", "吧", "中國", "分詞", "算法", "測試", "效果", "如何", "這個", "是一個", "簡單", "例子", "最大", "匹配",
+    "正向", "逆向", "開發", "工程師", "代碼", "編寫", "非常", "有趣", "學習", "進步", "你好", "世界", "電腦", "科學",
+    "技術", "人工智能", "文本", "搜索", "線程", "瀏覽器", "字", "詞", "和", "有",
+]
+_LATIN_PUNCTUATION = [",", ",", ";", ":"]
+_CJK_PUNCTUATION = ["，", "，", "、", "：", "；"]
+_CJK_ENDINGS = ["。", "。", "！", "？"]
+
+
+def test_image(width, height, seed=0):
+    """Return the path of a seeded ``width`` x ``height`` PNG test image.
+
+    The image mixes smooth gradients, hard edges and noise so filters have
+    both flat regions and detail to work on.
+    """
+    path = FIXTURES_DIR / f"image-{width}x{height}-{seed}.png"
+    if path.exists():
+        return path
+
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = np.empty((height, width, 3), dtype=np.float64)
+    pixels[..., 0] = 255 * x / max(width - 1, 1)
+    pixels[..., 1] = 255 * y / max(height - 1, 1)
+    pixels[..., 2] = 127.5 + 127.5 * np.sin((x + y) / max(width, height) * 12 * np.pi)
+    # A checkerboard of hard edges over the gradient.
+    tile = max(8, min(width, height) // 16)
+    checker = ((x // tile + y // tile) % 2).astype(bool)
+    pixels[checker] = 255 - pixels[checker]
+    pixels += rng.normal(0, 12, pixels.shape)
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp.png")
+    Image.fromarray(pixels.clip(0, 255).astype(np.uint8)).save(tmp_path)
+    tmp_path.replace(path)
+    return path
+
+
+def records(seed=0):
+    """Yield an endless stream of seeded flat records."""
+    rng = random.Random(seed)
+    record_id = 0
+    while True:
+        record_id += 1
+        name = f"{rng.choice(_FIRST_NAMES)} {record_id}"
+        yield {
+            "id": record_id,
+            "name": name,
+            "email": f"user{record_id}@example.com",
+            "age": rng.randint(18, 80),
+            "department": rng.choice(_DEPARTMENTS),
+            "score": round(rng.uniform(0, 100), 2),
+            "active": rng.random() > 0.3,
+        }
+
+
+def _csv_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _xml_escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def _msgpack(value):
+    """Encode the scalar types used by ``records`` as MessagePack."""
+    if isinstance(value, bool):
+        return b"\xc3" if value else b"\xc2"
+    if isinstance(value, int):
+        return bytes([value]) if 0 <= value < 0x80 else b"\xce" + struct.pack(">I", value)
+    if isinstance(value, float):
+        return b"\xcb" + struct.pack(">d", value)
+    data = value.encode("utf-8")
+    if len(data) < 32:
+        return bytes([0xA0 | len(data)]) + data
+    return b"\xd9" + bytes([len(data)]) + data
+
+
+def _encode_chunk(fmt, chunk, first):
+    if fmt == "csv":
+        return "".join(",".join(_csv_value(record[field]) for field in FIELDS) + "\n" for record in chunk).encode()
+    if fmt == "json":
+        body = ",\n".join(json.dumps(record, ensure_ascii=False, separators=(",", ":")) for record in chunk)
+        return ((" " if first else ",\n") + body).encode()
+    if fmt == "xml":
+        return "".join(
+            f'  <record id="{record["id"]}" active="{_csv_value(record["active"])}">'
+            f'<name>{_xml_escape(record["name"])}</name><email>{record["email"]}</email>'
+            f'<age>{record["age"]}</age><department>{record["department"]}</department>'
+            f'<score>{record["score"]}</score></record>\n'
+            for record in chunk
+        ).encode()
+    map_header = bytes([0x80 | len(FIELDS)])
+    keys = [(field, _msgpack(field)) for field in FIELDS]
+    return b"".join(
+        map_header + b"".join(key + _msgpack(record[field]) for field, key in keys)
+        for record in chunk
+    )
+
+
+_HEADERS = {
+    "csv": (",".join(FIELDS) + "\n").encode(),
+    "json": b"[\n",
+    "xml": b'<?xml version="1.0" encoding="UTF-8"?>\n<records>\n',
+    # An array32 header; the record count is patched in once it is known.
+    "msgpack": b"\xdd\x00\x00\x00\x00",
+}
+_FOOTERS = {"csv": b"", "json": b"\n]\n", "xml": b"</records>\n", "msgpack": b""}
+
+
+def dataset(fmt, size_mb, seed=0):
+    """Return ``(path, record_count)`` for a seeded dataset of about ``size_mb`` MB.
+
+    The file is written in chunks of ``CHUNK_RECORDS`` records and stops at
+    the first chunk that reaches the target size; the record count is kept
+    in a ``.meta.json`` file next to it.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown dataset format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    path = FIXTURES_DIR / f"dataset-{size_mb}mb-{seed}.{fmt}"
+    meta_path = path.with_name(path.name + ".meta.json")
+    if path.exists() and meta_path.exists():
+        return path, json.loads(meta_path.read_text())["records"]
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    target = size_mb * 1024 * 1024
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    stream = records(seed)
+    with open(tmp_path, "wb") as f:
+        written = f.write(_HEADERS[fmt])
+        while written < target:
+            chunk = [next(stream) for _ in range(CHUNK_RECORDS)]
+            written += f.write(_encode_chunk(fmt, chunk, first=count == 0))
+            count += len(chunk)
+        f.write(_FOOTERS[fmt])
+        if fmt == "msgpack":
+            f.seek(1)
+            f.write(struct.pack(">I", count))
+    tmp_path.replace(path)
+    meta_path.write_text(json.dumps({"records": count, "bytes": path.stat().st_size}))
+    return path, count
+
+
+def _zipf(words):
+    return [1 / rank for rank in range(1, len(words) + 1)]
+
+
+def text_lines(seed=0):
+    """Yield an endless stream of seeded lines of Latin, CJK and mixed text.
+
+    About one line in ten repeats a recent line, sometimes in another case or
+    with surrounding whitespace, so there is something to deduplicate. Only
+    ASCII whitespace and characters from the Basic Multilingual Plane are
+    used, so JavaScript string indices and Python ones agree.
+    """
+    rng = random.Random(seed)
+    latin_weights = _zipf(_LATIN_WORDS)
+    cjk_weights = _zipf(_CJK_WORDS)
+    recent = []
+    while True:
+        kind = rng.random()
+        if recent and kind < 0.1:
+            line = rng.choice(recent)
+            variant = rng.random()
+            if variant < 0.3:
+                line = line.upper()
+            elif variant < 0.6:
+                line = f"  {line}\t"
+        elif kind < 0.55:
+            words = rng.choices(_LATIN_WORDS, latin_weights, k=rng.randint(5, 18))
+            words[0] = words[0].capitalize()
+            for i in rng.sample(range(len(words) - 1), k=min(2, len(words) - 1)):
+                if rng.random() < 0.3:
+                    words[i] += rng.choice(_LATIN_PUNCTUATION)
+            line = " ".join(words) + rng.choice([".", ".", "!", "?"])
+        elif kind < 0.85:
+            words = rng.choices(_CJK_WORDS, cjk_weights, k=rng.randint(4, 16))
+            for i in rng.sample(range(len(words) - 1), k=min(2, len(words) - 1)):
+                if rng.random() < 0.4:
+                    words[i] += rng.choice(_CJK_PUNCTUATION)
+            line = "".join(words) + rng.choice(_CJK_ENDINGS)
+        else:
+            words = rng.choices(_CJK_WORDS, cjk_weights, k=rng.randint(3, 10))
+            words.insert(rng.randint(0, len(words)), rng.choice(["Web Worker", "JavaScript", "Unicode", "UTF-8"]))
+            line = "".join(words) + rng.choice(_CJK_ENDINGS)
+        recent.append(line)
+        if len(recent) > 1000:
+            recent.pop(0)
+        yield line
+
+
+def text_corpus(size_mb, seed=0):
+    """Return the path of a seeded UTF-8 text corpus of about ``size_mb`` MB.
+
+    Lines come from ``text_lines`` and are written ``CHUNK_RECORDS`` at a time
+    until the file reaches the target size.
+    """
+    path = FIXTURES_DIR / f"corpus-{size_mb}mb-{seed}.txt"
+    if path.exists():
+        return path
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    target = size_mb * 1024 * 1024
+    tmp_path = path.with_name(path.name + ".tmp")
+    stream = text_lines(seed)
+    with open(tmp_path, "wb") as f:
+        written = 0
+        while written < target:
+            written += f.write("".join(next(stream) + "\n" for _ in range(CHUNK_RECORDS)).encode("utf-8"))
+    tmp_path.replace(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded datasets for the data-processing examples.")
+    parser.add_argument("--format", choices=FORMATS + (TEXT_FORMAT,), action="append",
+                        help=f"format to generate (repeatable; default: all but {TEXT_FORMAT})")
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for fmt in args.format or FORMATS:
+        if fmt == TEXT_FORMAT:
+            path = text_corpus(args.size_mb, args.seed)
+            print(f"{path}: {path.stat().st_size / 1024 / 1024:.1f} MiB of text")
+            continue
+        path, count = dataset(fmt, args.size_mb, args.seed)
+        print(f"{path}: {count} records, {path.stat().st_size / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Measure frame times and jank while simulations run.
+
+Each selected example is started (its manifest steps, or a click on
+``--start``, ``#startBtn`` by default) and left running for ``--duration``
+seconds while ``init_scripts/frames.js`` records every
+``requestAnimationFrame`` the main thread got to run, long tasks, and the
+messages and reported step times of each worker. The report gives FPS,
+p50/p95/p99 frame time, frames over the frame budget and the workers' step
+times, so a simulation whose worker keeps the main thread smooth can be told
+from one that does not.
+
+    python verification/frames.py --serve
+    python verification/frames.py --serve --filter 831 --filter 930 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+from benchmarks import percentile
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT, INIT_SCRIPTS_DIR
+from engine import VerificationEngine
+from manifest import EXAMPLES_DIR, load_manifest, parse_range
+from serve import serve_base_url
+from steps import perform_steps
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+FRAMES_SCRIPT = (INIT_SCRIPTS_DIR / "frames.js").read_text()
+CATEGORIES = ["09-games-animation", "11-scientific-computing"]
+DEFAULT_BUDGET_MS = 1000 / 60
+# A frame counts as over budget once it took this many budgets, i.e. at
+# least one vsync was missed; smaller overruns are timer jitter.
+OVER_BUDGET_FACTOR = 1.5
+# A run is smooth when at most this fraction of its frames were over budget.
+SMOOTH_FRACTION = 0.05
+# Long tasks block input for whatever they take beyond this.
+LONG_TASK_MS = 50
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+    return {
+        "p50": round(percentile(samples, 0.50), 2),
+        "p95": round(percentile(samples, 0.95), 2),
+        "p99": round(percentile(samples, 0.99), 2),
+        "max": round(max(samples), 2),
+    }
+
+
+def summarize_frames(recorded, budget_ms=DEFAULT_BUDGET_MS):
+    """Turn ``window.__frames.stop()`` output into FPS, frame-time and jank figures."""
+    frames = recorded["frames"]
+    intervals = [later - earlier for earlier, later in zip(frames, frames[1:])]
+    span = frames[-1] - frames[0] if len(frames) > 1 else 0
+    over = [interval for interval in intervals if interval >= budget_ms * OVER_BUDGET_FACTOR]
+    summary = {
+        "duration_s": round(recorded["duration"] / 1000, 2),
+        "frames": len(frames),
+        "fps": round((len(frames) - 1) / (span / 1000), 1) if span else 0.0,
+        "frame_ms": _percentiles(intervals),
+        "budget_ms": round(budget_ms, 2),
+        "over_budget": len(over),
+        "dropped_frames": sum(round(interval / budget_ms) - 1 for interval in over),
+        "long_tasks": len(recorded["longTasks"]),
+        "blocking_ms": round(sum(max(0, task - LONG_TASK_MS) for task in recorded["longTasks"]), 1),
+        "workers": [],
+    }
+    summary["smooth"] = bool(intervals) and len(over) <= SMOOTH_FRACTION * len(intervals)
+    for worker in recorded["workers"]:
+        arrivals = worker["arrivals"]
+        gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+        summary["workers"].append({
+            "url": worker["url"],
+            "messages": len(arrivals),
+            "messages_per_s": round(len(arrivals) / (recorded["duration"] / 1000), 1),
+            "interval_ms": _percentiles(gaps),
+            "step_ms": _percentiles(worker["steps"]),
+        })
+    return summary
+
+
+def start_steps(entry, start_selector):
+    """The manifest's steps for an example, else a click on its start button if it has one."""
+    if entry["steps"]:
+        return entry["steps"]
+    index_html = (EXAMPLES_DIR / entry["id"] / "index.html").read_text(encoding="utf-8", errors="replace")
+    if start_selector.startswith("#") and f'id="{start_selector[1:]}"' in index_html:
+        return [{"action": "click", "selector": start_selector}]
+    return None
+
+
+async def measure(page, entry, steps, options):
+    result = {"example": entry["id"]}
+    try:
+        await page.goto(f"{options.base_url}/examples/{entry['id']}/index.html")
+        await perform_steps(page, steps)
+        # Let the simulation get past its start-up before sampling.
+        await asyncio.sleep(options.warmup)
+        await page.evaluate("() => window.__frames.start()")
+        await asyncio.sleep(options.duration)
+        recorded = await page.evaluate("() => window.__frames.stop()")
+        result.update(status="measured", **summarize_frames(recorded, options.budget_ms))
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    return result
+
+
+async def run_all(jobs, options):
+    async def job(page, item):
+        entry, steps = item
+        return await measure(page, entry, steps, options)
+
+    # One simulation at a time: pages running side by side would steal each other's frames.
+    results = []
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT, FRAMES_SCRIPT]) as engine:
+        async for result in engine.imap(job, jobs):
+            results.append(result)
+            print_result(result)
+    return sorted(results, key=lambda result: result["example"])
+
+
+def print_result(result):
+    if result["status"] != "measured":
+        print(f"FAILED {result['example']}: {result['error']}")
+        return
+    frame_ms = result["frame_ms"] or {"p95": "-", "p99": "-"}
+    verdict = "smooth" if result["smooth"] else "JANKY"
+    print(f"{verdict} {result['example']}: {result['fps']} fps, p95 {frame_ms['p95']} ms, "
+          f"p99 {frame_ms['p99']} ms, {result['over_budget']}/{max(result['frames'] - 1, 0)} frames over budget, "
+          f"{result['long_tasks']} long tasks")
+    for worker in result["workers"]:
+        step = f", step p95 {worker['step_ms']['p95']} ms" if worker["step_ms"] else ""
+        print(f"    {worker['url']}: {worker['messages_per_s']} messages/s{step}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure frame times and jank while simulations run.")
+    parser.add_argument("--category", action="append", default=[],
+                        help="category to measure (repeatable; default: 09-games-animation, 11-scientific-computing)")
+    parser.add_argument("--range", type=parse_range, help="only measure example numbers in a range, e.g. 831-850")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only measure examples whose id contains this text (repeatable)")
+    parser.add_argument("--start", default="#startBtn",
+                        help="button that starts a simulation without manifest steps (default: #startBtn)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to sample each simulation (default: 10)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds to let it run before sampling (default: 1)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="frame budget in ms (default: 16.67, i.e. 60 Hz)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    entries = load_manifest().select(categories=args.category or CATEGORIES, numbers=args.range, contains=args.filter)
+    jobs, skipped = [], []
+    for entry in entries:
+        steps = start_steps(entry, args.start)
+        if steps is not None:
+            jobs.append((entry, steps))
+        else:
+            skipped.append({"example": entry["id"], "status": "skipped",
+                            "reason": f"no manifest steps and no {args.start} to start it"})
+    if not jobs and not skipped:
+        print("No simulations selected.")
+        return 0
+
+    if args.serve and jobs:
+        serve_base_url(args.base_url)
+    print(f"Sampling {len(jobs)} simulations for {args.duration:g}s each "
+          f"({len(skipped)} skipped without a way to start them)...")
+    results = asyncio.run(run_all(jobs, args)) if jobs else []
+    results = sorted(results + skipped, key=lambda result: result["example"])
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "frames.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "duration_s": args.duration,
+              "budget_ms": args.budget_ms, "results": results}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    measured = [result for result in results if result["status"] == "measured"]
+    janky = [result for result in measured if not result["smooth"]]
+    failed = sum(1 for result in results if result["status"] == "failed")
+    print("-" * 20)
+    print(f"{len(measured) - len(janky)} smooth, {len(janky)} janky, {failed} failed, "
+          f"{len(skipped)} skipped; saved {report_path}")
+    if measured:
+        print(f"median fps {statistics.median(result['fps'] for result in measured):.1f}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
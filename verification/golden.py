@@ -0,0 +1,134 @@
+"""Compare screenshots against a store of golden images.
+
+Golden images live in ``verification/golden/<category>/<name>.png``. A
+screenshot whose bytes hash the same as its golden image is accepted without
+decoding it; otherwise both are decoded into NumPy arrays and compared per
+pixel. When too many pixels differ the example counts as a regression and a
+heatmap of the differences is written next to the screenshot.
+
+    python verification/golden.py            # compare verification/output against the store
+    python verification/golden.py --update   # accept the current screenshots as golden
+"""
+import argparse
+import hashlib
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GOLDEN_DIR = REPO_ROOT / "verification" / "golden"
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+
+# A pixel counts as changed when any channel differs by more than this.
+PIXEL_THRESHOLD = 16
+# An example regresses when more than this fraction of its pixels changed.
+TOLERANCE = 0.001
+
+
+def golden_path(example):
+    return GOLDEN_DIR / f"{example}.png"
+
+
+def file_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_rgb(path):
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"), dtype=np.int16)
+
+
+def diff_heatmap(actual, magnitude):
+    """Dim the screenshot to grey and paint changed pixels red by magnitude."""
+    grey = actual.mean(axis=2, keepdims=True) * 0.3
+    heatmap = np.repeat(grey, 3, axis=2)
+    heatmap[..., 0] = np.maximum(heatmap[..., 0], magnitude)
+    return Image.fromarray(heatmap.clip(0, 255).astype(np.uint8))
+
+
+def compare(example, screenshot, pixel_threshold=PIXEL_THRESHOLD, tolerance=TOLERANCE):
+    """Compare one screenshot with its golden image.
+
+    Returns a dict whose ``status`` is ``missing``, ``identical``,
+    ``within-tolerance`` or ``regressed``.
+    """
+    screenshot = Path(screenshot)
+    golden = golden_path(example)
+    if not golden.exists():
+        return {"status": "missing"}
+    if file_hash(golden) == file_hash(screenshot):
+        return {"status": "identical", "changed": 0.0}
+
+    actual, expected = load_rgb(screenshot), load_rgb(golden)
+    if actual.shape != expected.shape:
+        return {"status": "regressed", "reason": f"size {actual.shape[1::-1]} != {expected.shape[1::-1]}"}
+
+    magnitude = np.abs(actual - expected).max(axis=2)
+    changed = float(np.count_nonzero(magnitude > pixel_threshold)) / magnitude.size
+    if changed <= tolerance:
+        return {"status": "within-tolerance", "changed": round(changed, 6)}
+
+    heatmap_path = screenshot.with_name(f"{screenshot.stem}.diff.png")
+    diff_heatmap(actual, magnitude * (255.0 / magnitude.max())).save(heatmap_path)
+    return {
+        "status": "regressed",
+        "changed": round(changed, 6),
+        "heatmap": str(heatmap_path),
+    }
+
+
+def _compare_item(item):
+    example, screenshot = item
+    return example, compare(example, screenshot)
+
+
+def compare_all(items, workers=None):
+    """Compare ``(example, screenshot)`` pairs on a process pool."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_compare_item, items, chunksize=16))
+
+
+def screenshots_in(output_dir):
+    for path in sorted(output_dir.glob("*/*.png")):
+        if not path.name.endswith(".diff.png"):
+            yield f"{path.parent.name}/{path.stem}", path
+
+
+def update(output_dir):
+    count = 0
+    for example, path in screenshots_in(output_dir):
+        target = golden_path(example)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, target)
+        count += 1
+    print(f"Stored {count} golden images in {GOLDEN_DIR}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare screenshots against golden images.")
+    parser.add_argument("--update", action="store_true", help="accept the current screenshots as golden")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    if args.update:
+        update(args.output_dir)
+        return 0
+
+    outcomes = compare_all(list(screenshots_in(args.output_dir)))
+    regressed = {example: outcome for example, outcome in outcomes.items() if outcome["status"] == "regressed"}
+    for example, outcome in sorted(regressed.items()):
+        detail = outcome.get("reason") or f"{outcome['changed']:.2%} of pixels changed, see {outcome['heatmap']}"
+        print(f"REGRESSED {example}: {detail}")
+    counts = {}
+    for outcome in outcomes.values():
+        counts[outcome["status"]] = counts.get(outcome["status"], 0) + 1
+    print("-" * 20)
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "No screenshots found.")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
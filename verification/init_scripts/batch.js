@@ -0,0 +1,125 @@
+// Batch image driver for the verification harness.
+//
+// Wraps Worker to remember the last message the page posted that carried an
+// image (an ImageData, an ImageBitmap or a pixel buffer) and which reply
+// ended that request. window.__batch.process(image) then posts the same
+// message with the image swapped for a new one, transferring its buffers,
+// and resolves when the worker sends the same kind of reply. This lets the
+// harness push many images through an example's worker without knowing its
+// message format or reloading the page.
+(() => {
+  if (window.__batch) return;
+
+  const state = { worker: null, template: null, replyKey: null, width: 0, height: 0 };
+
+  const replyKey = (data) => {
+    if (data && typeof data === 'object') {
+      return data.type !== undefined ? `type:${data.type}` : `keys:${Object.keys(data).sort().join(',')}`;
+    }
+    return typeof data;
+  };
+
+  // The first image in a message, and its size.
+  const findImage = (value, depth = 0) => {
+    if (!value || typeof value !== 'object' || depth > 4) return null;
+    if (value instanceof ImageData || (typeof ImageBitmap !== 'undefined' && value instanceof ImageBitmap)) {
+      return { width: value.width, height: value.height };
+    }
+    if (ArrayBuffer.isView(value) || value instanceof ArrayBuffer) return null;
+    // Raw RGBA pixels sent next to their width and height.
+    const { width, height } = value;
+    if (Number.isInteger(width) && Number.isInteger(height) && Object.values(value).some((item) =>
+      (ArrayBuffer.isView(item) || item instanceof ArrayBuffer) && item.byteLength === width * height * 4)) {
+      return { width, height };
+    }
+    for (const key of Object.keys(value)) {
+      const found = findImage(value[key], depth + 1);
+      if (found) return found;
+    }
+    return null;
+  };
+
+  // A copy of the template with every image, pixel buffer and matching
+  // width/height field replaced by the new image's.
+  const substitute = (value, image, bitmap, transfer) => {
+    if (!value || typeof value !== 'object') return value;
+    const pixelBytes = state.width * state.height * 4;
+    if (value instanceof ImageData) {
+      const copy = new ImageData(new Uint8ClampedArray(image.data), image.width, image.height);
+      transfer.push(copy.data.buffer);
+      return copy;
+    }
+    if (typeof ImageBitmap !== 'undefined' && value instanceof ImageBitmap) return bitmap;
+    if (value instanceof ArrayBuffer) {
+      if (value.byteLength !== pixelBytes) return value;
+      const copy = image.data.slice().buffer;
+      transfer.push(copy);
+      return copy;
+    }
+    if (ArrayBuffer.isView(value)) {
+      if (value.byteLength !== pixelBytes) return value;
+      const copy = new value.constructor(image.data.slice().buffer);
+      transfer.push(copy.buffer);
+      return copy;
+    }
+    const copy = Array.isArray(value) ? [] : {};
+    for (const key of Object.keys(value)) {
+      const item = value[key];
+      if (key === 'width' && item === state.width) copy[key] = image.width;
+      else if (key === 'height' && item === state.height) copy[key] = image.height;
+      else copy[key] = substitute(item, image, bitmap, transfer);
+    }
+    return copy;
+  };
+
+  const NativeWorker = window.Worker;
+  if (NativeWorker) {
+    window.Worker = class extends NativeWorker {
+      constructor(...args) {
+        super(...args);
+        this.addEventListener('message', (event) => {
+          if (state.worker === this && state.template && !state.running) state.replyKey = replyKey(event.data);
+        });
+      }
+
+      postMessage(message, options) {
+        const size = state.running ? null : findImage(message);
+        if (size) {
+          try {
+            state.template = structuredClone(message);
+            state.worker = this;
+            state.width = size.width;
+            state.height = size.height;
+            state.replyKey = null;
+          } catch (e) {
+            // Not cloneable without a transfer list (e.g. an OffscreenCanvas).
+          }
+        }
+        return super.postMessage(message, options);
+      }
+    };
+  }
+
+  window.__batch = {
+    ready: () => Boolean(state.template && state.replyKey),
+    describe: () => ({ width: state.width, height: state.height, replyKey: state.replyKey }),
+    process: (image, bitmap, timeoutMs) => new Promise((resolve, reject) => {
+      const transfer = [];
+      const message = substitute(state.template, image, bitmap, transfer);
+      const worker = state.worker;
+      const timer = setTimeout(() => {
+        worker.removeEventListener('message', onMessage);
+        reject(new Error(`no ${state.replyKey} reply within ${timeoutMs} ms`));
+      }, timeoutMs);
+      const onMessage = (event) => {
+        if (replyKey(event.data) !== state.replyKey) return;
+        clearTimeout(timer);
+        worker.removeEventListener('message', onMessage);
+        resolve();
+      };
+      worker.addEventListener('message', onMessage);
+      state.running = true;
+      worker.postMessage(message, transfer);
+    }),
+  };
+})();
@@ -0,0 +1,96 @@
+// Completion protocol for the verification harness.
+//
+// An example tells the harness it has finished by doing any one of:
+//   - posting { type: 'done' } from its worker
+//   - setting window.__exampleDone = true
+//   - setting a data-example-done attribute on <html> or <body>
+//   - dispatching an 'example-done' event on window
+//
+// Examples that do none of these are considered finished once every message
+// posted to a worker has been answered and no worker message has been sent
+// or received for a quiet period. Progress-style messages (see INTERIM_TYPE)
+// do not count as answers, so a worker that computes silently for longer
+// than the quiet period is still waited on; the caller's timeout bounds the
+// wait for workers that never reply.
+(() => {
+  if (window.__verification) return;
+
+  // Message types that report on work in progress rather than answer a request.
+  const INTERIM_TYPE = /progress|status|update|activity|waiting|processing|(^|_)(log|ready|step|frame|epoch|state)$/i;
+
+  const state = {
+    done: false,
+    lastActivity: performance.now(),
+    workers: 0,
+    messages: 0,
+    outstanding: new Map(),
+  };
+
+  const pendingReplies = () => {
+    let total = 0;
+    state.outstanding.forEach((count) => { total += count; });
+    return total;
+  };
+
+  const touch = () => {
+    state.lastActivity = performance.now();
+  };
+
+  window.addEventListener('example-done', () => {
+    state.done = true;
+  });
+
+  const NativeWorker = window.Worker;
+  if (NativeWorker) {
+    window.Worker = class extends NativeWorker {
+      constructor(...args) {
+        super(...args);
+        state.workers += 1;
+        state.outstanding.set(this, 0);
+        touch();
+        this.addEventListener('message', (event) => {
+          state.messages += 1;
+          touch();
+          const type = event.data && typeof event.data.type === 'string' ? event.data.type : '';
+          if (type === 'done') state.done = true;
+          if (!INTERIM_TYPE.test(type)) {
+            state.outstanding.set(this, Math.max(0, state.outstanding.get(this) - 1));
+          }
+        });
+        // A worker that failed will not answer what it was sent.
+        this.addEventListener('error', () => {
+          state.outstanding.set(this, 0);
+          touch();
+        });
+      }
+
+      postMessage(...args) {
+        state.messages += 1;
+        state.outstanding.set(this, state.outstanding.get(this) + 1);
+        touch();
+        return super.postMessage(...args);
+      }
+
+      terminate() {
+        state.outstanding.delete(this);
+        touch();
+        return super.terminate();
+      }
+    };
+  }
+
+  const signalled = () =>
+    state.done ||
+    window.__exampleDone === true ||
+    (document.documentElement && document.documentElement.hasAttribute('data-example-done')) ||
+    (document.body && document.body.hasAttribute('data-example-done'));
+
+  // Returns why the page counts as finished, or '' while it is still busy.
+  state.settled = (quietMs) => {
+    if (signalled()) return 'signal';
+    if (pendingReplies() === 0 && performance.now() - state.lastActivity >= quietMs) return 'quiet';
+    return '';
+  };
+
+  window.__verification = state;
+})();
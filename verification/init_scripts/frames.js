@@ -0,0 +1,87 @@
+// Frame-time sampling for the verification harness.
+//
+// window.__frames.start() runs a requestAnimationFrame loop that records the
+// timestamp of every frame the main thread gets to render, and a long-task
+// observer; stop() returns what was recorded. A main thread busy with
+// simulation work shows up as long gaps between frames whether or not the
+// page itself draws with requestAnimationFrame.
+//
+// Worker is wrapped to record, per worker, when each message arrived and the
+// step time the worker reported, if its message carries one of the usual
+// fields (tickTime, simTime, physicsTime, ...) at the top level or under
+// payload/data.
+(() => {
+  if (window.__frames) return;
+
+  const MAX_SAMPLES = 100000;
+  const STEP_FIELDS = ['stepTime', 'tickTime', 'simTime', 'physicsTime', 'updateTime', 'calcTime', 'computeTime'];
+  const workers = [];
+  let recording = null;
+
+  const push = (list, value) => {
+    if (list.length < MAX_SAMPLES) list.push(value);
+  };
+
+  const stepTime = (data) => {
+    if (!data || typeof data !== 'object') return null;
+    for (const scope of [data, data.payload, data.data]) {
+      if (!scope || typeof scope !== 'object') continue;
+      for (const field of STEP_FIELDS) {
+        if (typeof scope[field] === 'number') return scope[field];
+      }
+    }
+    return null;
+  };
+
+  const NativeWorker = window.Worker;
+  if (NativeWorker) {
+    window.Worker = class extends NativeWorker {
+      constructor(url, ...rest) {
+        super(url, ...rest);
+        const stats = { url: String(url), arrivals: [], steps: [] };
+        workers.push(stats);
+        this.addEventListener('message', (event) => {
+          if (!recording) return;
+          push(stats.arrivals, performance.now());
+          const step = stepTime(event.data);
+          if (step !== null) push(stats.steps, step);
+        });
+      }
+    };
+  }
+
+  const onFrame = (timestamp) => {
+    if (!recording) return;
+    push(recording.frames, timestamp);
+    requestAnimationFrame(onFrame);
+  };
+
+  window.__frames = {
+    start: () => {
+      workers.forEach((stats) => { stats.arrivals = []; stats.steps = []; });
+      recording = { started: performance.now(), frames: [], longTasks: [] };
+      if (typeof PerformanceObserver !== 'undefined' &&
+          (PerformanceObserver.supportedEntryTypes || []).includes('longtask')) {
+        const current = recording;
+        recording.observer = new PerformanceObserver((list) => {
+          list.getEntries().forEach((entry) => push(current.longTasks, entry.duration));
+        });
+        recording.observer.observe({ entryTypes: ['longtask'] });
+      }
+      requestAnimationFrame(onFrame);
+    },
+    stop: () => {
+      const done = recording;
+      recording = null;
+      if (!done) return null;
+      if (done.observer) done.observer.disconnect();
+      return {
+        duration: performance.now() - done.started,
+        frames: done.frames,
+        longTasks: done.longTasks,
+        workers: workers.filter((stats) => stats.arrivals.length)
+          .map(({ url, arrivals, steps }) => ({ url, arrivals, steps })),
+      };
+    },
+  };
+})();
@@ -0,0 +1,68 @@
+// JS heap sampling for the verification harness.
+//
+// Samples the page's and every dedicated worker's JS heap a few times per
+// second and keeps the last and peak value of each. Worker heaps come from
+// performance.measureUserAgentSpecificMemory(), which needs a
+// cross-origin-isolated page (serve.py sends COOP/COEP); without it only the
+// page heap is sampled, from performance.memory. Heaps of several workers
+// started from the same script are added together under that script's URL.
+(() => {
+  if (window.__memory) return;
+
+  const INTERVAL_MS = 250;
+  const state = { supported: 'none', samples: 0, page: { last: 0, peak: 0 }, workers: {} };
+  let stopped = false;
+
+  const note = (entry, bytes) => {
+    entry.last = bytes;
+    entry.peak = Math.max(entry.peak, bytes);
+  };
+
+  const measure = async () => {
+    if (window.crossOriginIsolated && performance.measureUserAgentSpecificMemory) {
+      const result = await performance.measureUserAgentSpecificMemory();
+      let page = 0;
+      const workers = {};
+      for (const item of result.breakdown) {
+        // Memory shared by several contexts is split evenly between them.
+        const share = item.bytes / Math.max(1, item.attribution.length);
+        for (const attribution of item.attribution) {
+          if (attribution.scope === 'DedicatedWorkerGlobalScope') {
+            workers[attribution.url] = (workers[attribution.url] || 0) + share;
+          } else if (attribution.scope === 'Window') {
+            page += share;
+          }
+        }
+      }
+      state.supported = 'measureUserAgentSpecificMemory';
+      note(state.page, page);
+      for (const [url, bytes] of Object.entries(workers)) {
+        note(state.workers[url] || (state.workers[url] = { last: 0, peak: 0 }), bytes);
+      }
+    } else if (performance.memory) {
+      state.supported = 'performance.memory';
+      note(state.page, performance.memory.usedJSHeapSize);
+    }
+    state.samples += 1;
+    return state;
+  };
+
+  const loop = async () => {
+    if (stopped) return;
+    try {
+      await measure();
+    } catch (e) {
+      // A measurement can fail while the page navigates; try again next tick.
+    }
+    setTimeout(loop, INTERVAL_MS);
+  };
+  setTimeout(loop, 0);
+
+  window.__memory = {
+    measure,
+    stop: () => {
+      stopped = true;
+      return state;
+    },
+  };
+})();
@@ -0,0 +1,182 @@
+// Worker message-traffic instrumentation for the verification harness.
+//
+// Wraps the Worker constructor and postMessage to record, per worker:
+//   - how many messages went each way and how many bytes they carried
+//     (an estimate of the structured-clone size)
+//   - how many ArrayBuffer bytes were transferred, and how many were
+//     cloned because they were missing from the transfer list
+//   - the round-trip time from each message sent to its reply
+//
+// A reply carrying an id (or requestId) is paired with the request that
+// sent the same id; other replies are paired with requests in FIFO order,
+// which matches the request/response style most examples use. Messages
+// whose type reports work in progress (progress, status, log, ready, ...)
+// are counted but not paired.
+(() => {
+  if (window.__messageTraffic) return;
+
+  const MAX_SAMPLES = 10000;
+  // Message types that report on work in progress rather than answer a request.
+  const INTERIM_TYPE = /progress|status|update|activity|waiting|processing|(^|_)(log|ready|step|frame|epoch|state)$/i;
+  const workers = [];
+
+  const messageId = (data) => {
+    if (!data || typeof data !== 'object') return undefined;
+    return data.id !== undefined ? data.id : data.requestId;
+  };
+
+  // Estimate how many bytes structured clone copies, and how many of them are
+  // ArrayBuffer contents (which transferring would have avoided).
+  const measure = (value, transferred) => {
+    const seen = new Set();
+    const size = { bytes: 0, bufferBytes: 0, sharedBytes: 0 };
+
+    const addBuffer = (buffer) => {
+      if (seen.has(buffer)) return;
+      seen.add(buffer);
+      if (typeof SharedArrayBuffer !== 'undefined' && buffer instanceof SharedArrayBuffer) {
+        size.sharedBytes += buffer.byteLength;
+      } else if (!transferred.has(buffer)) {
+        size.bytes += buffer.byteLength;
+        size.bufferBytes += buffer.byteLength;
+      }
+    };
+
+    const visit = (item) => {
+      if (item === null || item === undefined) return;
+      switch (typeof item) {
+        case 'string':
+          size.bytes += item.length * 2;
+          return;
+        case 'number':
+        case 'bigint':
+          size.bytes += 8;
+          return;
+        case 'boolean':
+          size.bytes += 4;
+          return;
+        case 'object':
+          break;
+        default:
+          return;
+      }
+      if (seen.has(item)) return;
+      if (item instanceof ArrayBuffer ||
+          (typeof SharedArrayBuffer !== 'undefined' && item instanceof SharedArrayBuffer)) {
+        addBuffer(item);
+        return;
+      }
+      seen.add(item);
+      if (ArrayBuffer.isView(item)) {
+        addBuffer(item.buffer);
+      } else if (typeof Blob !== 'undefined' && item instanceof Blob) {
+        size.bytes += item.size;
+      } else if (typeof ImageData !== 'undefined' && item instanceof ImageData) {
+        size.bytes += item.data.byteLength;
+        size.bufferBytes += item.data.byteLength;
+      } else if (item instanceof Map) {
+        item.forEach((v, k) => { visit(k); visit(v); });
+      } else if (item instanceof Set) {
+        item.forEach(visit);
+      } else if (Array.isArray(item)) {
+        item.forEach(visit);
+      } else {
+        for (const key of Object.keys(item)) {
+          size.bytes += key.length * 2;
+          visit(item[key]);
+        }
+      }
+    };
+
+    visit(value);
+    return size;
+  };
+
+  const transferList = (options) => {
+    if (Array.isArray(options)) return options;
+    if (options && Array.isArray(options.transfer)) return options.transfer;
+    return [];
+  };
+
+  const record = (list, value) => {
+    if (list.length < MAX_SAMPLES) list.push(value);
+  };
+
+  const newStats = (url) => ({
+    url: String(url),
+    sent: 0,
+    received: 0,
+    sentBytes: 0,
+    receivedBytes: 0,
+    transferred: 0,
+    transferredBytes: 0,
+    transferredObjects: 0,
+    clonedBufferBytes: 0,
+    sharedBytes: 0,
+    sentSizes: [],
+    receivedSizes: [],
+    rtts: [],
+    pending: [],
+  });
+
+  const NativeWorker = window.Worker;
+  if (NativeWorker) {
+    window.Worker = class extends NativeWorker {
+      constructor(url, ...rest) {
+        super(url, ...rest);
+        const stats = newStats(url);
+        workers.push(stats);
+        this.__messageStats = stats;
+        this.addEventListener('message', (event) => {
+          const now = performance.now();
+          const size = measure(event.data, new Set());
+          stats.received += 1;
+          stats.receivedBytes += size.bytes;
+          record(stats.receivedSizes, size.bytes);
+          const data = event.data;
+          if (data && typeof data.type === 'string' && INTERIM_TYPE.test(data.type)) return;
+          const id = messageId(data);
+          let index = 0;
+          if (id !== undefined) {
+            index = stats.pending.findIndex((request) => request.id === id);
+            if (index < 0) index = stats.pending.findIndex((request) => request.id === undefined);
+          }
+          if (index < 0 || !stats.pending.length) return;
+          record(stats.rtts, now - stats.pending.splice(index, 1)[0].sentAt);
+        });
+      }
+
+      postMessage(message, options) {
+        const stats = this.__messageStats;
+        const list = transferList(options);
+        const buffers = new Set(list.filter((item) => item instanceof ArrayBuffer));
+        const size = measure(message, buffers);
+        let transferBytes = 0;
+        buffers.forEach((buffer) => { transferBytes += buffer.byteLength; });
+
+        const sentAt = performance.now();
+        const result = super.postMessage(message, options);
+
+        // A transferred buffer is detached once postMessage returns.
+        let detached = 0;
+        buffers.forEach((buffer) => { if (buffer.byteLength === 0) detached += 1; });
+        stats.sent += 1;
+        stats.sentBytes += size.bytes;
+        stats.clonedBufferBytes += size.bufferBytes;
+        stats.sharedBytes += size.sharedBytes;
+        stats.transferredObjects += list.length;
+        if (buffers.size && detached === buffers.size) {
+          stats.transferred += 1;
+          stats.transferredBytes += transferBytes;
+        }
+        record(stats.sentSizes, size.bytes);
+        if (stats.pending.length < MAX_SAMPLES) stats.pending.push({ id: messageId(message), sentAt });
+        return result;
+      }
+    };
+  }
+
+  window.__messageTraffic = {
+    report: () => workers.map(({ pending, ...stats }) => ({ ...stats, unanswered: pending.length })),
+  };
+})();
@@ -0,0 +1,22 @@
+// Deterministic Math.random for the verification harness.
+//
+// Replaces the page's Math.random with a seeded mulberry32 generator so
+// effects that add noise on the main thread (film grain, glitch, pointillism
+// dot placement) draw the same pixels on every run. The seed is read from
+// __randomSeed on the global object, defaulting to 0. Init scripts do not run
+// in worker scopes, so page workers keep the native generator; a worker can
+// load this file with importScripts after setting self.__randomSeed.
+(() => {
+  if (Math.random.__seeded) return;
+
+  let state = (globalThis.__randomSeed || 0) >>> 0;
+  const random = () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+  random.__seeded = true;
+  Math.random = random;
+})();
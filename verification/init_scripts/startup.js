@@ -0,0 +1,118 @@
+// Worker start-up timing for the verification harness.
+//
+// Wraps Worker and SharedWorker to timestamp, per worker, when the page
+// constructed it, when the page first posted to it, the first message it
+// sent back, and the first reply after the page's first post that is not a
+// progress-style message (its first result). Times are milliseconds since
+// navigation start.
+//
+// report() adds the page's navigation timing and, per script URL, how long
+// the page takes to compile the script's source with `new Function`. That
+// is the same V8 front end the worker runs before its first task, so it
+// serves as an estimate of the worker's parse time. Module scripts do not
+// compile as a function body and get no estimate.
+(() => {
+  if (window.__startup) return;
+
+  // Message types that report on work in progress rather than answer a request.
+  const INTERIM_TYPE = /progress|status|update|activity|waiting|processing|(^|_)(log|ready|step|frame|epoch|state)$/i;
+  const workers = [];
+  const compileTimes = new Map();
+
+  const track = (kind, url, options, constructed) => {
+    const record = {
+      kind,
+      url: new URL(String(url), location.href).href,
+      type: options && options.type === 'module' ? 'module' : 'classic',
+      constructed,
+      firstPost: null,
+      firstReceived: null,
+      firstResult: null,
+    };
+    workers.push(record);
+    return record;
+  };
+
+  const onReply = (record) => (event) => {
+    const now = performance.now();
+    if (record.firstReceived === null) record.firstReceived = now;
+    if (record.firstResult !== null || record.firstPost === null) return;
+    const data = event.data;
+    if (data && typeof data.type === 'string' && INTERIM_TYPE.test(data.type)) return;
+    record.firstResult = now;
+  };
+
+  const onPost = (record) => {
+    if (record.firstPost === null) record.firstPost = performance.now();
+  };
+
+  const NativeWorker = window.Worker;
+  if (NativeWorker) {
+    window.Worker = class extends NativeWorker {
+      constructor(url, options) {
+        const constructed = performance.now();
+        super(url, options);
+        this.__startup = track('dedicated', url, options, constructed);
+        this.addEventListener('message', onReply(this.__startup));
+      }
+
+      postMessage(...args) {
+        onPost(this.__startup);
+        return super.postMessage(...args);
+      }
+    };
+  }
+
+  const NativeSharedWorker = window.SharedWorker;
+  if (NativeSharedWorker) {
+    window.SharedWorker = class extends NativeSharedWorker {
+      constructor(url, options) {
+        const constructed = performance.now();
+        super(url, options);
+        const record = track('shared', url, typeof options === 'object' ? options : null, constructed);
+        const { port } = this;
+        // A listener added with addEventListener does not start the port,
+        // so the page's own onmessage/start() still decides when it opens.
+        port.addEventListener('message', onReply(record));
+        port.postMessage = function (...args) {
+          onPost(record);
+          return MessagePort.prototype.postMessage.apply(this, args);
+        };
+      }
+    };
+  }
+
+  const compileTime = (url) => {
+    if (!compileTimes.has(url)) {
+      compileTimes.set(url, (async () => {
+        try {
+          const source = await (await fetch(url)).text();
+          const start = performance.now();
+          new Function(source);
+          return performance.now() - start;
+        } catch {
+          return null;
+        }
+      })());
+    }
+    return compileTimes.get(url);
+  };
+
+  window.__startup = {
+    report: async () => {
+      const [navigation] = performance.getEntriesByType('navigation');
+      return {
+        timeOrigin: performance.timeOrigin,
+        navigation: navigation ? {
+          responseEnd: navigation.responseEnd,
+          domContentLoaded: navigation.domContentLoadedEventEnd,
+          load: navigation.loadEventEnd,
+        } : null,
+        workers: await Promise.all(workers.map(async (record) => ({
+          ...record,
+          parse: record.type === 'module' ? null : await compileTime(record.url),
+        }))),
+      };
+    },
+  };
+})();
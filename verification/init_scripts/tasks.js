@@ -0,0 +1,106 @@
+// Task timing for the verification harness's load generator.
+//
+// Worker is wrapped to timestamp every message the page posts to a worker
+// (a dispatch) and the reply that ends it. Messages are matched to replies
+// by their `id` field when they have one, otherwise in order per worker.
+// window.__tasks.run(arrivals, submit) calls the page's own submit function
+// at each arrival time; submit returns the id of the task it created, or
+// nothing if the task is dispatched during the call. records() then gives
+// arrival, dispatch and completion times and the worker's reported duration
+// for every task, so queue wait and service time can be told apart.
+(() => {
+  if (window.__tasks) return;
+
+  const dispatches = new Map();
+  const replies = new Map();
+  const unnamed = new WeakMap();
+  let arrivals = [];
+  let started = 0;
+  let sequence = 0;
+  let capture = null;
+  let lastEvent = 0;
+
+  const taskKey = (message) => {
+    if (!message || typeof message !== 'object') return null;
+    const { id } = message;
+    return typeof id === 'number' || typeof id === 'string' ? String(id) : null;
+  };
+
+  const NativeWorker = window.Worker;
+  if (NativeWorker) {
+    window.Worker = class extends NativeWorker {
+      constructor(...args) {
+        super(...args);
+        unnamed.set(this, []);
+        this.addEventListener('message', (event) => {
+          const now = performance.now();
+          let key = taskKey(event.data);
+          if (key === null) key = unnamed.get(this).shift() ?? null;
+          if (key === null || !dispatches.has(key) || replies.has(key)) return;
+          const data = event.data && typeof event.data === 'object' ? event.data : {};
+          const duration = Number(data.duration);
+          replies.set(key, {
+            completed: now,
+            service: Number.isFinite(duration) ? duration : null,
+            success: data.success !== false,
+          });
+          lastEvent = now;
+        });
+      }
+
+      postMessage(message, ...rest) {
+        let key = taskKey(message);
+        if (key === null) {
+          key = `#${++sequence}`;
+          unnamed.get(this).push(key);
+        }
+        if (!dispatches.has(key)) dispatches.set(key, performance.now());
+        if (capture) capture.push(key);
+        lastEvent = performance.now();
+        return super.postMessage(message, ...rest);
+      }
+    };
+  }
+
+  const unfinished = () => arrivals.filter(({ key }) => key === null || !replies.has(key)).length;
+
+  window.__tasks = {
+    run: async (tasks, submitSource) => {
+      const submit = (0, eval)(submitSource);
+      arrivals = [];
+      started = performance.now();
+      for (const task of tasks) {
+        const delay = started + task.at - performance.now();
+        if (delay > 0) await new Promise((resolve) => setTimeout(resolve, delay));
+        capture = [];
+        const arrived = performance.now();
+        let id;
+        try {
+          id = submit(task, window.__tasks);
+        } finally {
+          const captured = capture;
+          capture = null;
+          const key = id === undefined || id === null ? (captured[0] ?? null) : String(id);
+          arrivals.push({ key, cls: task.cls, scheduled: started + task.at, arrived });
+          lastEvent = performance.now();
+        }
+      }
+    },
+    // Tasks dispatched to a worker that have not answered yet.
+    outstanding: () => [...dispatches.keys()].filter((key) => !replies.has(key)).length,
+    progress: () => ({ unfinished: unfinished(), idleMs: performance.now() - lastEvent }),
+    records: () => arrivals.map(({ key, cls, scheduled, arrived }) => {
+      const reply = key === null ? null : replies.get(key);
+      const dispatched = key === null ? undefined : dispatches.get(key);
+      return {
+        cls,
+        lag: arrived - scheduled,
+        arrived: arrived - started,
+        dispatched: dispatched === undefined ? null : dispatched - started,
+        completed: reply ? reply.completed - started : null,
+        service: reply ? reply.service : null,
+        success: reply ? reply.success : null,
+      };
+    }),
+  };
+})();
@@ -0,0 +1,173 @@
+"""Summarise the example server's access log.
+
+Reads the JSON-lines log written by ``serve.py --access-log`` one line at a
+time, so logs from full sweeps do not need to fit in memory. Plain
+``http.server`` logs (like ``server.log``) are accepted too, but only carry
+request counts.
+
+Reports the slowest assets, the heaviest examples, and, given a runner
+report, how each example's verification time splits between fetching its
+files (network) and everything after that (worker compute and rendering).
+
+    python verification/log_analyzer.py verification/output/access.jsonl
+    python verification/log_analyzer.py access.jsonl --results verification/output/results.json
+"""
+import argparse
+import json
+import re
+from pathlib import Path
+
+_APACHE_RE = re.compile(r'\[(?P<time>[^\]]+)\] "(?P<method>\S+) (?P<path>\S+) [^"]*" (?P<status>\d{3}) (?P<size>\S+)')
+_EXAMPLE_RE = re.compile(r"^/examples/([^/]+/[^/?#]+)/")
+
+
+def read_records(path):
+    """Yield one dict per request, from either log format."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("{"):
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+                continue
+            match = _APACHE_RE.search(line)
+            if match:
+                size = match.group("size")
+                yield {
+                    "method": match.group("method"),
+                    "path": match.group("path"),
+                    "status": int(match.group("status")),
+                    "bytes": int(size) if size.isdigit() else 0,
+                }
+
+
+def example_of(path):
+    match = _EXAMPLE_RE.match(path)
+    return match.group(1) if match else None
+
+
+class Totals:
+    __slots__ = ("requests", "bytes", "time_ms", "max_ms", "intervals")
+
+    def __init__(self, track_intervals=False):
+        self.requests = 0
+        self.bytes = 0
+        self.time_ms = 0.0
+        self.max_ms = 0.0
+        self.intervals = [] if track_intervals else None
+
+    def add(self, record):
+        self.requests += 1
+        self.bytes += record.get("bytes", 0)
+        total_ms = record.get("total_ms")
+        if total_ms is None:
+            return
+        self.time_ms += total_ms
+        self.max_ms = max(self.max_ms, total_ms)
+        if self.intervals is not None and "ts" in record:
+            end = record["ts"]
+            self.intervals.append((end - total_ms / 1000, end))
+
+    @property
+    def mean_ms(self):
+        return self.time_ms / self.requests if self.requests else 0.0
+
+    @property
+    def busy_ms(self):
+        """Wall time during which at least one request was in flight.
+
+        The union of the request intervals, so idle and compute gaps between
+        requests are not counted as network time.
+        """
+        busy, current_start, current_end = 0.0, None, None
+        for start, end in sorted(self.intervals or ()):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            busy += current_end - current_start
+        return busy * 1000
+
+
+def analyze(records):
+    assets, examples = {}, {}
+    cache = {}
+    for record in records:
+        path = record["path"].split("?", 1)[0]
+        assets.setdefault(path, Totals()).add(record)
+        example = example_of(path)
+        if example:
+            examples.setdefault(example, Totals(track_intervals=True)).add(record)
+        status = record.get("cache")
+        if status:
+            cache[status] = cache.get(status, 0) + 1
+    return assets, examples, cache
+
+
+def split_time(examples, results):
+    """Split each verified example's duration into network and compute time."""
+    split = {}
+    for result in results:
+        totals = examples.get(result["example"])
+        if totals is None or result.get("cached"):
+            continue
+        duration_ms = result["duration"] * 1000
+        network_ms = min(totals.busy_ms, duration_ms)
+        split[result["example"]] = (duration_ms, network_ms, duration_ms - network_ms)
+    return split
+
+
+def print_table(title, rows, header):
+    print(f"\n{title}")
+    print("  ".join(header))
+    for row in rows:
+        print("  ".join(str(cell) for cell in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise the example server's access log.")
+    parser.add_argument("log", type=Path)
+    parser.add_argument("--results", type=Path, help="runner report (results*.json) to split network vs compute time")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    assets, examples, cache = analyze(read_records(args.log))
+    total_requests = sum(totals.requests for totals in assets.values())
+    total_bytes = sum(totals.bytes for totals in assets.values())
+    print(f"{total_requests} requests, {total_bytes / 1024 / 1024:.1f} MiB, {len(examples)} examples")
+    if cache:
+        print("cache: " + ", ".join(f"{count} {status}" for status, count in sorted(cache.items())))
+
+    slowest = sorted(assets.items(), key=lambda item: item[1].max_ms, reverse=True)[: args.top]
+    print_table("Slowest assets", [
+        (f"{totals.max_ms:9.1f}", f"{totals.mean_ms:9.1f}", f"{totals.requests:6d}", path)
+        for path, totals in slowest if totals.max_ms
+    ], ("  max ms ", " mean ms ", "  reqs", "path"))
+
+    heaviest = sorted(examples.items(), key=lambda item: (item[1].bytes, item[1].requests), reverse=True)[: args.top]
+    print_table("Heaviest examples", [
+        (f"{totals.bytes / 1024:9.1f}", f"{totals.requests:6d}", f"{totals.time_ms:9.1f}", example)
+        for example, totals in heaviest
+    ], ("     KiB ", "  reqs", "  serve ms", "example"))
+
+    if args.results:
+        split = split_time(examples, json.loads(args.results.read_text()))
+        if split:
+            wall = sum(duration for duration, _, _ in split.values())
+            network = sum(network for _, network, _ in split.values())
+            print(f"\nOf {wall / 1000:.1f}s spent verifying {len(split)} examples, "
+                  f"{network / wall:.1%} was fetching files and {1 - network / wall:.1%} was compute/rendering.")
+            dominant = sorted(split.items(), key=lambda item: item[1][0], reverse=True)[: args.top]
+            print_table("Examples dominating wall-clock time", [
+                (f"{duration:9.0f}", f"{network:9.0f}", f"{compute:9.0f}", f"{duration / wall:6.1%}", example)
+                for example, (duration, network, compute) in dominant
+            ], ("  wall ms", "   net ms", "  comp ms", " share", "example"))
+
+
+if __name__ == "__main__":
+    main()
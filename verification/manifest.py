@@ -0,0 +1,168 @@
+"""Indexed catalog of every example under ``examples/``.
+
+The manifest records, for each example, its number, category, title,
+interaction steps, expected selectors and a content hash. It is generated
+from the tree plus the hand-written ``interactions.json`` and cached in
+``verification/output/manifest.json``; loading it only re-reads examples
+whose files changed since the cache was written.
+
+    python verification/manifest.py              # refresh and list every example
+    python verification/manifest.py --category 03-image-processing
+"""
+import argparse
+import hashlib
+import html
+import json
+import re
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_DIR = REPO_ROOT / "examples"
+INTERACTIONS_PATH = Path(__file__).resolve().parent / "interactions.json"
+MANIFEST_PATH = REPO_ROOT / "verification" / "output" / "manifest.json"
+MANIFEST_VERSION = 1
+
+DEFAULT_EXPECT = ["h1"]
+SKIPPED_SUFFIXES = {".md", ".py"}
+
+_HEADING_RE = re.compile(r"<h1[^>]*>(.*?)</h1>", re.S | re.I)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def example_files(example_dir):
+    """Files that define an example's behaviour, in a stable order."""
+    return sorted(
+        path for path in example_dir.iterdir()
+        if path.is_file() and path.suffix not in SKIPPED_SUFFIXES
+    )
+
+
+def content_hash(example_dir):
+    """SHA-256 over the names and contents of an example's files."""
+    digest = hashlib.sha256()
+    for path in example_files(example_dir):
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def extract_title(index_html):
+    for pattern in (_HEADING_RE, _TITLE_RE):
+        match = pattern.search(index_html)
+        if match:
+            text = html.unescape(_TAG_RE.sub("", match.group(1)))
+            return " ".join(text.split())
+    return ""
+
+
+def scan_example(example_dir):
+    category, name = example_dir.parent.name, example_dir.name
+    number = name.split("-", 1)[0]
+    return {
+        "id": f"{category}/{name}",
+        "category": category,
+        "name": name,
+        "number": int(number) if number.isdigit() else None,
+        "title": extract_title((example_dir / "index.html").read_text(encoding="utf-8", errors="replace")),
+        "hash": content_hash(example_dir),
+    }
+
+
+class Manifest:
+    """The loaded catalog with lookups by id, category and number."""
+
+    def __init__(self, entries):
+        self.entries = sorted(entries, key=lambda entry: entry["id"])
+        self.by_id = {entry["id"]: entry for entry in self.entries}
+        self.by_category = {}
+        self.by_number = {}
+        for entry in self.entries:
+            self.by_category.setdefault(entry["category"], []).append(entry)
+            self.by_number.setdefault(entry["number"], []).append(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def select(self, categories=(), numbers=None, contains=()):
+        """Entries matching every given filter.
+
+        ``numbers`` is an inclusive ``(low, high)`` range and ``contains``
+        keeps ids that include any of the given substrings.
+        """
+        entries = self.entries
+        if categories:
+            entries = [entry for category in categories for entry in self.by_category.get(category, [])]
+        if numbers:
+            low, high = numbers
+            entries = [entry for entry in entries if entry["number"] is not None and low <= entry["number"] <= high]
+        if contains:
+            entries = [entry for entry in entries if any(text in entry["id"] for text in contains)]
+        return sorted(entries, key=lambda entry: entry["id"])
+
+
+def _newest_mtime(example_dir):
+    return max(path.stat().st_mtime for path in example_dir.iterdir() if path.is_file())
+
+
+def load_manifest(path=MANIFEST_PATH, rebuild=False):
+    """Load the catalog, rescanning only examples changed since it was cached."""
+    cached, built_at = {}, 0.0
+    if path.exists() and not rebuild:
+        data = json.loads(path.read_text())
+        if data.get("version") == MANIFEST_VERSION:
+            cached = {entry["id"]: entry for entry in data["examples"]}
+            built_at = path.stat().st_mtime
+
+    interactions = json.loads(INTERACTIONS_PATH.read_text())
+    dirty = INTERACTIONS_PATH.stat().st_mtime > built_at
+    entries = []
+    for index_path in sorted(EXAMPLES_DIR.glob("*/*/index.html")):
+        example_dir = index_path.parent
+        entry = cached.pop(f"{example_dir.parent.name}/{example_dir.name}", None)
+        if entry is None or _newest_mtime(example_dir) > built_at:
+            entry = scan_example(example_dir)
+            dirty = True
+        extra = interactions.get(entry["id"], {})
+        entry["steps"] = extra.get("steps", [])
+        entry["expect"] = DEFAULT_EXPECT + [s for s in extra.get("expect", []) if s not in DEFAULT_EXPECT]
+        entries.append(entry)
+
+    if dirty or cached:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"version": MANIFEST_VERSION, "examples": entries}, indent=1, ensure_ascii=False))
+    return Manifest(entries)
+
+
+def parse_range(value):
+    """Parse ``284-291`` (or a single ``284``) into an inclusive range."""
+    low, _, high = value.partition("-")
+    try:
+        return int(low), int(high or low)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"range must look like 284-291, got {value!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the example manifest and list its entries.")
+    parser.add_argument("--rebuild", action="store_true", help="rescan every example")
+    parser.add_argument("--category", action="append", default=[])
+    parser.add_argument("--range", type=parse_range, help="example numbers, e.g. 284-291")
+    args = parser.parse_args()
+
+    manifest = load_manifest(rebuild=args.rebuild)
+    entries = manifest.select(categories=args.category, numbers=args.range)
+    for entry in entries:
+        steps = f" ({len(entry['steps'])} steps)" if entry["steps"] else ""
+        print(f"{entry['id']}  {entry['title']}{steps}")
+    print("-" * 20)
+    print(f"{len(entries)} of {len(manifest)} examples; manifest at {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
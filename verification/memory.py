@@ -0,0 +1,153 @@
+"""Memory high-water marks for example runs.
+
+``INIT_SCRIPT`` (``init_scripts/memory.js``) samples the JS heap of the page
+and of each dedicated worker while the example runs; ``MemoryMonitor``
+samples the RSS of the browser's processes alongside it (Linux, see
+``process_memory.py``). When the example is done the monitor forces garbage
+collection in the page and its workers and measures again, so every result
+carries both the peak and the after-GC value.
+
+``MemoryHistory`` keeps the after-GC numbers of recent runs in
+``verification/.cache/memory.json`` and flags an example whose memory grew
+compared with earlier runs of the same example content.
+"""
+import asyncio
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+from completion import INIT_SCRIPTS_DIR
+from process_memory import chromium_processes, rss_bytes
+
+INIT_SCRIPT = (INIT_SCRIPTS_DIR / "memory.js").read_text()
+# Eager measurement makes measureUserAgentSpecificMemory() answer at once
+# instead of waiting for the next GC; expose-gc lets workers be collected.
+LAUNCH_ARGS = [
+    "--enable-blink-features=ForceEagerMeasureMemory",
+    "--enable-precise-memory-info",
+    "--js-flags=--expose-gc",
+]
+HISTORY_PATH = Path(__file__).resolve().parent / ".cache" / "memory.json"
+HISTORY_RUNS = 10
+# Flag growth beyond 20% of the usual after-GC heap, ignoring growth under 1 MiB.
+GROWTH_RATIO = 1.2
+GROWTH_MIN_BYTES = 1024 * 1024
+SAMPLE_INTERVAL = 0.25
+GC_TIMEOUT = 2.0
+
+
+def browser_rss():
+    """Total RSS of this process's Chromium processes, or ``None`` off Linux."""
+    sizes = rss_bytes(chromium_processes())
+    return sum(sizes.values()) if sizes else None
+
+
+class MemoryMonitor:
+    """Track one page's memory from ``start()`` until ``finish()``."""
+
+    def __init__(self, page, interval=SAMPLE_INTERVAL):
+        self.page = page
+        self.interval = interval
+        self.rss_peak = None
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._sample_rss())
+
+    async def _sample_rss(self):
+        while True:
+            rss = await asyncio.to_thread(browser_rss)
+            if rss is not None:
+                self.rss_peak = max(self.rss_peak or 0, rss)
+            await asyncio.sleep(self.interval)
+
+    async def collect_garbage(self):
+        session = await self.page.context.new_cdp_session(self.page)
+        try:
+            await session.send("HeapProfiler.collectGarbage")
+        finally:
+            await session.detach()
+        for worker in self.page.workers:
+            try:
+                await asyncio.wait_for(worker.evaluate("() => globalThis.gc && gc()"), GC_TIMEOUT)
+            except Exception:
+                # A worker stuck in a long computation cannot be collected now.
+                pass
+
+    async def finish(self):
+        """Stop sampling and return the peak and after-GC memory of the run."""
+        self._task.cancel()
+        sampled = await self.page.evaluate("() => window.__memory ? window.__memory.stop() : null")
+        after = None
+        try:
+            await self.collect_garbage()
+            after = await self.page.evaluate("() => window.__memory ? window.__memory.measure() : null")
+        except Exception:
+            pass
+        rss_after = await asyncio.to_thread(browser_rss)
+        if sampled is None:
+            return None
+
+        workers = {
+            url: {
+                "peak": heap["peak"],
+                "after_gc": after["workers"].get(url, {}).get("last") if after else None,
+            }
+            for url, heap in sampled["workers"].items()
+        }
+        return {
+            "source": sampled["supported"],
+            "samples": sampled["samples"],
+            "page_heap": {"peak": sampled["page"]["peak"], "after_gc": after["page"]["last"] if after else None},
+            "workers": workers,
+            "worker_heap_peak": sum(heap["peak"] for heap in workers.values()),
+            "browser_rss": {"peak": max(filter(None, [self.rss_peak, rss_after]), default=None),
+                            "after_gc": rss_after},
+        }
+
+
+def heap_after_gc(memory):
+    """The page's and its workers' heap after GC, or ``None`` if not measured."""
+    page = memory["page_heap"]["after_gc"]
+    if page is None:
+        return None
+    return page + sum(heap["after_gc"] or 0 for heap in memory["workers"].values())
+
+
+class MemoryHistory:
+    """After-GC memory of the last ``HISTORY_RUNS`` runs of each example."""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = Path(path)
+        try:
+            self.runs = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.runs = {}
+
+    def check(self, entry, memory):
+        """Record a run and return a growth warning, or ``None``."""
+        heap = heap_after_gc(memory)
+        rss = memory["browser_rss"]["after_gc"]
+        previous = [run for run in self.runs.get(entry["id"], []) if run["hash"] == entry["hash"]]
+        runs = self.runs.setdefault(entry["id"], [])
+        runs.append({"hash": entry["hash"], "time": time.time(), "heap_after_gc": heap, "rss_after_gc": rss})
+        del runs[:-HISTORY_RUNS]
+
+        warnings = []
+        for name, value, key in (("JS heap", heap, "heap_after_gc"), ("browser RSS", rss, "rss_after_gc")):
+            earlier = [run[key] for run in previous if run[key] is not None]
+            if value is None or not earlier:
+                continue
+            usual = statistics.median(earlier)
+            if value > usual * GROWTH_RATIO and value - usual > GROWTH_MIN_BYTES:
+                warnings.append(f"{name} after GC grew from {usual / 1024 / 1024:.1f} MiB "
+                                f"to {value / 1024 / 1024:.1f} MiB")
+        return "; ".join(warnings) or None
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.runs))
+        os.replace(tmp_path, self.path)
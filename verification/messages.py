@@ -0,0 +1,118 @@
+"""Collect worker message traffic from example pages.
+
+``INIT_SCRIPT`` (``init_scripts/messages.js``) wraps ``Worker`` so every
+message sent to or received from a dedicated worker is counted and sized,
+transfer lists are checked for buffers that really were detached, and each
+reply is timed against the request it answers. ``collect_traffic`` reads
+those counters back into a per-example report; ``run_all.py --messages``
+stores it in the runner report under ``"messages"``.
+
+    python verification/messages.py verification/output/results.json
+    python verification/messages.py verification/output/results.json --sort clone
+"""
+import argparse
+import json
+from pathlib import Path
+
+from benchmarks import percentile
+from completion import INIT_SCRIPTS_DIR
+
+INIT_SCRIPT = (INIT_SCRIPTS_DIR / "messages.js").read_text()
+
+SORT_KEYS = {
+    "messages": lambda report: report["sent"] + report["received"],
+    "bytes": lambda report: report["sent_bytes"] + report["received_bytes"],
+    "clone": lambda report: report["cloned_buffer_bytes"],
+    "rtt": lambda report: report["rtt_ms"]["p95"] if report["rtt_ms"] else 0,
+}
+
+
+def _distribution(samples):
+    if not samples:
+        return None
+    return {
+        "n": len(samples),
+        "p50": percentile(samples, 0.50),
+        "p95": percentile(samples, 0.95),
+        "max": max(samples),
+    }
+
+
+def summarize_traffic(workers):
+    """Fold the per-worker counters from the page into one example report."""
+    totals = {
+        key: sum(worker[source] for worker in workers)
+        for key, source in (
+            ("sent", "sent"),
+            ("received", "received"),
+            ("sent_bytes", "sentBytes"),
+            ("received_bytes", "receivedBytes"),
+            ("transferred", "transferred"),
+            ("transferred_bytes", "transferredBytes"),
+            ("cloned_buffer_bytes", "clonedBufferBytes"),
+            ("shared_bytes", "sharedBytes"),
+            ("unanswered", "unanswered"),
+        )
+    }
+    return {
+        "workers": len(workers),
+        **totals,
+        "sent_size": _distribution([size for worker in workers for size in worker["sentSizes"]]),
+        "received_size": _distribution([size for worker in workers for size in worker["receivedSizes"]]),
+        "rtt_ms": _distribution([rtt for worker in workers for rtt in worker["rtts"]]),
+        "by_worker": [
+            {
+                "url": worker["url"],
+                "sent": worker["sent"],
+                "received": worker["received"],
+                "transferred": worker["transferred"],
+                "rtt_ms": _distribution(worker["rtts"]),
+            }
+            for worker in workers
+        ],
+    }
+
+
+async def collect_traffic(page):
+    """Return the message-traffic report for ``page``, or ``None`` if it was not instrumented."""
+    workers = await page.evaluate("() => window.__messageTraffic ? window.__messageTraffic.report() : null")
+    return None if workers is None else summarize_traffic(workers)
+
+
+def _size(n):
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024 or unit == "MiB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the worker message traffic recorded by run_all.py --messages.")
+    parser.add_argument("results", type=Path, help="runner report (results*.json)")
+    parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="bytes")
+    parser.add_argument("--top", type=int, default=0, help="only print this many examples (default: all)")
+    args = parser.parse_args()
+
+    reports = [result for result in json.loads(args.results.read_text()) if result.get("messages")]
+    if not reports:
+        print(f"No message traffic in {args.results}; run run_all.py with --messages.")
+        return 1
+    reports.sort(key=lambda result: SORT_KEYS[args.sort](result["messages"]), reverse=True)
+    if args.top:
+        reports = reports[: args.top]
+
+    print("workers   sent   recv        out         in   transfers  cloned bufs  rtt p50  rtt p95  example")
+    for result in reports:
+        report = result["messages"]
+        rtt = report["rtt_ms"]
+        print(
+            f"{report['workers']:7d} {report['sent']:6d} {report['received']:6d} "
+            f"{_size(report['sent_bytes']):>10} {_size(report['received_bytes']):>10} "
+            f"{report['transferred']:11d} {_size(report['cloned_buffer_bytes']):>12} "
+            f"{rtt['p50'] if rtt else 0:8.2f} {rtt['p95'] if rtt else 0:8.2f}  {result['example']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
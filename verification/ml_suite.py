@@ -0,0 +1,576 @@
+"""Benchmark 12-machine-learning workers on larger seeded datasets.
+
+The examples train on toy data their workers draw with ``Math.random()``.
+Here each example's own ``worker.js`` runs inside a wrapper worker that
+first seeds ``Math.random`` (``init_scripts/seeded_random.js``) and, after
+loading the example, accepts a ``__load`` message that replaces its
+``trainData`` with a dataset generated here with NumPy from ``--seed``,
+following the example's own distribution at several sizes. The page's
+usual ``train``/``compute``/``serialize`` message then runs on that data.
+
+Every case reports samples per second for training and, where the example
+has an inference step, for inference, next to a vectorized NumPy baseline
+on the same data and the ratio between the two, and checks the worker's
+final loss or accuracy against the baseline's:
+
+- 971 linear regression: the same batch gradient descent, loss must match.
+- 973 logistic regression: IRLS fit, accuracy within 2 points.
+- 975 random forest: one Gini tree of the same depth, accuracy within 5 points.
+- 978 k-nearest neighbours: every grid pixel must get the same class.
+- 981 XOR perceptron: fixed 4-point data; batch training of the same network,
+  the worker must classify at least as many corners.
+- 1000 model serialization: the JSON must parse back to the requested shape
+  of float32 weights; the baseline is ``json.dumps`` of the same model.
+
+Workers that pause to let the page redraw (971, 973 and 981 sleep 10 ms
+after each progress message) have those pauses taken out of their time.
+
+    python verification/ml_suite.py --serve
+    python verification/ml_suite.py --serve --filter 978 --scale 2 --seed 7
+"""
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from engine import VerificationEngine
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+CATEGORY = "12-machine-learning"
+TIMEOUT_MS = 600000
+# The sleep each progress message is followed by in 971, 973 and 981.
+PAUSE_MS = 10
+LOSS_RTOL = 1e-6
+LOGISTIC_TOLERANCE = 0.02
+FOREST_TOLERANCE = 0.05
+IRLS_ITERATIONS = 25
+KNN_AGREEMENT = 0.999
+# Dataset sizes per example before --scale.
+SIZES = {
+    "971-linear-regression": [1000, 10000, 100000],
+    "973-logistic-regression": [1000, 10000, 50000],
+    "975-random-forest": [300, 1000, 2000],
+    "978-k-nearest-neighbors": [50, 500, 2000],
+    "1000-model-serialization": [10, 50, 100],
+}
+
+RUN_WORKER = """
+async ({ example, seed, data, steps, timeoutMs }) => {
+  const origin = location.origin;
+  const source = `self.__randomSeed = ${seed};
+importScripts('${origin}/verification/init_scripts/seeded_random.js', '${origin}/examples/${example}/worker.js');
+self.addEventListener('message', (event) => {
+  if (event.data && event.data.command === '__load') {
+    trainData = event.data.data;
+    self.postMessage({ type: '__loaded' });
+  }
+});`;
+  const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+  const worker = new Worker(url);
+  const plain = (value) => {
+    if (ArrayBuffer.isView(value)) return Array.from(value);
+    if (Array.isArray(value)) return value.map(plain);
+    if (value && typeof value === 'object') {
+      return Object.fromEntries(Object.entries(value).map(([key, item]) => [key, plain(item)]));
+    }
+    return value;
+  };
+  // Post one message and wait for the reply of type `until`, counting and
+  // keeping the last message of every type seen on the way.
+  const run = (message, until) => new Promise((resolve, reject) => {
+    const counts = {};
+    const last = {};
+    let started = 0;
+    const timer = setTimeout(() => reject(new Error(`no ${until} reply within ${timeoutMs} ms`)), timeoutMs);
+    worker.onmessage = (event) => {
+      const type = event.data && event.data.type;
+      counts[type] = (counts[type] || 0) + 1;
+      last[type] = event.data;
+      if (type === 'error') {
+        clearTimeout(timer);
+        reject(new Error(String(event.data.data)));
+      } else if (type === until) {
+        clearTimeout(timer);
+        resolve({ ms: performance.now() - started, counts, last: plain(last) });
+      }
+    };
+    worker.onerror = (event) => {
+      clearTimeout(timer);
+      reject(new Error(event.message));
+    };
+    started = performance.now();
+    worker.postMessage(message);
+  });
+  try {
+    if (data) await run({ command: '__load', data }, '__loaded');
+    const replies = [];
+    for (const [message, until] of steps) replies.push(await run(message, until));
+    return replies;
+  } finally {
+    worker.terminate();
+    URL.revokeObjectURL(url);
+  }
+}
+"""
+
+
+def _timed(function, *args):
+    started = time.perf_counter()
+    value = function(*args)
+    return value, (time.perf_counter() - started) * 1000
+
+
+def throughput(samples, ms):
+    return {"samples": int(samples), "ms": round(ms, 2),
+            "samples_per_s": round(samples / (ms / 1000), 1) if ms > 0 else None}
+
+
+def busy_ms(reply, progress_type):
+    """A reply's time without the pauses the worker takes after each progress message."""
+    return max(reply["ms"] - reply["counts"].get(progress_type, 0) * PAUSE_MS, 0.0)
+
+
+def points(X, labels=None):
+    if labels is None:
+        return [{"x": float(x), "y": float(y)} for x, y in X]
+    return [{"x": float(x), "y": float(y), "label": int(label)} for (x, y), label in zip(X, labels)]
+
+
+# 971 ---------------------------------------------------------------------
+
+def linear_reference(x, y, learning_rate, max_epochs=2000):
+    """971's batch gradient descent from m = b = 0, vectorized over the samples."""
+    m = b = 0.0
+    n = len(x)
+    reported = None
+    for epoch in range(max_epochs + 1):
+        error = m * x + b - y
+        mse = float(error @ error) / n
+        m -= learning_rate * 2 * float(error @ x) / n
+        b -= learning_rate * 2 * float(error.sum()) / n
+        if epoch % 20 == 0:
+            reported = {"epoch": epoch, "loss": mse, "m": m, "b": b}
+        if mse < 0.0001:
+            break
+    return reported, epoch + 1
+
+
+def linear_case(n, rng, learning_rate=0.1, noise=30):
+    x = rng.random(n)
+    y = 0.8 * x + 0.1 + (rng.random(n) - 0.5) * (noise / 100)
+
+    def score(replies):
+        (reference, epochs), reference_ms = _timed(linear_reference, x, y, learning_rate)
+        reply = replies[0]
+        final = reply["last"]["epoch"]["data"]
+        slope, intercept = np.polyfit(x, y, 1)
+        optimum = float(np.mean((slope * x + intercept - y) ** 2))
+        matched = (final["epoch"] == reference["epoch"]
+                   and abs(final["loss"] - reference["loss"]) <= LOSS_RTOL * max(reference["loss"], 1e-12))
+        return {
+            "passed": matched,
+            "metric": "loss", "worker": final["loss"], "reference": reference["loss"],
+            "least_squares_loss": optimum, "epochs": epochs,
+            "train": throughput(n * epochs, busy_ms(reply, "epoch")),
+            "reference_train": throughput(n * epochs, reference_ms),
+        }
+
+    return {"data": points(np.column_stack([x, y])),
+            "steps": [({"command": "train", "learningRate": learning_rate}, "done")], "score": score}
+
+
+# 973 ---------------------------------------------------------------------
+
+def two_clusters(n, rng, size=500):
+    """973's generator: two uniform squares on the canvas diagonal, classes interleaved."""
+    half = n // 2
+    X = np.empty((2 * half, 2))
+    X[0::2] = size / 3 + (rng.random((half, 2)) - 0.5) * size / 3
+    X[1::2] = 2 * size / 3 + (rng.random((half, 2)) - 0.5) * size / 3
+    labels = np.tile([0, 1], half)
+    return X, labels
+
+
+def logistic_reference(X, labels, iterations=IRLS_ITERATIONS, ridge=1e-3):
+    """Ridge-regularised logistic regression by IRLS on 973's normalised inputs."""
+    A = np.column_stack([X / 500, np.ones(len(X))])
+    w = np.zeros(A.shape[1])
+    for _ in range(iterations):
+        p = 1 / (1 + np.exp(-(A @ w)))
+        gradient = A.T @ (p - labels) / len(A) + ridge * w
+        hessian = (A * (p * (1 - p))[:, None]).T @ A / len(A) + ridge * np.eye(A.shape[1])
+        w -= np.linalg.solve(hessian, gradient)
+    p = 1 / (1 + np.exp(-(A @ w)))
+    accuracy = float(np.mean((p >= 0.5) == labels))
+    loss = float(-np.mean(labels * np.log(p + 1e-15) + (1 - labels) * np.log(1 - p + 1e-15)))
+    return accuracy, loss
+
+
+def logistic_case(n, rng, learning_rate=0.05, epochs=200):
+    X, labels = two_clusters(n, rng)
+
+    def score(replies):
+        (accuracy, loss), reference_ms = _timed(logistic_reference, X, labels)
+        reply = replies[0]
+        final = reply["last"]["step"]["data"]
+        return {
+            "passed": final["accuracy"] >= accuracy - LOGISTIC_TOLERANCE,
+            "metric": "accuracy", "worker": final["accuracy"], "reference": accuracy,
+            "worker_loss": final["loss"], "reference_loss": loss,
+            "train": throughput(len(X) * (epochs + 1), busy_ms(reply, "step")),
+            "reference_train": throughput(len(X) * IRLS_ITERATIONS, reference_ms),
+        }
+
+    return {"data": points(X, labels),
+            "steps": [({"command": "train", "learningRate": learning_rate, "epochs": epochs}, "done")],
+            "score": score}
+
+
+# 975 ---------------------------------------------------------------------
+
+def blobs(n, rng, size=500, classes=3, spread=30):
+    """975's generator: Gaussian blobs around random centres, one per class."""
+    per_class = n // classes
+    centres = rng.random((classes, 2)) * size
+    X = np.concatenate([centre + rng.standard_normal((per_class, 2)) * spread for centre in centres])
+    return X, np.repeat(np.arange(classes), per_class)
+
+
+def gini_tree(X, labels, max_depth, classes):
+    """A Gini decision tree split the way 975's is, scoring every split of a node at once."""
+    def build(index, depth):
+        counts = np.bincount(labels[index], minlength=classes)
+        if np.count_nonzero(counts) <= 1 or depth >= max_depth or len(index) < 2:
+            return int(counts.argmax())
+        n = len(index)
+        left_sizes = np.arange(1, n)[:, None]
+        best = (np.inf, None, None)
+        for feature in range(X.shape[1]):
+            order = index[np.argsort(X[index, feature], kind="stable")]
+            left = np.cumsum(np.eye(classes)[labels[order]], axis=0)[:-1]
+            right = counts - left
+            gini = (left_sizes / n * (1 - ((left / left_sizes) ** 2).sum(axis=1, keepdims=True))
+                    + (n - left_sizes) / n * (1 - ((right / (n - left_sizes)) ** 2).sum(axis=1, keepdims=True)))
+            i = int(np.argmin(gini))
+            if gini[i, 0] < best[0]:
+                values = X[order, feature]
+                best = (gini[i, 0], feature, (values[i] + values[i + 1]) / 2)
+        _, feature, split = best
+        below = X[index, feature] < split
+        return feature, split, build(index[below], depth + 1), build(index[~below], depth + 1)
+
+    return build(np.arange(len(X)), 0)
+
+
+def tree_predict(node, X):
+    if isinstance(node, int):
+        return np.full(len(X), node)
+    feature, split, left, right = node
+    below = X[:, feature] < split
+    predicted = np.empty(len(X), dtype=np.int64)
+    predicted[below] = tree_predict(left, X[below])
+    predicted[~below] = tree_predict(right, X[~below])
+    return predicted
+
+
+def forest_case(n, rng, n_trees=10, max_depth=5):
+    X, labels = blobs(n, rng)
+
+    def score(replies):
+        tree, reference_ms = _timed(gini_tree, X, labels, max_depth, 3)
+        accuracy = float(np.mean(tree_predict(tree, X) == labels))
+        reply = replies[0]
+        final = reply["last"]["result"]["data"]
+        return {
+            "passed": final["accuracy"] >= accuracy - FOREST_TOLERANCE,
+            "metric": "accuracy", "worker": final["accuracy"], "reference": accuracy,
+            # Each tree trains on a bootstrap sample as large as the dataset;
+            # the worker's time also covers its accuracy pass and heatmap.
+            "train": throughput(len(X) * n_trees, reply["ms"]),
+            "reference_train": throughput(len(X), reference_ms),
+        }
+
+    return {"data": points(X, labels),
+            "steps": [({"command": "train", "nTrees": n_trees, "maxDepth": max_depth}, "result")],
+            "score": score}
+
+
+# 978 ---------------------------------------------------------------------
+
+def knn_reference(X, labels, k, width, height, classes=3, chunk=1024):
+    """978's classification of every pixel, a chunk of pixels at a time."""
+    ys, xs = np.mgrid[0:height, 0:width]
+    queries = np.column_stack([xs.ravel(), ys.ravel()]).astype(np.float64)
+    predicted = np.empty(len(queries), dtype=np.uint8)
+    for start in range(0, len(queries), chunk):
+        block = queries[start:start + chunk]
+        dx = X[None, :, 0] - block[:, 0:1]
+        dy = X[None, :, 1] - block[:, 1:2]
+        nearest = np.argsort(dx * dx + dy * dy, axis=1, kind="stable")[:, :k]
+        votes = (labels[nearest][..., None] == np.arange(classes)).sum(axis=1)
+        predicted[start:start + chunk] = votes.argmax(axis=1)
+    return predicted
+
+
+def knn_case(n, rng, k=3, width=100, height=100):
+    X = rng.random((n, 2)) * [width, height]
+    labels = rng.integers(0, 3, n)
+
+    def score(replies):
+        predicted, reference_ms = _timed(knn_reference, X, labels, k, width, height)
+        final = replies[0]["last"]["result"]["data"]
+        agreement = float(np.mean(np.asarray(final["map"], dtype=np.uint8) == predicted))
+        return {
+            "passed": agreement >= KNN_AGREEMENT,
+            "metric": "agreement", "worker": agreement, "reference": 1.0,
+            "inference": throughput(width * height, float(final["duration"])),
+            "reference_inference": throughput(width * height, reference_ms),
+        }
+
+    return {"data": points(X, labels),
+            "steps": [({"command": "compute", "k": k, "width": width, "height": height}, "result")],
+            "score": score}
+
+
+# 981 ---------------------------------------------------------------------
+
+XOR_INPUTS = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=np.float64)
+XOR_TARGETS = np.array([0, 1, 1, 0], dtype=np.float64)
+
+
+def sigmoid(z):
+    return 1 / (1 + np.exp(-z))
+
+
+ACTIVATIONS = {
+    "sigmoid": (sigmoid, lambda z: sigmoid(z) * (1 - sigmoid(z))),
+    "tanh": (np.tanh, lambda z: 1 - np.tanh(z) ** 2),
+    "relu": (lambda z: np.maximum(z, 0), lambda z: (z > 0).astype(np.float64)),
+}
+
+
+def xor_reference(hidden, activation, epochs, seed, learning_rate=0.1):
+    """981's network trained on all four XOR points per step instead of four random draws."""
+    rng = np.random.default_rng(seed)
+    f, df = ACTIVATIONS[activation]
+    W1 = rng.uniform(-1, 1, (hidden, 2))
+    b1 = np.zeros(hidden)
+    W2 = rng.uniform(-1, 1, hidden)
+    b2 = 0.0
+    for _ in range(epochs):
+        z1 = XOR_INPUTS @ W1.T + b1
+        a1 = f(z1)
+        out = sigmoid(a1 @ W2 + b2)
+        delta2 = (out - XOR_TARGETS) * out * (1 - out)
+        delta1 = delta2[:, None] * W2[None, :] * df(z1)
+        W2 -= learning_rate * a1.T @ delta2
+        b2 -= learning_rate * delta2.sum()
+        W1 -= learning_rate * delta1.T @ XOR_INPUTS
+        b1 -= learning_rate * delta1.sum(axis=0)
+    out = sigmoid(f(XOR_INPUTS @ W1.T + b1) @ W2 + b2)
+    return float(np.mean((out >= 0.5) == XOR_TARGETS)), float(np.mean((out - XOR_TARGETS) ** 2))
+
+
+def corner_accuracy(heatmap, grid_size):
+    """How many XOR points the worker's heatmap classifies right, read at the nearest cells."""
+    correct = 0
+    for (x, y), target in zip(XOR_INPUTS, XOR_TARGETS):
+        column = round((x + 0.1) / 1.2 * grid_size)
+        row = round((1.1 - y) / 1.2 * grid_size)
+        correct += (heatmap[row * grid_size + column] >= 0.5) == target
+    return correct / len(XOR_TARGETS)
+
+
+def xor_case(hidden, seed, activation="sigmoid"):
+    def score(replies):
+        reply = replies[0]
+        final = reply["last"]["epoch"]["data"]
+        epochs = final["epoch"] + 1
+        (accuracy, loss), reference_ms = _timed(xor_reference, hidden, activation, epochs, seed)
+        worker_accuracy = corner_accuracy(final["heatmap"], final["gridSize"])
+        return {
+            "passed": worker_accuracy >= accuracy,
+            "metric": "accuracy", "worker": worker_accuracy, "reference": accuracy,
+            "worker_loss": final["loss"], "reference_loss": loss, "epochs": epochs,
+            # The worker's time also covers the 50x50 heatmap it draws every 100 epochs.
+            "train": throughput(4 * epochs, busy_ms(reply, "epoch")),
+            "reference_train": throughput(4 * epochs, reference_ms),
+        }
+
+    return {"data": None,
+            "steps": [({"command": "train", "hidden": hidden, "activation": activation}, "done")],
+            "score": score}
+
+
+# 1000 --------------------------------------------------------------------
+
+def serialization_reference(layers, weights_per_layer, rng):
+    """The same model built with NumPy and written with ``json.dumps``."""
+    weights = rng.random((layers, weights_per_layer), dtype=np.float32) * 2 - 1
+    model = {"architecture": "Simulated Deep Neural Network", "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+             "layers": [{"id": f"layer_{i}", "type": "dense", "activation": "relu", "weights": row.tolist()}
+                        for i, row in enumerate(weights)]}
+    return json.dumps(model, separators=(",", ":"))
+
+
+def serialization_problems(reply, layers, weights_per_layer):
+    text = reply["data"]
+    problems = []
+    if len(text.encode("utf-8")) != reply["size"]:
+        problems.append(f"reported size {reply['size']} but the JSON is {len(text.encode('utf-8'))} bytes")
+    model = json.loads(text)
+    if len(model["layers"]) != layers:
+        return problems + [f"{len(model['layers'])} layers, expected {layers}"]
+    short = [layer["id"] for layer in model["layers"] if len(layer["weights"]) != weights_per_layer]
+    if short:
+        return problems + [f"{len(short)} layers without {weights_per_layer} weights, first {short[0]}"]
+    weights = np.array([layer["weights"] for layer in model["layers"]], dtype=np.float64)
+    if np.any(np.abs(weights) > 1):
+        problems.append("weights outside [-1, 1]")
+    if np.any(weights.astype(np.float32).astype(np.float64) != weights):
+        problems.append("weights that are not float32 values")
+    return problems
+
+
+def serialization_case(layers, rng, weights_per_layer=10000):
+    def score(replies):
+        reply = replies[0]["last"]["success"]
+        problems = serialization_problems(reply, layers, weights_per_layer)
+        reference, reference_ms = _timed(serialization_reference, layers, weights_per_layer, rng)
+        result = {
+            "passed": not problems,
+            "metric": "bytes", "worker": reply["size"], "reference": len(reference.encode("utf-8")),
+            "train": throughput(layers * weights_per_layer, float(reply["duration"])),
+            "reference_train": throughput(layers * weights_per_layer, reference_ms),
+        }
+        if problems:
+            result["problems"] = problems
+        return result
+
+    return {"data": None,
+            "steps": [({"command": "serialize", "modelSize": layers, "weightsPerLayer": weights_per_layer,
+                        "prettyPrint": False}, "success")],
+            "score": score}
+
+
+def build_cases(seed, scale):
+    def sizes(example):
+        return [max(int(size * scale), 3) for size in SIZES[example]]
+
+    cases = []
+
+    def add(example, size, case):
+        cases.append({"example": f"{CATEGORY}/{example}", "size": size, **case})
+
+    for n in sizes("971-linear-regression"):
+        add("971-linear-regression", n, linear_case(n, np.random.default_rng(seed)))
+    for n in sizes("973-logistic-regression"):
+        add("973-logistic-regression", n, logistic_case(n, np.random.default_rng(seed)))
+    for n in sizes("975-random-forest"):
+        add("975-random-forest", n, forest_case(n, np.random.default_rng(seed)))
+    for n in sizes("978-k-nearest-neighbors"):
+        add("978-k-nearest-neighbors", n, knn_case(n, np.random.default_rng(seed)))
+    for hidden in (4, 10):
+        add("981-multilayer-perceptron", hidden, xor_case(hidden, seed))
+    for layers in sizes("1000-model-serialization"):
+        add("1000-model-serialization", layers, serialization_case(layers, np.random.default_rng(seed)))
+    return cases
+
+
+def speed_ratio(result):
+    """The worker's throughput as a fraction of the NumPy baseline's."""
+    for kind in ("inference", "train"):
+        worker, reference = result.get(kind), result.get(f"reference_{kind}")
+        if worker and reference and worker["samples_per_s"] and reference["samples_per_s"]:
+            return round(worker["samples_per_s"] / reference["samples_per_s"], 4)
+    return None
+
+
+async def check_case(page, case, options):
+    result = {"example": case["example"], "size": case["size"]}
+    try:
+        replies = await page.evaluate(RUN_WORKER, {
+            "example": case["example"], "seed": options.seed, "data": case["data"],
+            "steps": case["steps"], "timeoutMs": options.timeout * 1000,
+        })
+        scored = case["score"](replies)
+        result["status"] = "passed" if scored.pop("passed") else "failed"
+        result.update(scored)
+        result["of_reference"] = speed_ratio(result)
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    return result
+
+
+async def run_all(cases, options):
+    async def job(page, case):
+        await page.goto(f"{options.base_url}/examples/{case['example']}/index.html")
+        return await check_case(page, case, options)
+
+    # One case at a time so the timings do not compete for cores.
+    results = []
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for result in engine.imap(job, cases):
+            results.append(result)
+            print_result(result)
+    return sorted(results, key=lambda result: (result["example"], result["size"]))
+
+
+def print_result(result):
+    label = f"{result['example']} [{result['size']}]"
+    if "error" in result:
+        print(f"FAILED {label}: {result['error']}")
+        return
+    measured = result.get("inference") or result.get("train")
+    ratio = f" ({result['of_reference']:.2%} of NumPy)" if result["of_reference"] is not None else ""
+    print(f"{result['status'].upper()} {label}: {result['metric']} {result['worker']} vs {result['reference']}, "
+          f"{measured['samples_per_s']} samples/s{ratio}")
+    for problem in result.get("problems", []):
+        print(f"  {problem}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 12-machine-learning workers on seeded datasets.")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run examples whose id contains this text (repeatable)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the datasets and the workers' Math.random")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every dataset size by this (default: 1)")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_MS / 1000,
+                        help="seconds to wait for a worker to finish one case (default: 600)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    cases = [case for case in build_cases(args.seed, args.scale)
+             if not args.filter or any(text in case["example"] for text in args.filter)]
+    if not cases:
+        print("No machine-learning cases selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Running {len(cases)} machine-learning cases...")
+    results = asyncio.run(run_all(cases, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "ml.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed, "scale": args.scale,
+              "results": results}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] == "failed")
+    print("-" * 20)
+    print(f"{len(results) - failed} passed, {failed} failed; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
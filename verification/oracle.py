@@ -0,0 +1,346 @@
+"""Check numeric worker results from 01-computation against NumPy.
+
+For each supported example the oracle generates seeded inputs, posts them to
+the example's own ``worker.js`` from inside its page, and compares what the
+worker answers with a vectorised NumPy reference. Reference results are
+cached in ``verification/.cache/oracle/`` as ``.npz`` files keyed by the
+example and the input parameters, so large matrix and FFT cases are only
+computed once.
+
+    python verification/oracle.py
+    python verification/oracle.py --filter 063 --size 512
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from engine import VerificationEngine
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = REPO_ROOT / "verification" / ".cache" / "oracle"
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+TIMEOUT_MS = 120000
+# Bump when a reference function changes so stale cache entries are ignored.
+ORACLE_VERSION = 1
+
+RUN_IN_WORKER = """
+async ([message, timeoutMs]) => new Promise((resolve, reject) => {
+  const worker = new Worker('worker.js');
+  const timer = setTimeout(() => {
+    worker.terminate();
+    reject(new Error(`worker did not answer within ${timeoutMs} ms`));
+  }, timeoutMs);
+  const finish = (callback, value) => {
+    clearTimeout(timer);
+    worker.terminate();
+    callback(value);
+  };
+  worker.onmessage = (event) => {
+    if (event.data.type === 'result') finish(resolve, event.data.result);
+    else if (event.data.type === 'error') finish(reject, new Error(event.data.message));
+  };
+  worker.onerror = (event) => finish(reject, new Error(event.message));
+  worker.postMessage(message);
+})
+"""
+
+
+def _rng(params):
+    return np.random.default_rng(params["seed"])
+
+
+def _next_power_of_two(n):
+    return 1 << (n - 1).bit_length()
+
+
+def matmul_inputs(params):
+    rng = _rng(params)
+    n = params["size"]
+    return {
+        "matrixA": rng.integers(-10, 11, (n, n)).astype(float),
+        "matrixB": rng.integers(-10, 11, (n, n)).astype(float),
+    }
+
+
+def matmul_reference(data):
+    return {"product": data["matrixA"] @ data["matrixB"]}
+
+
+def matmul_observed(result, data):
+    return {"product": np.asarray(result["result"], dtype=float)}
+
+
+def lu_inputs(params):
+    # Diagonally dominant, so decompositions without pivoting stay stable,
+    # and close to the identity, so the determinant stays finite.
+    rng = _rng(params)
+    n = params["size"]
+    return {"matrix": np.eye(n) + rng.uniform(-0.5, 0.5, (n, n)) / n}
+
+
+def lu_reference(data):
+    sign, logdet = np.linalg.slogdet(data["matrix"])
+    return {"matrix": data["matrix"], "determinant": np.array(sign * np.exp(logdet))}
+
+
+def lu_observed(result, data):
+    product = np.asarray(result["L"], dtype=float) @ np.asarray(result["U"], dtype=float)
+    if result.get("P"):
+        # The worker factors P·A = L·U, where row i of P·A is row P[i] of A.
+        reconstructed = np.empty_like(product)
+        reconstructed[np.asarray(result["P"])] = product
+        product = reconstructed
+    return {"matrix": product, "determinant": np.array(result["determinant"], dtype=float)}
+
+
+def svd_inputs(params):
+    rng = _rng(params)
+    return {"matrix": rng.integers(-10, 11, (params["rows"], params["cols"])).astype(float), "numSingular": 0}
+
+
+def svd_reference(data):
+    return {"singular_values": np.linalg.svd(data["matrix"], compute_uv=False)}
+
+
+def svd_observed(result, data):
+    return {"singular_values": np.sort(np.asarray(result["singularValues"], dtype=float))[::-1]}
+
+
+def fft_inputs(params):
+    rng = _rng(params)
+    t = np.arange(params["length"]) / 1000
+    signal = np.sin(2 * np.pi * 50 * t) + 0.5 * np.sin(2 * np.pi * 120 * t) + rng.normal(0, 0.2, t.size)
+    return {"signal": signal}
+
+
+def fft_reference(data):
+    signal = data["signal"]
+    spectrum = np.fft.fft(signal, _next_power_of_two(signal.size))
+    return {"real": spectrum.real, "imag": spectrum.imag}
+
+
+def dft_reference(data):
+    spectrum = np.fft.fft(data["signal"])
+    return {"real": spectrum.real, "imag": spectrum.imag}
+
+
+def spectrum_observed(result, data):
+    return {"real": np.asarray(result["real"], dtype=float), "imag": np.asarray(result["imag"], dtype=float)}
+
+
+def integration_inputs(params):
+    # Samples of x·sin(x) + 2 on [a, b]; the worker only sees the samples.
+    a, b = params["a"], params["b"]
+    x = np.linspace(a, b, params["points"])
+    return {"values": x * np.sin(x) + 2, "a": a, "b": b}
+
+
+def trapezoidal_reference(data):
+    values = data["values"]
+    h = (data["b"] - data["a"]) / (values.size - 1)
+    return {"integral": np.array(h / 2 * (values[0] + values[-1] + 2 * values[1:-1].sum()))}
+
+
+def simpson_reference(data):
+    values = data["values"]
+    n = values.size - 1
+    n -= n % 2
+    h = (data["b"] - data["a"]) / n
+    v = values[: n + 1]
+    return {"integral": np.array(h / 3 * (v[0] + v[-1] + 4 * v[1:-1:2].sum() + 2 * v[2:-1:2].sum()))}
+
+
+def integration_observed(result, data):
+    return {"integral": np.array(result["integral"], dtype=float)}
+
+
+class Oracle:
+    """How to build inputs for one example's worker and what to expect back.
+
+    Each case is ``{"type", "params"}`` plus optional ``rtol``/``atol``
+    overrides; ``type`` is the message type the worker dispatches on.
+    """
+
+    def __init__(self, example, inputs, reference, observed, cases, rtol=1e-9, atol=1e-9):
+        self.example = example
+        self.inputs = inputs
+        self.reference = reference
+        self.observed = observed
+        self.cases = cases
+        self.rtol = rtol
+        self.atol = atol
+
+
+ORACLES = [
+    Oracle(
+        "01-computation/063-matrix-multiplication", matmul_inputs, matmul_reference, matmul_observed,
+        [{"type": algorithm, "params": {"size": 256, "seed": 1}} for algorithm in ("standard", "strassen", "block")],
+    ),
+    Oracle(
+        "01-computation/069-lu-decomposition", lu_inputs, lu_reference, lu_observed,
+        [{"type": algorithm, "params": {"size": 200, "seed": 2}} for algorithm in ("doolittle", "crout", "lup")],
+        rtol=1e-7, atol=1e-7,
+    ),
+    Oracle(
+        "01-computation/072-svd-decomposition", svd_inputs, svd_reference, svd_observed,
+        [
+            # Power iteration starts from a random vector and stops early, so it is only approximate.
+            {"type": "powerIteration", "params": {"rows": 40, "cols": 30, "seed": 3}, "rtol": 1e-3},
+            {"type": "golubKahan", "params": {"rows": 40, "cols": 30, "seed": 3}},
+            {"type": "jacobi", "params": {"rows": 40, "cols": 30, "seed": 3}},
+        ],
+        rtol=1e-6, atol=1e-6,
+    ),
+    Oracle(
+        "01-computation/050-fourier-analysis", fft_inputs, fft_reference, spectrum_observed,
+        [{"type": "fft", "params": {"length": 60000, "seed": 4}}],
+        rtol=1e-6, atol=1e-6,
+    ),
+    Oracle(
+        "01-computation/050-fourier-analysis", fft_inputs, dft_reference, spectrum_observed,
+        [{"type": "dft", "params": {"length": 2000, "seed": 5}}],
+        rtol=1e-6, atol=1e-6,
+    ),
+    Oracle(
+        "01-computation/058-numerical-integration", integration_inputs, trapezoidal_reference, integration_observed,
+        [{"type": "trapezoidal", "params": {"a": 0.0, "b": 10.0, "points": 200001}}],
+    ),
+    Oracle(
+        "01-computation/058-numerical-integration", integration_inputs, simpson_reference, integration_observed,
+        [{"type": "simpson", "params": {"a": 0.0, "b": 10.0, "points": 200001}}],
+    ),
+]
+
+
+def cache_key(oracle, params):
+    payload = json.dumps([ORACLE_VERSION, oracle.example, oracle.reference.__name__, params], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def reference_for(oracle, params, data, use_cache=True):
+    """Return the reference arrays for ``params``, computing them at most once."""
+    path = CACHE_DIR / f"{cache_key(oracle, params)}.npz"
+    if use_cache and path.exists():
+        with np.load(path) as cached:
+            return {name: cached[name] for name in cached.files}
+    reference = oracle.reference(data)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp.npz")
+    np.savez(tmp_path, **reference)
+    tmp_path.replace(path)
+    return reference
+
+
+def compare_arrays(observed, reference, rtol, atol):
+    """Compare every reference array with its observed counterpart."""
+    mismatches = {}
+    max_errors = {}
+    for name, expected in reference.items():
+        actual = observed.get(name)
+        if actual is None or actual.shape != expected.shape:
+            mismatches[name] = f"shape {None if actual is None else actual.shape} != {expected.shape}"
+            continue
+        # Scale the absolute tolerance with the magnitude of the reference.
+        scale = max(1.0, float(np.abs(expected).max(initial=0)))
+        error = np.abs(actual - expected)
+        max_errors[name] = float(error.max(initial=0))
+        if not np.all(error <= atol * scale + rtol * np.abs(expected)):
+            mismatches[name] = f"max abs error {max_errors[name]:.3g}"
+    return mismatches, max_errors
+
+
+def to_message(case, data):
+    return {
+        "type": case["type"],
+        "data": {key: value.tolist() if isinstance(value, np.ndarray) else value for key, value in data.items()},
+    }
+
+
+async def check_case(page, oracle, case, base_url, use_cache=True):
+    data = oracle.inputs(case["params"])
+    reference = reference_for(oracle, case["params"], data, use_cache)
+    await page.goto(f"{base_url}/examples/{oracle.example}/index.html")
+    started = time.perf_counter()
+    try:
+        result = await page.evaluate(RUN_IN_WORKER, [to_message(case, data), TIMEOUT_MS])
+        mismatches, max_errors = compare_arrays(
+            oracle.observed(result, data), reference,
+            case.get("rtol", oracle.rtol), case.get("atol", oracle.atol),
+        )
+    except Exception as e:
+        mismatches, max_errors = {"worker": str(e)}, {}
+    return {
+        "example": oracle.example,
+        "type": case["type"],
+        "params": case["params"],
+        "status": "failed" if mismatches else "passed",
+        "duration": round(time.perf_counter() - started, 3),
+        "max_abs_error": max_errors,
+        "mismatches": mismatches,
+    }
+
+
+async def run_all(jobs, base_url, concurrency, use_cache=True):
+    async def job(page, item):
+        oracle, case = item
+        return await check_case(page, oracle, case, base_url, use_cache)
+
+    results = []
+    async with VerificationEngine(concurrency=concurrency, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for result in engine.imap(job, jobs):
+            results.append(result)
+            print(f"{result['status'].upper()} {result['example']} [{result['type']}] ({result['duration']}s)")
+            for name, reason in result["mismatches"].items():
+                print(f"  {name}: {reason}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check 01-computation worker results against NumPy references.")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only check examples whose id contains this text (repeatable)")
+    parser.add_argument("--size", type=int, help="override the matrix size of the matrix examples")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--no-cache", action="store_true", help="recompute the NumPy references")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    jobs = []
+    for oracle in ORACLES:
+        if args.filter and not any(text in oracle.example for text in args.filter):
+            continue
+        for case in oracle.cases:
+            if args.size and "size" in case["params"]:
+                case = dict(case, params=dict(case["params"], size=args.size))
+            jobs.append((oracle, case))
+    if not jobs:
+        print("No oracle cases selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Checking {len(jobs)} worker results against NumPy...")
+    results = asyncio.run(run_all(jobs, args.base_url, args.concurrency, not args.no_cache))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "oracle.json"
+    report_path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] == "failed")
+    print("-" * 20)
+    print(f"{len(results) - failed} passed, {failed} failed; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,284 @@
+"""Compare image-processing results pixel for pixel against golden arrays.
+
+Full-page screenshots include layout and font noise and cannot tell a
+subtly wrong filter from a right one. This reads the example's result canvas
+as raw RGBA bytes instead, after feeding it a seeded test image from
+``fixtures.test_image`` through its file input, and compares the array with
+``verification/golden/pixels/<category>/<name>.npz`` using PSNR and SSIM.
+
+How to drive each example is read from its ``index.html``: the first file
+input, the first button that is not a reset/clear/download/demo button, and
+the result canvas (``resultCanvas``, ``result-canvas`` or
+``processedCanvas``). ``Math.random`` on the page is seeded
+(``init_scripts/seeded_random.js``); randomness inside workers is not, so
+noisy effects rely on the PSNR/SSIM thresholds.
+
+    python verification/pixel_golden.py --serve                 # 284-395
+    python verification/pixel_golden.py --serve --update        # accept the current output
+    python verification/pixel_golden.py --range 290-299 --size 320x240 --seed 1
+"""
+import argparse
+import asyncio
+import base64
+import json
+import math
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT, INIT_SCRIPTS_DIR, wait_for_completion
+from engine import VerificationEngine
+from fixtures import test_image
+from golden import GOLDEN_DIR, diff_heatmap
+from manifest import load_manifest, parse_range
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+PIXELS_DIR = GOLDEN_DIR / "pixels"
+BASE_URL = "http://localhost:8080"
+SEEDED_RANDOM_SCRIPT = (INIT_SCRIPTS_DIR / "seeded_random.js").read_text()
+DEFAULT_RANGE = (284, 395)
+DEFAULT_SIZE = (192, 144)
+
+# Output matching its golden array at least this closely passes.
+MIN_PSNR = 40.0
+MIN_SSIM = 0.98
+SSIM_WINDOW = 7
+
+_FILE_INPUT_RE = re.compile(r'<input\b[^>]*\btype="file"[^>]*>')
+_BUTTON_RE = re.compile(r'<button\b[^>]*\bid="([^"]+)"')
+_CANVAS_RE = re.compile(r'<canvas\b[^>]*\bid="([^"]+)"')
+_ID_RE = re.compile(r'\bid="([^"]+)"')
+_NOT_AN_ACTION = re.compile(r"reset|clear|download|demo|animate|naive", re.IGNORECASE)
+RESULT_CANVASES = ("resultCanvas", "result-canvas", "processedCanvas")
+
+READ_CANVAS = """
+(selector) => {
+  const canvas = document.querySelector(selector);
+  if (!canvas) throw new Error(`no canvas ${selector}`);
+  const { width, height } = canvas;
+  if (!width || !height) return { width, height, data: '' };
+  let context = canvas.getContext('2d');
+  if (!context) {
+    // A WebGL canvas: copy it onto a 2D one to read it back.
+    const copy = document.createElement('canvas');
+    copy.width = width;
+    copy.height = height;
+    context = copy.getContext('2d');
+    context.drawImage(canvas, 0, 0);
+  }
+  const data = context.getImageData(0, 0, width, height).data;
+  let binary = '';
+  for (let i = 0; i < data.length; i += 0x8000) {
+    binary += String.fromCharCode.apply(null, data.subarray(i, i + 0x8000));
+  }
+  return { width, height, data: btoa(binary) };
+}
+"""
+
+
+def parse_size(value):
+    """Parse ``192x144`` into ``(192, 144)``."""
+    width, _, height = value.partition("x")
+    try:
+        return int(width), int(height or width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"size must look like 192x144, got {value!r}")
+
+
+def pipeline(entry):
+    """Return ``{file_input, button, canvas}`` selectors for an example, or a reason it has none."""
+    html = (REPO_ROOT / "examples" / entry["id"] / "index.html").read_text(encoding="utf-8")
+    file_inputs = [_ID_RE.search(tag) for tag in _FILE_INPUT_RE.findall(html)]
+    file_inputs = [match.group(1) for match in file_inputs if match]
+    canvases = _CANVAS_RE.findall(html)
+    canvas = next((name for name in RESULT_CANVASES if name in canvases), None)
+    if not file_inputs:
+        return None, "no file input"
+    if canvas is None:
+        return None, "no result canvas"
+    button = next((name for name in _BUTTON_RE.findall(html) if not _NOT_AN_ACTION.search(name)), None)
+    return {
+        "file_input": f"#{file_inputs[0]}",
+        "button": f"#{button}" if button else None,
+        "canvas": f"#{canvas}",
+    }, None
+
+
+async def read_canvas(page, selector):
+    """Read a canvas as a ``(height, width, 4)`` uint8 RGBA array."""
+    canvas = await page.evaluate(READ_CANVAS, selector)
+    data = np.frombuffer(base64.b64decode(canvas["data"]), dtype=np.uint8)
+    return data.reshape(canvas["height"], canvas["width"], 4)
+
+
+def psnr(actual, expected):
+    """Peak signal-to-noise ratio over all RGBA channels, in dB."""
+    mse = np.mean((actual.astype(np.float64) - expected.astype(np.float64)) ** 2)
+    return math.inf if mse == 0 else 10 * math.log10(255.0 ** 2 / mse)
+
+
+def _luminance(rgba):
+    return rgba[..., :3].astype(np.float64) @ np.array([0.299, 0.587, 0.114])
+
+
+def ssim(actual, expected, window=SSIM_WINDOW):
+    """Mean structural similarity of the luminance over ``window`` x ``window`` blocks."""
+    x, y = _luminance(actual), _luminance(expected)
+    if min(x.shape) < window:
+        window = min(x.shape)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    view = np.lib.stride_tricks.sliding_window_view
+    xs, ys = view(x, (window, window)), view(y, (window, window))
+    mean_x, mean_y = xs.mean(axis=(-2, -1)), ys.mean(axis=(-2, -1))
+    var_x, var_y = xs.var(axis=(-2, -1)), ys.var(axis=(-2, -1))
+    cov = (xs * ys).mean(axis=(-2, -1)) - mean_x * mean_y
+    score = ((2 * mean_x * mean_y + c1) * (2 * cov + c2)) / ((mean_x ** 2 + mean_y ** 2 + c1) * (var_x + var_y + c2))
+    return float(score.mean())
+
+
+def golden_path(example):
+    return PIXELS_DIR / f"{example}.npz"
+
+
+def store(example, rgba, seed, size):
+    path = golden_path(example)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, rgba=rgba, seed=seed, size=np.array(size))
+
+
+def compare(example, rgba, seed, size, output_dir):
+    """Compare a result canvas with its golden array.
+
+    Returns a dict whose ``status`` is ``missing``, ``stale`` (the golden was
+    made from a different test image), ``identical``, ``within-tolerance``
+    or ``regressed``.
+    """
+    path = golden_path(example)
+    if not path.exists():
+        return {"status": "missing"}
+    with np.load(path) as golden:
+        if int(golden["seed"]) != seed or tuple(golden["size"]) != tuple(size):
+            return {"status": "stale"}
+        expected = golden["rgba"]
+    if rgba.shape != expected.shape:
+        return {"status": "regressed", "reason": f"canvas {rgba.shape[1::-1]} != {expected.shape[1::-1]}"}
+    if np.array_equal(rgba, expected):
+        return {"status": "identical"}
+
+    outcome = {"psnr": round(psnr(rgba, expected), 2), "ssim": round(ssim(rgba, expected), 4)}
+    if outcome["psnr"] >= MIN_PSNR and outcome["ssim"] >= MIN_SSIM:
+        return {"status": "within-tolerance", **outcome}
+
+    magnitude = np.abs(rgba.astype(np.int16) - expected).max(axis=2)
+    heatmap_path = output_dir / "pixels" / f"{example}.diff.png"
+    heatmap_path.parent.mkdir(parents=True, exist_ok=True)
+    diff_heatmap(rgba[..., :3].astype(np.int16), magnitude * (255.0 / max(magnitude.max(), 1))).save(heatmap_path)
+    return {"status": "regressed", **outcome, "heatmap": str(heatmap_path)}
+
+
+async def check_example(page, entry, steps, image, options):
+    started = time.perf_counter()
+    result = {"example": entry["id"], "canvas": steps["canvas"]}
+    try:
+        await page.goto(f"{options.base_url}/examples/{entry['id']}/index.html")
+        await page.set_input_files(steps["file_input"], str(image))
+        if steps["button"]:
+            await page.wait_for_selector(f"{steps['button']}:enabled", timeout=10000)
+            await page.click(steps["button"])
+        result["completion"] = await wait_for_completion(page, timeout=options.timeout)
+        rgba = await read_canvas(page, steps["canvas"])
+        if rgba.size == 0:
+            raise ValueError(f"{steps['canvas']} is empty")
+        if options.update:
+            store(entry["id"], rgba, options.seed, options.size)
+            result["status"] = "updated"
+        else:
+            result.update(compare(entry["id"], rgba, options.seed, options.size, options.output_dir))
+    except Exception as e:
+        result.update(status="error", reason=str(e))
+    result["duration"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+async def run_all(jobs, options):
+    async def job(page, item):
+        entry, steps = item
+        return await check_example(page, entry, steps, image, options)
+
+    image = test_image(*options.size, seed=options.seed)
+    seed_script = f"window.__randomSeed = {options.seed};\n{SEEDED_RANDOM_SCRIPT}"
+    results = []
+    async with VerificationEngine(concurrency=options.concurrency,
+                                  init_scripts=[COMPLETION_SCRIPT, seed_script]) as engine:
+        async for result in engine.imap(job, jobs):
+            results.append(result)
+            print_result(result)
+    return sorted(results, key=lambda result: result["example"])
+
+
+def print_result(result):
+    status = result["status"]
+    if status in ("identical", "updated"):
+        detail = ""
+    elif "psnr" in result:
+        detail = f": PSNR {result['psnr']} dB, SSIM {result['ssim']}"
+    else:
+        detail = f": {result['reason']}" if "reason" in result else ""
+    print(f"{status.upper()} {result['example']} ({result['duration']}s){detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare image-processing canvases against golden RGBA arrays.")
+    parser.add_argument("--range", type=parse_range, default=DEFAULT_RANGE,
+                        help="example numbers to check (default: 284-395)")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only check examples whose id contains this text (repeatable)")
+    parser.add_argument("--size", type=parse_size, default=DEFAULT_SIZE, help="test image size (default: 192x144)")
+    parser.add_argument("--seed", type=int, default=0, help="test image and Math.random seed (default: 0)")
+    parser.add_argument("--update", action="store_true", help="store the current canvases as golden arrays")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--timeout", type=int, default=15000, help="completion timeout per example in ms")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    entries = load_manifest().select(categories=["03-image-processing"], numbers=args.range, contains=args.filter)
+    jobs, skipped = [], {}
+    for entry in entries:
+        steps, reason = pipeline(entry)
+        if steps is None:
+            skipped[entry["id"]] = reason
+        else:
+            jobs.append((entry, steps))
+    for example, reason in sorted(skipped.items()):
+        print(f"SKIPPED {example}: {reason}")
+    if not jobs:
+        print("No image examples selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Reading result canvases of {len(jobs)} examples from a {args.size[0]}x{args.size[1]} test image...")
+    results = asyncio.run(run_all(jobs, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "pixel-golden.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed, "size": args.size,
+              "results": results, "skipped": skipped}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    print("-" * 20)
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) + f"; saved {report_path}")
+    return 1 if counts.get("regressed") or counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
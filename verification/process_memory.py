@@ -0,0 +1,95 @@
+"""Resident memory of the Chromium processes the harness launched.
+
+Reads ``/proc`` directly, so it only reports numbers on Linux and returns
+empty results elsewhere. Dedicated workers run inside their page's renderer
+process, so the renderer's peak RSS bounds what a page and its workers used
+together. ``reset_peak`` clears the kernel's high-water mark (``VmHWM``) so
+the peak can be measured for one operation at a time.
+"""
+import os
+from pathlib import Path
+
+PROC = Path("/proc")
+
+
+def _parent_pids():
+    parents = {}
+    for entry in PROC.iterdir() if PROC.is_dir() else ():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name is parenthesised and may contain spaces.
+        parents[int(entry.name)] = int(stat.rsplit(")", 1)[1].split()[1])
+    return parents
+
+
+def descendants(root=None):
+    """PIDs of every process below ``root`` (default: this process)."""
+    root = os.getpid() if root is None else root
+    children = {}
+    for pid, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(pid)
+    found, stack = [], [root]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def _cmdline(pid):
+    try:
+        return (PROC / str(pid) / "cmdline").read_bytes().split(b"\0")
+    except OSError:
+        return []
+
+
+def chromium_processes(process_type=None):
+    """Chromium processes started by this harness, optionally of one ``--type``.
+
+    The browser process itself has no ``--type``; pass ``"browser"`` to get it.
+    """
+    pids = []
+    for pid in descendants():
+        args = _cmdline(pid)
+        if not args or b"chrom" not in args[0].lower():
+            continue
+        types = [arg.split(b"=", 1)[1].decode() for arg in args if arg.startswith(b"--type=")]
+        kind = types[0] if types else "browser"
+        if process_type is None or kind == process_type:
+            pids.append(pid)
+    return pids
+
+
+def _status_kb(pid, field):
+    try:
+        for line in (PROC / str(pid) / "status").read_text().splitlines():
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def rss_bytes(pids):
+    """Current resident set size per PID."""
+    sizes = {pid: _status_kb(pid, "VmRSS") for pid in pids}
+    return {pid: kb * 1024 for pid, kb in sizes.items() if kb is not None}
+
+
+def peak_rss_bytes(pids):
+    """Peak resident set size per PID since it started or was last reset."""
+    sizes = {pid: _status_kb(pid, "VmHWM") for pid in pids}
+    return {pid: kb * 1024 for pid, kb in sizes.items() if kb is not None}
+
+
+def reset_peak(pids):
+    """Reset the peak RSS of ``pids`` to their current RSS (Linux 4.0+)."""
+    for pid in pids:
+        try:
+            (PROC / str(pid) / "clear_refs").write_text("5")
+        except OSError:
+            pass
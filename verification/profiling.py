@@ -0,0 +1,165 @@
+"""CPU profiles and performance traces for example runs.
+
+While an example runs, Chromium records a DevTools performance trace that
+includes the V8 CPU profiler for every thread of the page, its dedicated
+workers included. After the run the trace is saved next to the screenshot
+as ``<name>.trace.json`` (open it in the DevTools Performance panel), and
+the profile of each JavaScript thread is extracted into a
+``<name>.<thread>.cpuprofile`` file.
+
+Browser tracing covers the whole browser, so profile one page at a time
+per browser process (``run_all.py --profile`` does this).
+
+    python verification/profiling.py verification/output/03-image-processing/289-bilateral-filter.trace.json
+    python verification/profiling.py some.cpuprofile --top 20 --all-scripts
+"""
+import argparse
+import json
+import re
+from pathlib import Path
+
+TRACE_CATEGORIES = [
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "disabled-by-default-v8.cpu_profiler",
+    "v8.execute",
+    "blink.user_timing",
+]
+
+
+async def start_profiling(page, trace_path):
+    await page.context.browser.start_tracing(page=page, path=str(trace_path), categories=TRACE_CATEGORIES)
+
+
+async def stop_profiling(page, trace_path):
+    """Stop the trace, write per-thread ``.cpuprofile`` files and return their paths."""
+    await page.context.browser.stop_tracing()
+    written = []
+    for thread, profile in extract_profiles(json.loads(Path(trace_path).read_text())).items():
+        stem = Path(trace_path).name.removesuffix(".trace.json")
+        target = Path(trace_path).with_name(f"{stem}.{thread}.cpuprofile")
+        target.write_text(json.dumps(profile))
+        written.append(target)
+    return written
+
+
+def _thread_names(events):
+    names = {}
+    for event in events:
+        if event.get("ph") == "M" and event.get("name") == "thread_name":
+            names[(event["pid"], event["tid"])] = event["args"]["name"]
+    return names
+
+
+def _slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "thread"
+
+
+def extract_profiles(trace):
+    """Rebuild one ``.cpuprofile`` dict per profiled thread from a trace.
+
+    V8 streams its samples into the trace as a ``Profile`` event followed by
+    ``ProfileChunk`` events whose nodes reference their parent by id.
+    """
+    events = trace["traceEvents"] if isinstance(trace, dict) else trace
+    thread_names = _thread_names(events)
+    profiles = {}
+    for event in events:
+        if event.get("name") not in ("Profile", "ProfileChunk"):
+            continue
+        key = (event["pid"], event.get("id"))
+        profile = profiles.setdefault(key, {
+            "thread": thread_names.get((event["pid"], event["tid"]), f"thread-{event['tid']}"),
+            "startTime": 0,
+            "nodes": {},
+            "samples": [],
+            "timeDeltas": [],
+        })
+        data = event.get("args", {}).get("data", {})
+        if event["name"] == "Profile":
+            profile["startTime"] = data.get("startTime", 0)
+            continue
+        cpu_profile = data.get("cpuProfile", {})
+        for node in cpu_profile.get("nodes", []):
+            profile["nodes"][node["id"]] = node
+        profile["samples"].extend(cpu_profile.get("samples", []))
+        profile["timeDeltas"].extend(data.get("timeDeltas", []))
+
+    extracted, seen = {}, {}
+    for profile in profiles.values():
+        if not profile["samples"]:
+            continue
+        children = {}
+        for node in profile["nodes"].values():
+            if "parent" in node:
+                children.setdefault(node["parent"], []).append(node["id"])
+        nodes = [
+            {"id": node_id, "callFrame": node["callFrame"], "children": children.get(node_id, [])}
+            for node_id, node in sorted(profile["nodes"].items())
+        ]
+        name = _slug(profile["thread"])
+        seen[name] = seen.get(name, 0) + 1
+        if seen[name] > 1:
+            name = f"{name}-{seen[name]}"
+        extracted[name] = {
+            "nodes": nodes,
+            "startTime": profile["startTime"],
+            "endTime": profile["startTime"] + sum(profile["timeDeltas"]),
+            "samples": profile["samples"],
+            "timeDeltas": profile["timeDeltas"],
+        }
+    return extracted
+
+
+def self_times(profile):
+    """Self time in milliseconds per ``(function, url, line)`` of a ``.cpuprofile``."""
+    frames = {node["id"]: node["callFrame"] for node in profile["nodes"]}
+    deltas = profile["timeDeltas"]
+    totals = {}
+    for i, node_id in enumerate(profile["samples"]):
+        # A sample's self time lasts until the next sample is taken.
+        interval = deltas[i + 1] if i + 1 < len(deltas) else 0
+        frame = frames[node_id]
+        key = (frame.get("functionName") or "(anonymous)", frame.get("url", ""), frame.get("lineNumber", -1) + 1)
+        totals[key] = totals.get(key, 0) + interval / 1000
+    return totals
+
+
+def summarize(profiles, top=15, script="worker.js"):
+    """Print the top self-time functions of each profile, optionally for one script only."""
+    for name, profile in profiles.items():
+        all_totals = self_times(profile)
+        totals = all_totals
+        if script:
+            totals = {key: ms for key, ms in all_totals.items() if key[1].endswith(script)}
+        if not totals:
+            continue
+        total_ms = sum(all_totals.values())
+        print(f"\n{name} ({total_ms:.1f} ms sampled)")
+        for (function, url, line), ms in sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"  {ms:9.2f} ms  {ms / total_ms:6.1%}  {function}  {url.rsplit('/', 1)[-1]}:{line}")
+
+
+def load_profiles(path):
+    data = json.loads(Path(path).read_text())
+    if isinstance(data, dict) and "nodes" in data:
+        return {Path(path).name.removesuffix(".cpuprofile"): data}
+    return extract_profiles(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the top self-time functions in traces or CPU profiles.")
+    parser.add_argument("paths", nargs="+", type=Path, help=".trace.json or .cpuprofile files")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--script", default="worker.js", help="only list functions from this script (default: worker.js)")
+    parser.add_argument("--all-scripts", action="store_true", help="list functions from every script")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        print(f"== {path}")
+        summarize(load_profiles(path), top=args.top, script=None if args.all_scripts else args.script)
+
+
+if __name__ == "__main__":
+    main()
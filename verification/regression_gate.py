@@ -0,0 +1,177 @@
+"""Fail when a benchmark got slower than the stored baseline for this machine.
+
+Baselines are benchmark reports (see ``benchmarks.py``) saved under
+``verification/baselines/``, one per machine fingerprint, so numbers from a
+laptop are never compared with numbers from a CI runner. A metric regresses
+when a one-sided Mann-Whitney U test says the new samples are worse than the
+baseline samples (p < ``--alpha``) *and* the median moved by more than
+``--threshold``; a single slow sample is not enough to fail the gate.
+
+    python verification/regression_gate.py                    # check the latest report
+    python verification/regression_gate.py --save-baseline    # accept the latest report
+"""
+import argparse
+import hashlib
+import json
+import math
+import re
+import statistics
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = REPO_ROOT / "verification" / "baselines"
+REPORT_DIR = REPO_ROOT / "verification" / "output" / "benchmarks"
+
+ALPHA = 0.01
+THRESHOLD = 1.25
+MIN_SAMPLES = 5
+
+
+def fingerprint_key(machine):
+    """A stable file name for the machine a report was measured on."""
+    browser_major = machine.get("browser", "").split(".")[0] or "unknown"
+    identity = json.dumps(
+        [machine["system"], machine["machine"], machine["processor"], machine["cpu_count"], browser_major]
+    )
+    digest = hashlib.sha256(identity.encode()).hexdigest()[:8]
+    slug = f"{machine['system']}-{machine['machine']}-{machine['cpu_count']}cpu-chromium{browser_major}"
+    return f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', slug).lower()}-{digest}"
+
+
+def baseline_path(machine):
+    return BASELINE_DIR / f"{fingerprint_key(machine)}.json"
+
+
+def lower_is_better(name, unit):
+    """``True`` for durations, ``False`` for rates, ``None`` when the metric is not comparable.
+
+    Unitless numbers count as rates when the metric name says so, e.g. ``Ops/Second``.
+    """
+    unit = unit.strip().lower()
+    if unit in ("ms", "s", "µs", "us", "ns"):
+        return True
+    rate = unit or name.strip().lower()
+    if rate.endswith(("/s", "/sec", "/second", "per second", "fps")):
+        return False
+    return None
+
+
+def _ranks(values):
+    """Average ranks (1-based) and the tie correction term ``sum(t^3 - t)``."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_greater(current, baseline):
+    """One-sided p-value for "``current`` tends to be larger than ``baseline``".
+
+    Uses the normal approximation with tie and continuity corrections.
+    """
+    n1, n2 = len(current), len(baseline)
+    n = n1 + n2
+    ranks, ties = _ranks(list(current) + list(baseline))
+    u1 = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u1 - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_metric(current, baseline, name, unit, alpha=ALPHA, threshold=THRESHOLD):
+    """Return a verdict dict for one metric, or ``None`` if it is not comparable."""
+    direction = lower_is_better(name, unit)
+    if direction is None:
+        return None
+    if len(current) < MIN_SAMPLES or len(baseline) < MIN_SAMPLES:
+        return {"status": "insufficient-samples"}
+
+    current_median, baseline_median = statistics.median(current), statistics.median(baseline)
+    if direction:
+        p_value = mann_whitney_greater(current, baseline)
+        ratio = current_median / baseline_median if baseline_median else math.inf
+    else:
+        p_value = mann_whitney_greater(baseline, current)
+        ratio = baseline_median / current_median if current_median else math.inf
+
+    regressed = p_value < alpha and ratio > threshold
+    return {
+        "status": "regressed" if regressed else "ok",
+        "p_value": p_value,
+        "slowdown": ratio,
+        "baseline_median": baseline_median,
+        "current_median": current_median,
+    }
+
+
+def compare_reports(current, baseline, alpha=ALPHA, threshold=THRESHOLD):
+    """Compare every metric present in both reports."""
+    verdicts = {}
+    for example_id, metrics in current["results"].items():
+        for name, summary in metrics.items():
+            base = baseline["results"].get(example_id, {}).get(name)
+            if base is None:
+                continue
+            verdict = compare_metric(summary["samples"], base["samples"], name, summary["unit"], alpha, threshold)
+            if verdict is not None:
+                verdicts[(example_id, name)] = verdict
+    return verdicts
+
+
+def latest_report(report_dir=REPORT_DIR):
+    reports = sorted(report_dir.glob("benchmark-*.json"))
+    return reports[-1] if reports else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a benchmark report with this machine's baseline.")
+    parser.add_argument("report", nargs="?", type=Path, help="benchmark report (default: the latest one)")
+    parser.add_argument("--save-baseline", action="store_true", help="store the report as this machine's baseline")
+    parser.add_argument("--alpha", type=float, default=ALPHA, help=f"significance level (default: {ALPHA})")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"minimum median slowdown to fail, e.g. 1.25 = 25%% slower (default: {THRESHOLD})")
+    args = parser.parse_args()
+
+    report_path = args.report or latest_report()
+    if report_path is None:
+        print(f"No benchmark reports found in {REPORT_DIR}; run benchmarks.py first.")
+        return 1
+    current = json.loads(report_path.read_text())
+    target = baseline_path(current["machine"])
+
+    if args.save_baseline:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(current, indent=2, ensure_ascii=False))
+        print(f"Saved {report_path.name} as baseline {target.relative_to(REPO_ROOT)}")
+        return 0
+    if not target.exists():
+        print(f"No baseline for this machine ({target.name}); run with --save-baseline to create one.")
+        return 0
+
+    verdicts = compare_reports(current, json.loads(target.read_text()), args.alpha, args.threshold)
+    regressions = {key: verdict for key, verdict in verdicts.items() if verdict["status"] == "regressed"}
+    for (example_id, name), verdict in sorted(regressions.items()):
+        print(f"REGRESSED {example_id} / {name}: {verdict['slowdown']:.2f}x worse "
+              f"(median {verdict['baseline_median']:.2f} -> {verdict['current_median']:.2f}, "
+              f"p={verdict['p_value']:.4f})")
+    skipped = sum(1 for verdict in verdicts.values() if verdict["status"] == "insufficient-samples")
+    print("-" * 20)
+    print(f"{len(verdicts)} metrics compared against {target.name}: {len(regressions)} regressed"
+          + (f", {skipped} with fewer than {MIN_SAMPLES} samples" if skipped else ""))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
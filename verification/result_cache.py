@@ -0,0 +1,87 @@
+"""Persistent cache of passing verification results.
+
+A result is keyed by the example's content hash, its expected selectors and
+steps, and ``HARNESS_VERSION`` (a hash of the harness sources), so editing an
+example or the harness invalidates exactly the results that depend on it.
+The cache keeps the most recently used ``max_entries`` results and drops
+the rest when saved.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+HARNESS_DIR = Path(__file__).resolve().parent
+CACHE_PATH = HARNESS_DIR / ".cache" / "results.json"
+MAX_ENTRIES = 5000
+
+# Sources whose changes can change a verification result: the runner and the
+# init scripts it injects. Scripts only the other suites use are left out, so
+# editing them keeps the cached passes.
+HARNESS_FILES = [
+    "run_all.py", "engine.py", "completion.py", "steps.py", "fixtures.py",
+    "init_scripts/completion.js", "init_scripts/messages.js", "init_scripts/memory.js", "init_scripts/startup.js",
+]
+
+
+def harness_version():
+    digest = hashlib.sha256()
+    paths = [HARNESS_DIR / name for name in HARNESS_FILES]
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+HARNESS_VERSION = harness_version()
+
+
+def cache_key(entry):
+    payload = json.dumps(
+        [HARNESS_VERSION, entry["id"], entry["hash"], entry["expect"], entry["steps"]],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path=CACHE_PATH, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = self._read()
+
+    def _read(self):
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get(self, entry):
+        """Return the cached result for a manifest entry, or ``None``."""
+        cached = self.entries.get(cache_key(entry))
+        if cached is None:
+            return None
+        cached["used"] = time.time()
+        return cached["result"]
+
+    def put(self, entry, result):
+        if result["status"] == "passed":
+            self.entries[cache_key(entry)] = {"used": time.time(), "result": result}
+
+    def save(self):
+        """Merge with the file on disk, evict the least recently used and write atomically.
+
+        Merging lets several shards share one cache without losing results.
+        """
+        merged = self._read()
+        for key, cached in self.entries.items():
+            if key not in merged or merged[key]["used"] < cached["used"]:
+                merged[key] = cached
+        newest = sorted(merged.items(), key=lambda item: item[1]["used"], reverse=True)
+        self.entries = dict(newest[: self.max_entries])
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.entries, ensure_ascii=False))
+        os.replace(tmp_path, self.path)
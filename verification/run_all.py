@@ -0,0 +1,331 @@
+"""Verify every example page in parallel.
+
+Loads the example manifest once and spreads the selected pages across a pool
+of browser processes. Each process keeps one Chromium open and runs up to
+``--concurrency`` pages at once from a pool of browser contexts.
+
+    python verification/run_all.py --workers 4 --concurrency 16
+    python verification/run_all.py --shard 2/4 --category 03-image-processing
+    python verification/run_all.py --category 03-image-processing --changed
+    python verification/run_all.py --range 284-291 --profile
+    python verification/run_all.py --category 06-multi-threading --messages
+    python verification/run_all.py --category 07-data-processing --memory
+    python verification/run_all.py --category 06-multi-threading --startup
+    python verification/run_all.py --sweep --filter 603-worker-pool
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import time
+from pathlib import Path
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT, TIMEOUT_MS as COMPLETION_TIMEOUT_MS, wait_for_completion
+from engine import VerificationEngine
+from manifest import load_manifest, parse_range
+from memory import INIT_SCRIPT as MEMORY_SCRIPT, LAUNCH_ARGS as MEMORY_LAUNCH_ARGS, MemoryHistory, MemoryMonitor
+from messages import INIT_SCRIPT as MESSAGES_SCRIPT, collect_traffic
+from profiling import start_profiling, stop_profiling
+from result_cache import ResultCache
+from serve import serve_base_url
+from startup import INIT_SCRIPT as STARTUP_SCRIPT, collect_startup, watch_fetches
+from steps import perform_steps
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+
+
+def parse_shard(value):
+    """Parse ``i/N`` into a zero-based ``(index, count)`` pair."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard must look like i/N, got {value!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be within 1..N, got {value!r}")
+    return index - 1, count
+
+
+def select_shard(examples, shard):
+    """Keep every N-th example so each shard gets a mix of categories."""
+    if shard is None:
+        return examples
+    index, count = shard
+    return [example for i, example in enumerate(examples) if i % count == index]
+
+
+async def verify_example(page, entry, options):
+    """Load one example page, run its steps, collect errors and take a screenshot.
+
+    ``options`` is the runner's parsed command line.
+    """
+    screenshot_path = options.output_dir / entry["category"] / f"{entry['name']}.png"
+    trace_path = screenshot_path.with_name(f"{entry['name']}.trace.json")
+    screenshot_path.parent.mkdir(parents=True, exist_ok=True)
+    errors = []
+    completion = None
+    profiles = []
+    traffic = None
+    memory = None
+    startup = None
+    monitor = MemoryMonitor(page) if options.memory else None
+    fetches = watch_fetches(page) if options.startup else None
+    started = time.perf_counter()
+
+    def on_console(msg):
+        if msg.type == "error":
+            errors.append(msg.text)
+
+    page.on("pageerror", lambda error: errors.append(str(error)))
+    page.on("console", on_console)
+    if options.profile:
+        await start_profiling(page, trace_path)
+    if monitor:
+        monitor.start()
+    try:
+        await page.goto(f"{options.base_url}/examples/{entry['id']}/index.html")
+        for selector in entry["expect"]:
+            await page.wait_for_selector(selector, timeout=5000)
+        if entry["steps"]:
+            await wait_for_completion(page)
+            await perform_steps(page, entry["steps"])
+        completion = await wait_for_completion(page)
+        if completion == "timeout":
+            # Only a worker that never answers gets here; its page must not pass.
+            errors.append(f"no completion signal or quiet workers within {COMPLETION_TIMEOUT_MS} ms")
+        if options.messages:
+            traffic = await collect_traffic(page)
+        if options.startup:
+            startup = await collect_startup(page, fetches)
+        await page.screenshot(path=str(screenshot_path))
+        status = "failed" if errors else "passed"
+    except Exception as e:
+        errors.append(str(e))
+        status = "failed"
+    finally:
+        if monitor:
+            memory = await monitor.finish()
+        if options.profile:
+            profiles = await stop_profiling(page, trace_path)
+
+    result = {
+        "example": entry["id"],
+        "hash": entry["hash"],
+        "status": status,
+        "completion": completion,
+        "duration": round(time.perf_counter() - started, 3),
+        "errors": errors,
+        "screenshot": str(screenshot_path.relative_to(REPO_ROOT)),
+    }
+    if options.messages:
+        result["messages"] = traffic
+    if options.memory:
+        result["memory"] = memory
+    if options.startup:
+        result["startup"] = startup
+    if options.profile:
+        result["trace"] = str(trace_path.relative_to(REPO_ROOT))
+        result["profiles"] = [str(path.relative_to(REPO_ROOT)) for path in profiles]
+    return result
+
+
+async def verify_partition(examples, results, options):
+    async def job(page, entry):
+        return await verify_example(page, entry, options)
+
+    # Browser tracing and process RSS are browser-wide, so profiled or
+    # memory-tracked pages must run one at a time. Start-up phases are only
+    # comparable across examples when no other page competes for the CPU.
+    concurrency = 1 if options.profile or options.memory or options.startup else options.concurrency
+    init_scripts = [COMPLETION_SCRIPT] + ([MESSAGES_SCRIPT] if options.messages else [])
+    if options.startup:
+        init_scripts.append(STARTUP_SCRIPT)
+    launch_args = []
+    if options.memory:
+        init_scripts.append(MEMORY_SCRIPT)
+        launch_args.extend(MEMORY_LAUNCH_ARGS)
+    async with VerificationEngine(concurrency=concurrency, init_scripts=init_scripts,
+                                  launch_args=launch_args) as engine:
+        async for result in engine.imap(job, examples):
+            results.put(result)
+
+
+def browser_worker(examples, results, options):
+    """Verify one partition of manifest entries with its own browser and event loop."""
+    asyncio.run(verify_partition(examples, results, options))
+
+
+def run(examples, workers, options):
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=browser_worker,
+            args=(select_shard(examples, (i, workers)), results, options),
+        )
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    collected = []
+    while len(collected) < len(examples):
+        try:
+            result = results.get(timeout=1)
+        except queue.Empty:
+            if any(process.is_alive() for process in processes):
+                continue
+            print("Browser processes exited before all examples were verified.")
+            break
+        collected.append(result)
+        print(f"[{len(collected)}/{len(examples)}] {result['status'].upper()} "
+              f"{result['example']} ({result['duration']}s)")
+        for error in result["errors"]:
+            print(f"    {error}")
+
+    for process in processes:
+        process.join()
+    return sorted(collected, key=lambda result: result["example"])
+
+
+def check_golden(results):
+    """Attach golden-image outcomes and fail results that regressed."""
+    from golden import compare_all
+
+    items = [(result["example"], REPO_ROOT / result["screenshot"])
+             for result in results if result["status"] == "passed"]
+    outcomes = compare_all(items)
+    for result in results:
+        outcome = outcomes.get(result["example"])
+        if outcome is None:
+            continue
+        result["golden"] = outcome
+        if outcome["status"] == "regressed":
+            result["status"] = "failed"
+            result["errors"].append(f"screenshot differs from golden image: {outcome.get('reason') or outcome['heatmap']}")
+
+
+def check_memory(results, entries):
+    """Record each result's memory and attach growth warnings against earlier runs."""
+    history = MemoryHistory()
+    for result in results:
+        if not result.get("memory"):
+            continue
+        growth = history.check(entries[result["example"]], result["memory"])
+        result["memory"]["growth"] = growth
+        if growth:
+            print(f"MEMORY GROWTH {result['example']}: {growth}")
+    history.save()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) // 2),
+                        help="number of browser processes (default: half the CPU count)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="pages open at once in each browser process (default: 8)")
+    parser.add_argument("--shard", type=parse_shard, help="only run shard i of N, e.g. 2/4")
+    parser.add_argument("--category", action="append", default=[],
+                        help="only run this category, e.g. 03-image-processing (repeatable)")
+    parser.add_argument("--range", type=parse_range, help="only run example numbers in a range, e.g. 284-291")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run examples whose id contains this text (repeatable)")
+    parser.add_argument("--changed", action="store_true",
+                        help="leave examples with a cached pass out of the report entirely")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-run examples even when a cached pass exists")
+    parser.add_argument("--profile", action="store_true",
+                        help="record a trace and per-thread CPU profiles next to each screenshot "
+                             "(one page at a time per process; implies --no-cache)")
+    parser.add_argument("--messages", action="store_true",
+                        help="record worker message counts, sizes, transfers and round-trip times "
+                             "(see messages.py; implies --no-cache)")
+    parser.add_argument("--memory", action="store_true",
+                        help="record peak and after-GC JS heap of the page and its workers plus browser RSS, "
+                             "and flag examples whose memory grew since earlier runs "
+                             "(see memory.py; one page at a time per process; implies --no-cache)")
+    parser.add_argument("--startup", action="store_true",
+                        help="time navigation, worker script fetch, construction, first message and "
+                             "first result for every worker (see startup.py; one page at a time in a single "
+                             "browser process; implies --no-cache)")
+    parser.add_argument("--sweep", action="store_true",
+                        help="instead of verifying, run the examples in sweeps.json over their grid of "
+                             "sizes x worker counts and fit scaling curves (see sweep.py)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per sweep grid point; the median is kept (default: 3)")
+    parser.add_argument("--golden", action="store_true",
+                        help="compare new screenshots against verification/golden/")
+    parser.add_argument("--rebuild-manifest", action="store_true", help="rescan every example first")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run, "
+                             "logging this run's requests to <output-dir>/access.jsonl")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    manifest = load_manifest(rebuild=args.rebuild_manifest)
+    examples = manifest.select(categories=args.category, numbers=args.range, contains=args.filter)
+    examples = select_shard(examples, args.shard)
+    if not examples:
+        print("No examples selected.")
+        return 0
+
+    if args.serve:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        access_log = args.output_dir / "access.jsonl"
+        # Start from an empty log so log_analyzer only sees this run's requests.
+        access_log.unlink(missing_ok=True)
+        serve_base_url(args.base_url, access_log=access_log)
+
+    if args.sweep:
+        import sweep
+
+        return sweep.run(examples, args)
+
+    cache = ResultCache()
+    cached_results, pending = [], []
+    for entry in examples:
+        uncached = args.no_cache or args.golden or args.profile or args.messages or args.memory or args.startup
+        cached = None if uncached else cache.get(entry)
+        if cached is None:
+            pending.append(entry)
+        elif not args.changed:
+            cached_results.append(dict(cached, cached=True))
+
+    started = time.perf_counter()
+    results = []
+    if pending:
+        workers = 1 if args.startup else max(1, min(args.workers, len(pending)))
+        pages = 1 if args.profile or args.memory or args.startup else args.concurrency
+        print(f"Verifying {len(pending)} examples ({len(examples) - len(pending)} cached) "
+              f"with {workers} browser processes x {pages} pages...")
+        results = run(pending, workers, args)
+        if args.golden:
+            check_golden(results)
+        by_id = {entry["id"]: entry for entry in pending}
+        if args.memory:
+            check_memory(results, by_id)
+        for result in results:
+            cache.put(by_id[result["example"]], result)
+    else:
+        print(f"All {len(examples)} selected examples are cached.")
+    cache.save()
+
+    results = sorted(results + cached_results, key=lambda result: result["example"])
+    failed = [result for result in results if result["status"] != "passed"]
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    suffix = f"-shard{args.shard[0] + 1}of{args.shard[1]}" if args.shard else ""
+    report_path = args.output_dir / f"results{suffix}.json"
+    report_path.write_text(json.dumps(results, indent=2, ensure_ascii=False))
+
+    print("-" * 20)
+    print(f"{len(results) - len(failed)} passed, {len(failed)} failed "
+          f"in {time.perf_counter() - started:.1f}s; report saved to {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,287 @@
+"""Drive the task schedulers with generated load and report latency percentiles.
+
+The 02-task-offloading and 02-task-scheduling schedulers (153 priority
+queue, 154 fair scheduler, 192 task-type routing, 193 peak shaving, 194
+degradation, 195 circuit breaker) are otherwise exercised with a few button
+clicks. Here thousands of tasks are submitted through each page's own
+submit function on a seeded arrival process:
+
+- ``poisson``: exponential gaps at ``--rate`` tasks per second;
+- ``burst``: ``--burst-size`` tasks at once every ``--burst-interval`` seconds.
+
+Each task belongs to one of the example's classes (priorities, users, task
+types), drawn with the weights in ``--mix``. ``init_scripts/tasks.js``
+timestamps when each task arrived, when the page dispatched it to a worker
+and when the worker answered. The report gives throughput, p50/p99 latency,
+queue wait (latency minus the service time the worker reported, or the time
+it held the task), per-class figures and Jain's fairness index over the
+classes' mean latencies (1.0 when every class waits alike). Tasks the
+scheduler never dispatched (rejected, shed or blocked by an open circuit)
+are counted as such.
+
+    python verification/scheduler_load.py --serve
+    python verification/scheduler_load.py --serve --filter 153 --mix high=1,medium=2,low=7 --rate 180
+    python verification/scheduler_load.py --serve --filter 154 --process burst --burst-size 50 --tasks 3000
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+
+from benchmarks import percentile
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT, INIT_SCRIPTS_DIR
+from engine import VerificationEngine
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+TASKS_SCRIPT = (INIT_SCRIPTS_DIR / "tasks.js").read_text()
+PROCESSES = ("poisson", "burst")
+POLL_SECONDS = 0.5
+
+# How to submit one task to each scheduler through its page's own code, the
+# task classes it distinguishes (label -> value passed to submit) and a
+# default load it can mostly keep up with. `task.value` is the class value,
+# `task.serviceMs` the requested work for schedulers that take one.
+SCHEDULERS = {
+    "02-task-offloading/153-priority-queue": {
+        "classes": {"high": 3, "medium": 2, "low": 1},
+        "submit": "(task) => { pool.submitTask(task.value, task.serviceMs); return pool.taskIdCounter; }",
+        "rate": 150, "tasks": 3000,
+    },
+    "02-task-offloading/154-fair-scheduler": {
+        "classes": {"A": "A", "B": "B", "C": "C"},
+        "submit": "(task) => { scheduler.addTask(task.value, task.serviceMs); return scheduler.taskIdCounter; }",
+        "rate": 80, "tasks": 2000,
+    },
+    "02-task-scheduling/192-task-type-routing": {
+        # 'low' is the cheapest complexity: fib(35) on the CPU worker, a 500 ms wait on the IO worker.
+        "classes": {"cpu": "cpu", "io": "io"},
+        "submit": "(task) => { const id = taskIdCounter; submitTask(task.value, 'low'); return id; }",
+        "rate": 10, "tasks": 500,
+    },
+    "02-task-scheduling/193-peak-shaving": {
+        # Tasks run 2-4 s on at most 3 workers behind a queue of 5; the rest are
+        # rejected. Three workers finish about one task a second, so 0.8/s keeps
+        # them busy with the queue absorbing Poisson peaks.
+        "classes": {"task": None},
+        "submit": "() => { submitTask(); return totalSubmitted; }",
+        "rate": 0.8, "tasks": 150,
+    },
+    "02-task-scheduling/194-degradation-strategy": {
+        # The load slider follows the backlog: 20% per task in flight, degraded from 80%.
+        "classes": {"image": None},
+        "submit": """(task, tasks) => {
+          loadSlider.value = Math.min(100, tasks.outstanding() * 20);
+          loadSlider.dispatchEvent(new Event('input'));
+          processBtn.disabled = false;
+          processBtn.click();
+        }""",
+        "rate": 10, "tasks": 500,
+    },
+    "02-task-scheduling/195-circuit-breaker": {
+        # Requests are refused without reaching the worker while the circuit is open.
+        "classes": {"request": None},
+        "setup": "reliability = 0.7;",
+        "submit": "() => { sendRequest(); return requestId; }",
+        "rate": 20, "tasks": 1000,
+    },
+}
+
+
+def parse_mix(text):
+    """``high=1,low=3`` -> ``{"high": 1.0, "low": 3.0}``."""
+    mix = {}
+    for part in text.split(","):
+        label, _, weight = part.partition("=")
+        if not label.strip() or not weight:
+            raise argparse.ArgumentTypeError(f"expected label=weight pairs, got {text!r}")
+        mix[label.strip()] = float(weight)
+    return mix
+
+
+def arrivals(spec, options, seed):
+    """Seeded task arrivals: ``{"at": ms, "cls", "value", "serviceMs"}`` in time order."""
+    rng = random.Random(seed)
+    count = options.tasks or spec["tasks"]
+    rate = options.rate or spec["rate"]
+    labels = list(spec["classes"])
+    weights = [options.mix.get(label, 0.0) for label in labels] if options.mix else [1.0] * len(labels)
+    if not any(weights):
+        weights = [1.0] * len(labels)
+    tasks, at = [], 0.0
+    for i in range(count):
+        if options.process == "poisson":
+            at += rng.expovariate(rate) * 1000
+        elif i and i % options.burst_size == 0:
+            at += options.burst_interval * 1000
+        label = rng.choices(labels, weights)[0]
+        tasks.append({"at": round(at, 3), "cls": label, "value": spec["classes"][label],
+                      "serviceMs": options.service_ms})
+    return tasks
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+    return {
+        "p50": round(percentile(samples, 0.50), 2),
+        "p90": round(percentile(samples, 0.90), 2),
+        "p99": round(percentile(samples, 0.99), 2),
+        "max": round(max(samples), 2),
+    }
+
+
+def jain(values):
+    """Jain's fairness index: 1.0 when all values are equal, 1/n at the worst."""
+    if len(values) < 2 or not any(values):
+        return None
+    return sum(values) ** 2 / (len(values) * sum(value * value for value in values))
+
+
+def summarize_tasks(records):
+    """Throughput, latency, queue wait and fairness from ``window.__tasks.records()``."""
+    completed = [record for record in records if record["completed"] is not None]
+    for record in completed:
+        record["latency"] = record["completed"] - record["arrived"]
+        service = record["service"]
+        if service is None:
+            service = record["completed"] - record["dispatched"]
+        record["service_ms"] = service
+        record["wait"] = max(record["latency"] - service, 0.0)
+    span = (max(record["completed"] for record in completed) - min(record["arrived"] for record in records)
+            if completed else 0)
+    summary = {
+        "offered": len(records),
+        "completed": len(completed),
+        "failed": sum(1 for record in completed if not record["success"]),
+        "never_dispatched": sum(1 for record in records if record["dispatched"] is None),
+        "unanswered": sum(1 for record in records
+                          if record["dispatched"] is not None and record["completed"] is None),
+        "throughput_per_s": round(len(completed) / (span / 1000), 2) if span else None,
+        "latency_ms": _percentiles([record["latency"] for record in completed]),
+        "wait_ms": _percentiles([record["wait"] for record in completed]),
+        "service_ms": _percentiles([record["service_ms"] for record in completed]),
+        "generator_lag_ms": _percentiles([record["lag"] for record in records]),
+        "classes": {},
+    }
+    for cls in dict.fromkeys(record["cls"] for record in records):
+        members = [record for record in records if record["cls"] == cls]
+        done = [record for record in members if record["completed"] is not None]
+        summary["classes"][cls] = {
+            "offered": len(members),
+            "completed": len(done),
+            "latency_ms": _percentiles([record["latency"] for record in done]),
+            "mean_latency_ms": round(statistics.fmean(record["latency"] for record in done), 2) if done else None,
+            "mean_wait_ms": round(statistics.fmean(record["wait"] for record in done), 2) if done else None,
+        }
+    means = [stats["mean_latency_ms"] for stats in summary["classes"].values() if stats["mean_latency_ms"]]
+    fairness = jain([1 / mean for mean in means])
+    summary["fairness"] = round(fairness, 4) if fairness is not None else None
+    return summary
+
+
+async def drive(page, example_id, spec, tasks, options):
+    result = {"example": example_id, "process": options.process, "rate": options.rate or spec["rate"]}
+    try:
+        await page.goto(f"{options.base_url}/examples/{example_id}/index.html")
+        if spec.get("setup"):
+            await page.evaluate(f"() => {{ {spec['setup']} }}")
+        started = time.monotonic()
+        await page.evaluate("([tasks, submit]) => window.__tasks.run(tasks, submit)", [tasks, spec["submit"]])
+        # Let queued tasks finish; stop once nothing has happened for --drain seconds.
+        while time.monotonic() - started < options.timeout:
+            progress = await page.evaluate("() => window.__tasks.progress()")
+            if not progress["unfinished"] or progress["idleMs"] > options.drain * 1000:
+                break
+            await asyncio.sleep(POLL_SECONDS)
+        records = await page.evaluate("() => window.__tasks.records()")
+        result.update(status="measured", **summarize_tasks(records))
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    return result
+
+
+async def run_all(jobs, options):
+    async def job(page, item):
+        example_id, spec, tasks = item
+        return await drive(page, example_id, spec, tasks, options)
+
+    # One scheduler at a time: their workers would otherwise share the cores.
+    results = []
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT, TASKS_SCRIPT]) as engine:
+        async for result in engine.imap(job, jobs):
+            results.append(result)
+            print_result(result)
+    return sorted(results, key=lambda result: result["example"])
+
+
+def print_result(result):
+    if result["status"] != "measured":
+        print(f"FAILED {result['example']}: {result['error']}")
+        return
+    latency = result["latency_ms"] or {"p50": "-", "p99": "-"}
+    fairness = f", fairness {result['fairness']}" if result["fairness"] is not None else ""
+    print(f"{result['example']}: {result['completed']}/{result['offered']} done at "
+          f"{result['throughput_per_s']} tasks/s, latency p50 {latency['p50']} ms p99 {latency['p99']} ms{fairness}")
+    if result["never_dispatched"] or result["failed"] or result["unanswered"]:
+        print(f"    {result['never_dispatched']} never dispatched, {result['failed']} failed, "
+              f"{result['unanswered']} unanswered")
+    for cls, stats in result["classes"].items():
+        if len(result["classes"]) > 1 and stats["latency_ms"]:
+            print(f"    {cls}: {stats['completed']}/{stats['offered']}, p50 {stats['latency_ms']['p50']} ms "
+                  f"p99 {stats['latency_ms']['p99']} ms, mean wait {stats['mean_wait_ms']} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the task schedulers with generated load.")
+    parser.add_argument("--process", choices=PROCESSES, default="poisson", help="arrival process (default: poisson)")
+    parser.add_argument("--rate", type=float, help="tasks per second for --process poisson (default: per scheduler)")
+    parser.add_argument("--tasks", type=int, help="tasks to submit (default: per scheduler)")
+    parser.add_argument("--burst-size", type=int, default=20, help="tasks per burst (default: 20)")
+    parser.add_argument("--burst-interval", type=float, default=1.0, help="seconds between bursts (default: 1)")
+    parser.add_argument("--mix", type=parse_mix, default={},
+                        help="class weights, e.g. high=1,medium=2,low=7 (default: equal)")
+    parser.add_argument("--service-ms", type=float, default=10,
+                        help="work per task for schedulers that take a duration (default: 10)")
+    parser.add_argument("--drain", type=float, default=10,
+                        help="stop waiting for unfinished tasks after this many idle seconds (default: 10)")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds allowed per scheduler (default: 600)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only drive schedulers whose id contains this text (repeatable)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    jobs = [(example_id, spec, arrivals(spec, args, args.seed)) for example_id, spec in SCHEDULERS.items()
+            if not args.filter or any(text in example_id for text in args.filter)]
+    if not jobs:
+        print("No schedulers selected.")
+        return 0
+
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Driving {len(jobs)} schedulers with {args.process} arrivals...")
+    results = asyncio.run(run_all(jobs, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "scheduler-load.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "process": args.process, "mix": args.mix,
+              "burst_size": args.burst_size, "burst_interval_s": args.burst_interval,
+              "service_ms": args.service_ms, "seed": args.seed, "results": results}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] != "measured")
+    print("-" * 20)
+    print(f"{len(results) - failed} measured, {failed} failed; saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
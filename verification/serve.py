@@ -0,0 +1,290 @@
+"""Static server for the examples tree, built for the parallel harness.
+
+Compared with ``python -m http.server`` it:
+
+- handles every connection on its own thread, with HTTP/1.1 keep-alive;
+- sends ``Cross-Origin-Opener-Policy`` / ``Cross-Origin-Embedder-Policy`` so
+  ``SharedArrayBuffer`` examples run cross-origin isolated;
+- answers ``If-None-Match`` / ``If-Modified-Since`` with ``304 Not Modified``;
+- serves text assets gzip- or brotli-compressed, compressing each file once
+  into ``verification/.cache/compressed/`` and reusing it until it changes;
+- sends file bodies with ``socket.sendfile`` so the kernel copies them;
+- optionally writes a JSON-lines access log with bytes, time-to-first-byte,
+  total time and compression-cache outcome for every request (see
+  ``log_analyzer.py``).
+
+    python verification/serve.py --port 8080
+    python verification/serve.py --port 8080 --precompress
+    python verification/serve.py --port 8080 --access-log verification/output/access.jsonl
+"""
+import argparse
+import email.utils
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+COMPRESSED_DIR = REPO_ROOT / "verification" / ".cache" / "compressed"
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".csv", ".xml", ".md", ".wasm"}
+MIN_COMPRESS_SIZE = 512
+# Large fixtures are sent as-is; compressing them would cost more than sending them.
+MAX_COMPRESS_SIZE = 16 * 1024 * 1024
+
+
+def compressed_copy(path, stat, encoding):
+    """Return ``(cached_path, was_cached)`` for a compressed copy of ``path``."""
+    key = hashlib.sha256(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+    target = COMPRESSED_DIR / f"{key}.{'br' if encoding == 'br' else 'gz'}"
+    if target.exists():
+        return target, True
+    data = path.read_bytes()
+    if encoding == "br":
+        compressed = brotli.compress(data, quality=11)
+    else:
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    # Concurrent requests may compress the same file; the rename keeps it atomic.
+    COMPRESSED_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(compressed)
+    os.replace(tmp_path, target)
+    return target, False
+
+
+def available_encodings():
+    return ("br", "gzip") if brotli else ("gzip",)
+
+
+class ExampleRequestHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".js": "text/javascript",
+        ".mjs": "text/javascript",
+        ".wasm": "application/wasm",
+        ".json": "application/json",
+    }
+    coep = "require-corp"
+    cache_control = "no-cache"
+    access_log = None
+
+    def parse_request(self):
+        self.started = time.perf_counter()
+        self.ttfb = None
+        self.body_bytes = 0
+        self.cache_status = "none"
+        self.encoding = None
+        return super().parse_request()
+
+    def send_header(self, keyword, value):
+        if keyword.lower() == "content-length":
+            self.body_bytes = int(value)
+        super().send_header(keyword, value)
+
+    def end_headers(self):
+        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
+        self.send_header("Cross-Origin-Embedder-Policy", self.coep)
+        self.send_header("Cross-Origin-Resource-Policy", "same-origin")
+        super().end_headers()
+        self.ttfb = time.perf_counter() - self.started
+
+    def handle_one_request(self):
+        self.started = None
+        super().handle_one_request()
+        if self.access_log is not None and self.started is not None and self.ttfb is not None:
+            self.access_log.write({
+                "ts": round(time.time(), 3),
+                "client": self.client_address[0],
+                "method": self.command,
+                "path": self.path,
+                "status": self.status,
+                "bytes": self.body_bytes,
+                "ttfb_ms": round(self.ttfb * 1000, 3),
+                "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+                "cache": self.cache_status,
+                "encoding": self.encoding,
+            })
+
+    def send_response(self, code, message=None):
+        self.status = int(code)
+        super().send_response(code, message)
+
+    def log_request(self, code="-", size="-"):
+        if self.access_log is None:
+            super().log_request(code, size)
+
+    def choose_encoding(self, path, stat):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or not MIN_COMPRESS_SIZE <= stat.st_size <= MAX_COMPRESS_SIZE:
+            return None
+        accepted = {
+            token.split(";")[0].strip()
+            for token in self.headers.get("Accept-Encoding", "").split(",")
+        }
+        for encoding in available_encodings():
+            if encoding in accepted:
+                return encoding
+        return None
+
+    def not_modified(self, etag, stat):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*"
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(stat.st_mtime) <= since
+        return False
+
+    def send_head(self):
+        """Serve regular files ourselves; leave directories to the base class."""
+        path = Path(self.translate_path(self.path))
+        if not path.is_file() or self.path.endswith("/"):
+            return super().send_head()
+
+        stat = path.stat()
+        encoding = self.choose_encoding(path, stat)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        if self.not_modified(etag, stat):
+            self.cache_status = "revalidated"
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", self.cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+
+        body_path = path
+        if encoding:
+            body_path, cached = compressed_copy(path, stat, encoding)
+            self.cache_status = "hit" if cached else "miss"
+            self.encoding = encoding
+        f = open(body_path, "rb")
+        try:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", self.guess_type(str(path)))
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", self.cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+        except Exception:
+            f.close()
+            raise
+        return f
+
+    def copyfile(self, source, outputfile):
+        """Send the body with ``sendfile`` when the output is a real socket."""
+        try:
+            self.connection.sendfile(source)
+        except (AttributeError, OSError, ValueError):
+            shutil.copyfileobj(source, outputfile)
+
+
+class AccessLog:
+    """Thread-safe JSON-lines access log."""
+
+    def __init__(self, path):
+        self.file = open(path, "a", buffering=1, encoding="utf-8")
+        self.lock = threading.Lock()
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self.lock:
+            self.file.write(line + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ExampleServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def precompress(root):
+    """Compress every compressible file under ``root`` ahead of time."""
+    files = [
+        path for path in root.rglob("*")
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES
+        and ".cache" not in path.parts and ".git" not in path.parts
+    ]
+    jobs = [
+        (path, path.stat(), encoding)
+        for path in files
+        if MIN_COMPRESS_SIZE <= path.stat().st_size <= MAX_COMPRESS_SIZE
+        for encoding in available_encodings()
+    ]
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(lambda job: compressed_copy(*job), jobs))
+    return len(jobs)
+
+
+def make_server(root=REPO_ROOT, host="127.0.0.1", port=8080, coep="require-corp", access_log=None):
+    access_log = AccessLog(access_log) if access_log else None
+    handler = type("Handler", (ExampleRequestHandler,), {"coep": coep, "access_log": access_log})
+
+    def factory(*args, **kwargs):
+        return handler(*args, directory=str(root), **kwargs)
+
+    return ExampleServer((host, port), factory)
+
+
+def start_server(root=REPO_ROOT, host="127.0.0.1", port=8080, coep="require-corp", access_log=None):
+    """Start the server on a background thread and return it."""
+    server = make_server(root, host, port, coep, access_log)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def serve_base_url(base_url, access_log=None):
+    """Start a background server listening where ``base_url`` points."""
+    parsed = urlsplit(base_url)
+    return start_server(host=parsed.hostname or "127.0.0.1", port=parsed.port or 80, access_log=access_log)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the repository for the verification harness.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--root", type=Path, default=REPO_ROOT)
+    parser.add_argument("--coep", choices=["require-corp", "credentialless"], default="require-corp",
+                        help="Cross-Origin-Embedder-Policy to send (default: require-corp)")
+    parser.add_argument("--precompress", action="store_true", help="compress every text asset before serving")
+    parser.add_argument("--access-log", type=Path,
+                        help="append one JSON line per request (timing, bytes, cache) to this file")
+    args = parser.parse_args()
+
+    if args.precompress:
+        print(f"Precompressed {precompress(args.root)} assets into {COMPRESSED_DIR}")
+    server = make_server(args.root, args.host, args.port, args.coep, args.access_log)
+    print(f"Serving {args.root} on http://{args.host}:{args.port}/ (COOP/COEP enabled)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Measure how long example pages take to get a first result from a worker.
+
+``INIT_SCRIPT`` (``init_scripts/startup.js``) wraps ``Worker`` and
+``SharedWorker`` to timestamp each worker's construction, the page's first
+message to it and the worker's first reply after that which is not a
+progress-style message (its first result).
+``watch_fetches`` records the network timing of every request the page
+makes, which is where the worker's script fetch comes from, and
+``collect_startup`` puts the two together into a per-example report;
+``run_all.py --startup`` stores it in the runner report under ``"startup"``.
+
+The time from navigation to the first result is split into consecutive
+phases:
+
+- ``before_worker``: navigation until the page constructs the worker
+  (loading the page, or waiting for the click that starts it);
+- ``fetch``: until the worker's script has been downloaded;
+- ``parse``: the page's compile time for the same source, as an estimate;
+- ``idle``: the worker was ready but the page had not posted to it yet;
+- ``compute``: from then until the first result arrived.
+
+    python verification/startup.py verification/output/results.json
+    python verification/startup.py verification/output/results.json --sort startup --top 20
+"""
+import argparse
+import json
+import statistics
+from collections import defaultdict, deque
+from pathlib import Path
+
+from benchmarks import percentile
+from completion import INIT_SCRIPTS_DIR
+
+INIT_SCRIPT = (INIT_SCRIPTS_DIR / "startup.js").read_text()
+
+PHASES = ("before_worker", "fetch", "parse", "idle", "compute")
+
+SORT_KEYS = {
+    "ttfr": lambda report: report["time_to_first_result_ms"],
+    "startup": lambda report: report["startup_ms"],
+    "fetch": lambda report: report["phases"]["fetch"],
+    "parse": lambda report: report["phases"]["parse"],
+    "compute": lambda report: report["phases"]["compute"],
+}
+
+
+def watch_fetches(page):
+    """Record the wall-clock start and end of every request ``page`` finishes.
+
+    Returns the list the records are appended to; pass it to ``collect_startup``.
+    """
+    fetches = []
+
+    def on_finished(request):
+        timing = request.timing
+        if timing["startTime"] <= 0 or timing["responseEnd"] < 0:
+            return
+        fetches.append({
+            "url": request.url,
+            "start": timing["startTime"],
+            "end": timing["startTime"] + timing["responseEnd"],
+        })
+
+    page.on("requestfinished", on_finished)
+    return fetches
+
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+
+def _phases(worker, fetch_end):
+    """Split navigation-to-first-result for one worker into consecutive phases."""
+    result = worker["firstResult"]
+    constructed = worker["constructed"]
+    fetched = constructed if fetch_end is None else min(max(constructed, fetch_end), result)
+    parsed = min(fetched + (worker["parse"] or 0), result)
+    posted = min(max(parsed, worker["firstPost"]), result)
+    return {
+        "before_worker": constructed,
+        "fetch": fetched - constructed,
+        "parse": parsed - fetched,
+        "idle": posted - parsed,
+        "compute": result - posted,
+    }
+
+
+def summarize_startup(report, fetches):
+    """Match workers to their script fetches and build one example's report.
+
+    Requests for the same URL are paired with the workers constructed from it
+    in order. Blob and data URLs, and scripts the browser did not report a
+    request for, have no fetch; its time is then counted under ``compute``.
+    """
+    origin = report["timeOrigin"]
+    requests = defaultdict(deque)
+    for fetch in sorted(fetches, key=lambda fetch: fetch["start"]):
+        requests[fetch["url"]].append(fetch)
+
+    workers = []
+    for worker in report["workers"]:
+        fetch = requests[worker["url"]].popleft() if requests[worker["url"]] else None
+        fetch_end = None if fetch is None else fetch["end"] - origin
+        workers.append({
+            "url": worker["url"],
+            "kind": worker["kind"],
+            "type": worker["type"],
+            "constructed": _round(worker["constructed"]),
+            "fetch_ms": None if fetch is None else _round(fetch["end"] - fetch["start"]),
+            "parse_ms": _round(worker["parse"]),
+            "first_post": _round(worker["firstPost"]),
+            "first_received": _round(worker["firstReceived"]),
+            "first_result": _round(worker["firstResult"]),
+            "phases": None if worker["firstResult"] is None else {
+                phase: _round(ms) for phase, ms in _phases(worker, fetch_end).items()
+            },
+        })
+
+    navigation = report["navigation"]
+    answered = [worker for worker in workers if worker["first_result"] is not None]
+    first = min(answered, key=lambda worker: worker["first_result"]) if answered else None
+    return {
+        "navigation": None if navigation is None else {
+            "response_end": _round(navigation["responseEnd"]),
+            "dom_content_loaded": _round(navigation["domContentLoaded"]),
+            "load": _round(navigation["load"]),
+        },
+        "workers": len(workers),
+        "time_to_first_result_ms": None if first is None else first["first_result"],
+        "startup_ms": None if first is None else _round(first["first_result"] - first["constructed"]),
+        "first_worker": None if first is None else first["url"],
+        "phases": None if first is None else first["phases"],
+        "by_worker": workers,
+    }
+
+
+async def collect_startup(page, fetches):
+    """Return the start-up report for ``page``, or ``None`` if it was not instrumented."""
+    # The compile estimate fetches each script again; leave those requests out.
+    fetches = list(fetches)
+    report = await page.evaluate("() => window.__startup ? window.__startup.report() : null")
+    return None if report is None else summarize_startup(report, fetches)
+
+
+def _shares(reports):
+    """Each phase's share of the summed start-up time (construction to first result) of ``reports``."""
+    totals = {phase: sum(report["phases"][phase] for report in reports) for phase in PHASES[1:]}
+    total = sum(totals.values()) or 1
+    return {phase: totals[phase] / total for phase in totals}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the worker start-up times recorded by run_all.py --startup.")
+    parser.add_argument("results", type=Path, help="runner report (results*.json)")
+    parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="ttfr",
+                        help="ttfr is from navigation, startup from constructing the worker (default: ttfr)")
+    parser.add_argument("--top", type=int, default=20, help="only print this many examples (default: 20, 0 for all)")
+    args = parser.parse_args()
+
+    results = [result for result in json.loads(args.results.read_text()) if result.get("startup")]
+    if not results:
+        print(f"No start-up timings in {args.results}; run run_all.py with --startup.")
+        return 1
+    answered = [result for result in results if result["startup"]["time_to_first_result_ms"] is not None]
+    silent = sum(1 for result in results if result["startup"]["workers"]
+                 and result["startup"]["time_to_first_result_ms"] is None)
+    print(f"{len(results)} examples, {len(answered)} got a worker result, "
+          f"{silent} started workers that never answered a message")
+    if not answered:
+        return 0
+
+    answered.sort(key=lambda result: SORT_KEYS[args.sort](result["startup"]), reverse=True)
+    shown = answered[: args.top] if args.top else answered
+    print()
+    print("    ttfr  startup   before    fetch    parse     idle  compute  workers  example")
+    for result in shown:
+        report = result["startup"]
+        phases = report["phases"]
+        print(f"{report['time_to_first_result_ms']:8.1f} {report['startup_ms']:8.1f} "
+              + " ".join(f"{phases[phase]:8.1f}" for phase in PHASES)
+              + f" {report['workers']:8d}  {result['example']}")
+
+    by_category = defaultdict(list)
+    for result in answered:
+        by_category[result["example"].split("/")[0]].append(result["startup"])
+    print()
+    print("                                                              share of start-up")
+    print("category                     n   ttfr p50  ttfr p95  startup p50   fetch  parse   idle  compute")
+    for category, reports in sorted(by_category.items()) + [("all", [r["startup"] for r in answered])]:
+        ttfr = [report["time_to_first_result_ms"] for report in reports]
+        shares = _shares(reports)
+        print(f"{category:26} {len(reports):3d} {percentile(ttfr, 0.50):10.1f} {percentile(ttfr, 0.95):9.1f} "
+              f"{statistics.median(report['startup_ms'] for report in reports):12.1f} "
+              f"{shares['fetch']:7.0%} {shares['parse']:6.0%} {shares['idle']:6.0%} {shares['compute']:8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""Run the interaction steps recorded for an example in the manifest.
+
+Each step is a dict with an ``action`` and its arguments. ``read`` and
+``read_stats`` steps record numbers shown on the page; ``perform_steps``
+returns them as ``{name: {"value": ..., "unit": ...}}``.
+
+    {"action": "click", "selector": "#apply-btn"}
+    {"action": "select", "selector": "#task-type", "value": "cpu"}
+    {"action": "fill", "selector": "#input", "value": "hello"}
+    {"action": "upload_image", "selector": "#fileInput", "width": 1024, "height": 768, "seed": 0}
+    {"action": "wait_for", "selector": "#result .item", "state": "visible", "timeout": 10000}
+    {"action": "evaluate", "script": "document.title = 'x'"}
+    {"action": "wait_for_completion"}
+    {"action": "read", "name": "avg_rtt", "selector": "#avgRTT"}
+    {"action": "read_stats", "selector": "#result-stats"}
+
+``read_stats`` reads every ``.stat-item`` below the selector, naming each
+number after its ``.stat-label``.
+"""
+import re
+
+from completion import wait_for_completion
+from fixtures import test_image
+
+_NUMBER_RE = re.compile(r"([-+]?\d[\d,]*(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*(.*)")
+
+
+def parse_number(text):
+    """Split text such as ``"12.5 ms"`` or ``"1.2e+8"`` into ``(12.5, "ms")``."""
+    match = _NUMBER_RE.search(text.strip())
+    if not match:
+        return None
+    return float(match.group(1).replace(",", "")), match.group(2).strip()
+
+
+def _reading(text):
+    parsed = parse_number(text)
+    return None if parsed is None else {"value": parsed[0], "unit": parsed[1]}
+
+
+async def read_stats(page, selector):
+    items = await page.eval_on_selector_all(
+        f"{selector} .stat-item",
+        """items => items.map(item => [
+            (item.querySelector('.stat-label') || {}).textContent || '',
+            (item.querySelector('.stat-value') || {}).textContent || '',
+        ])""",
+    )
+    readings = {}
+    for label, value in items:
+        reading = _reading(value)
+        if reading is not None:
+            readings[label.strip().rstrip(":").strip()] = reading
+    return readings
+
+
+async def perform_step(page, step):
+    """Run one step and return the readings it took, if any."""
+    action = step["action"]
+    if action == "click":
+        await page.click(step["selector"])
+    elif action == "select":
+        await page.select_option(step["selector"], step["value"])
+    elif action == "fill":
+        await page.fill(step["selector"], step["value"])
+    elif action == "upload_image":
+        width = int(step["width"])
+        height = int(step.get("height", width))
+        await page.set_input_files(step["selector"], str(test_image(width, height, int(step.get("seed", 0)))))
+    elif action == "wait_for":
+        await page.wait_for_selector(
+            step["selector"], state=step.get("state", "visible"), timeout=step.get("timeout", 5000)
+        )
+    elif action == "evaluate":
+        await page.evaluate(step["script"])
+    elif action == "wait_for_completion":
+        await wait_for_completion(page, timeout=step.get("timeout", 15000))
+    elif action == "read":
+        reading = _reading(await page.inner_text(step["selector"]))
+        return {} if reading is None else {step["name"]: reading}
+    elif action == "read_stats":
+        return await read_stats(page, step["selector"])
+    else:
+        raise ValueError(f"Unknown step action: {action!r}")
+    return {}
+
+
+async def perform_steps(page, steps):
+    readings = {}
+    for step in steps:
+        readings.update(await perform_step(page, step))
+    return readings
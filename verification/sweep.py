@@ -0,0 +1,219 @@
+"""Scaling sweeps: run examples over a grid of input sizes and worker counts.
+
+``sweeps.json`` describes, per example, the worker counts and data sizes to
+try and the steps that start one run; ``{workers}`` and ``{size}`` in any
+step value are replaced by the grid point. Each point runs on a freshly
+loaded page, one at a time, and its wall time is measured inside the page
+from the first step to the last worker message.
+
+For every size the sweep derives speedup and parallel efficiency relative to
+the smallest worker count, the Karp-Flatt serial fraction of each point, and
+an Amdahl's-law fit giving the serial fraction and the speedup ceiling, plus
+the worker count after which adding workers stops paying off.
+
+    python verification/run_all.py --sweep --filter 603 --repeat 5
+    python verification/sweep.py verification/output/sweeps/sweep-20260101-120000.json
+"""
+import argparse
+import asyncio
+import csv
+import json
+import statistics
+import time
+from pathlib import Path
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT, wait_for_completion
+from engine import VerificationEngine
+from steps import perform_steps
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = Path(__file__).resolve().parent / "sweeps.json"
+OUTPUT_DIR = REPO_ROOT / "verification" / "output" / "sweeps"
+QUIET_MS = 500
+TIMEOUT_MS = 120000
+# Adding workers "levels off" once it buys less than this much extra speedup.
+LEVEL_OFF_GAIN = 1.1
+
+
+def load_sweeps(path=CONFIG_PATH):
+    return json.loads(Path(path).read_text())
+
+
+def expand(value, point):
+    """Substitute ``{workers}`` and ``{size}`` in every string inside ``value``."""
+    if isinstance(value, str):
+        return value.replace("{workers}", str(point["workers"])).replace("{size}", str(point["size"]))
+    if isinstance(value, list):
+        return [expand(item, point) for item in value]
+    if isinstance(value, dict):
+        return {key: expand(item, point) for key, item in value.items()}
+    return value
+
+
+async def run_point(page, example_id, config, point, base_url):
+    """Run one grid point and return its in-page wall time in milliseconds."""
+    await page.goto(f"{base_url}/examples/{example_id}/index.html")
+    await wait_for_completion(page)
+    started = await page.evaluate("() => performance.now()")
+    await perform_steps(page, expand(config["steps"], point))
+    completion = await wait_for_completion(page, timeout=config.get("timeout", TIMEOUT_MS),
+                                           quiet_ms=config.get("quiet_ms", QUIET_MS))
+    if completion == "timeout":
+        raise TimeoutError(f"no completion within {config.get('timeout', TIMEOUT_MS)} ms")
+    last_activity = await page.evaluate("() => window.__verification.lastActivity")
+    return last_activity - started
+
+
+def amdahl_fit(wall_by_workers):
+    """Least-squares fit of ``T(p) = a + b / p``; returns the serial fraction ``a / (a + b)``."""
+    if len(wall_by_workers) < 2:
+        return None
+    xs = [1 / workers for workers in wall_by_workers]
+    ys = list(wall_by_workers.values())
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+    spread = sum((x - x_mean) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    b = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / spread
+    a = y_mean - b * x_mean
+    if a + b <= 0:
+        return None
+    return min(1.0, max(0.0, a / (a + b)))
+
+
+def analyze(points):
+    """Derive speedup, efficiency and an Amdahl fit for every size of one example."""
+    by_size = {}
+    for point in points:
+        if point.get("wall_ms") is not None:
+            by_size.setdefault(point["size"], {})[point["workers"]] = point["wall_ms"]
+
+    curves = {}
+    for size, wall_by_workers in by_size.items():
+        counts = sorted(wall_by_workers)
+        base = counts[0]
+        curve = []
+        for workers in counts:
+            # Relative to the smallest count, scaled as if that count were perfectly parallel.
+            speedup = wall_by_workers[base] / wall_by_workers[workers] * base
+            karp_flatt = None
+            if workers > 1:
+                karp_flatt = (1 / speedup - 1 / workers) / (1 - 1 / workers)
+            curve.append({
+                "workers": workers,
+                "wall_ms": wall_by_workers[workers],
+                "speedup": speedup,
+                "efficiency": speedup / workers,
+                "karp_flatt": karp_flatt,
+            })
+        levels_off_at = None
+        for previous, current in zip(curve, curve[1:]):
+            if current["speedup"] < previous["speedup"] * LEVEL_OFF_GAIN:
+                levels_off_at = previous["workers"]
+                break
+        serial_fraction = amdahl_fit(wall_by_workers)
+        curves[str(size)] = {
+            "curve": curve,
+            "serial_fraction": serial_fraction,
+            "max_speedup": 1 / serial_fraction if serial_fraction else None,
+            "levels_off_at": levels_off_at,
+        }
+    return curves
+
+
+async def run_sweeps(selected, sweeps, repeat, base_url):
+    """Run every grid point of the selected examples ``repeat`` times."""
+    report = {}
+
+    async def job(page, example_id):
+        config = sweeps[example_id]
+        points = []
+        for size in config["sizes"]:
+            for workers in config["workers"]:
+                point = {"size": size, "workers": workers}
+                samples, error = [], None
+                for _ in range(repeat):
+                    try:
+                        samples.append(await run_point(page, example_id, config, point, base_url))
+                    except Exception as e:
+                        error = str(e)
+                        break
+                point.update(
+                    samples=samples,
+                    wall_ms=statistics.median(samples) if samples and error is None else None,
+                    error=error,
+                )
+                points.append(point)
+                print(f"  {example_id} size={size} workers={workers}: "
+                      + (f"FAILED {error}" if error else f"{point['wall_ms']:.1f} ms"))
+        return example_id, points
+
+    # One page at a time, so grid points do not compete for cores.
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for example_id, points in engine.imap(job, [entry["id"] for entry in selected]):
+            report[example_id] = {"points": points, "scaling": analyze(points)}
+    return report
+
+
+def write_report(report, output_dir):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = time.strftime("sweep-%Y%m%d-%H%M%S")
+    json_path = output_dir / f"{stem}.json"
+    json_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    csv_path = output_dir / f"{stem}.csv"
+    with csv_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["example", "size", "workers", "wall_ms", "speedup", "efficiency", "karp_flatt"])
+        for example_id, result in sorted(report["results"].items()):
+            for size, scaling in result["scaling"].items():
+                for row in scaling["curve"]:
+                    writer.writerow([
+                        example_id, size, row["workers"], round(row["wall_ms"], 2), round(row["speedup"], 3),
+                        round(row["efficiency"], 3), "" if row["karp_flatt"] is None else round(row["karp_flatt"], 4),
+                    ])
+    return json_path, csv_path
+
+
+def print_summary(results):
+    for example_id, result in sorted(results.items()):
+        print(f"\n{example_id}")
+        for size, scaling in result["scaling"].items():
+            curve = "  ".join(f"{row['workers']}w {row['speedup']:.2f}x/{row['efficiency']:.0%}"
+                              for row in scaling["curve"])
+            fit = ""
+            if scaling["serial_fraction"] is not None:
+                ceiling = f"{scaling['max_speedup']:.1f}x" if scaling["max_speedup"] else "unbounded"
+                fit = f"; serial {scaling['serial_fraction']:.1%}, ceiling {ceiling}"
+            levels = f"; levels off at {scaling['levels_off_at']} workers" if scaling["levels_off_at"] else ""
+            print(f"  size {size}: {curve}{fit}{levels}")
+
+
+def run(selected, args):
+    """Entry point for ``run_all.py --sweep``."""
+    sweeps = load_sweeps()
+    selected = [entry for entry in selected if entry["id"] in sweeps]
+    if not selected:
+        print(f"None of the selected examples has a sweep in {CONFIG_PATH.name}.")
+        return 0
+    points = sum(len(sweeps[entry["id"]]["sizes"]) * len(sweeps[entry["id"]]["workers"]) for entry in selected)
+    print(f"Sweeping {len(selected)} examples, {points} grid points x {args.repeat} runs...")
+    results = asyncio.run(run_sweeps(selected, sweeps, args.repeat, args.base_url))
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": args.repeat, "results": results}
+    json_path, csv_path = write_report(report, args.output_dir / "sweeps")
+    print_summary(results)
+    failed = sum(1 for result in results.values() for point in result["points"] if point["error"])
+    print("-" * 20)
+    print(f"{points - failed} points measured, {failed} failed; saved {json_path} and {csv_path}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the scaling curves of a sweep report.")
+    parser.add_argument("report", type=Path, help="sweep report written by run_all.py --sweep")
+    args = parser.parse_args()
+    print_summary(json.loads(args.report.read_text())["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+"""Measure 04-text-processing throughput on large mixed CJK and Latin text.
+
+The text examples ship with a paragraph of sample text. Here each one is fed
+prefixes of a seeded corpus from ``fixtures.py`` (Latin, CJK and mixed lines
+with repeats), doubling from ``--min-mb`` up to ``--size-mb``. The page
+fetches the corpus once, builds the message its ``main.js`` would send and
+times the example's own ``worker.js`` from ``postMessage`` to its result.
+An example stops growing once one run takes longer than ``--max-seconds``
+or fails (a worker timeout included), so quadratic code is reported rather
+than waited on.
+
+Every result is cross-checked against a Python reference implementing the
+same algorithm: match positions and highlighted HTML (431), word counts
+(440), forward and backward maximum-matching segmentation (448), Jaccard
+and cosine similarity (451), shingle similarity (452), deduplicated lines
+(453) and the filtered text (456). Large outputs are compared by SHA-256
+digest, computed in the page so they need not cross the wire.
+
+    python verification/text_throughput.py --serve
+    python verification/text_throughput.py --serve --filter 453 --size-mb 32 --max-seconds 120
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+from completion import INIT_SCRIPT as COMPLETION_SCRIPT
+from data_throughput import fixture_url
+from engine import VerificationEngine
+from fixtures import text_corpus
+from manifest import EXAMPLES_DIR
+from serve import serve_base_url
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = REPO_ROOT / "verification" / "output"
+BASE_URL = "http://localhost:8080"
+TIMEOUT_MS = 600000
+CATEGORY = "04-text-processing"
+RTOL = 1e-12
+SEARCH_PATTERN = "Web Worker"
+SENSITIVE_WORDS = ["bad", "fail", "error", "taboo", "secret", "數據", "數據分析", "分析", "Web Worker", "Worker"]
+OPEN_TAG = '<mark style="background:#ffeb3b;padding:2px;">'
+CLOSE_TAG = "</mark>"
+
+# The JavaScript half of each case: the message main.js would post for a
+# text, the worker's own timing and a compact summary of its reply that the
+# Python reference reproduces. ``digest`` hashes a string with SHA-256.
+HALVES = "(text) => { const middle = text.indexOf('\\n', text.length >> 1); return middle < 0 ? text.length >> 1 : middle; }"
+CASES = {
+    "search": {
+        "example": "431-full-text-search",
+        "message": "(text, options) => ({ type: 'SEARCH', payload: { text, pattern: options.pattern } })",
+        "duration": "(reply) => reply.payload.duration",
+        "summary": """async (reply, digest) => ({
+          count: reply.payload.stats.count,
+          positions: await digest(reply.payload.stats.positions.join(',')),
+          highlighted: await digest(reply.payload.highlighted),
+        })""",
+        "options": {"pattern": SEARCH_PATTERN},
+    },
+    "word-frequency": {
+        "example": "440-word-frequency",
+        "message": "(text) => ({ text })",
+        "duration": "(reply) => reply.time",
+        "summary": "async (reply) => ({ totalWords: reply.totalWords, results: reply.results })",
+        "options": {},
+    },
+    "segmentation-fmm": {
+        "example": "448-chinese-word-segmentation",
+        "message": "(text, options) => ({ text, algorithm: options.algorithm })",
+        "duration": "(reply) => reply.duration",
+        "summary": "async (reply, digest) => ({ words: reply.words.length, digest: await digest(reply.words.join('\\n')) })",
+        "options": {"algorithm": "fmm"},
+    },
+    "segmentation-bmm": {
+        "example": "448-chinese-word-segmentation",
+        "message": "(text, options) => ({ text, algorithm: options.algorithm })",
+        "duration": "(reply) => reply.duration",
+        "summary": "async (reply, digest) => ({ words: reply.words.length, digest: await digest(reply.words.join('\\n')) })",
+        "options": {"algorithm": "bmm"},
+    },
+    "similarity": {
+        "example": "451-text-similarity",
+        "message": f"(text) => {{ const middle = ({HALVES})(text); "
+                   "return { text1: text.slice(0, middle), text2: text.slice(middle) }; }",
+        "duration": "(reply) => reply.duration",
+        "summary": "async (reply) => ({ jaccard: reply.jaccard, cosine: reply.cosine })",
+        "options": {},
+    },
+    "plagiarism": {
+        "example": "452-plagiarism-detection",
+        "message": f"(text, options) => {{ const middle = ({HALVES})(text); "
+                   "return { text1: text.slice(0, middle), text2: text.slice(middle), n: options.n }; }",
+        "duration": "(reply) => reply.duration",
+        "summary": "async (reply) => ({ score: reply.score })",
+        "options": {"n": 3},
+    },
+    "deduplication": {
+        "example": "453-deduplication",
+        "message": "(text, options) => ({ text, ignoreCase: options.ignoreCase, trimWhitespace: options.trimWhitespace })",
+        "duration": "(reply) => reply.duration",
+        "summary": """async (reply, digest) => ({
+          originalCount: reply.originalCount,
+          newCount: reply.newCount,
+          result: await digest(reply.result),
+        })""",
+        "options": {"ignoreCase": True, "trimWhitespace": True},
+    },
+    "sensitive-words": {
+        "example": "456-sensitive-word-filter",
+        "message": "(text, options) => ({ text, words: options.words, replacement: options.replacement })",
+        "duration": "(reply) => reply.time",
+        "summary": "async (reply, digest) => ({ matchCount: reply.matchCount, filteredText: await digest(reply.filteredText) })",
+        "options": {"words": SENSITIVE_WORDS, "replacement": "*"},
+    },
+}
+
+PREPARE = """
+async ({ url }) => {
+  const started = performance.now();
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+  window.__corpus = await response.text();
+  return { fetch_ms: performance.now() - started, chars: window.__corpus.length };
+}
+"""
+
+RUN = """
+async ({ chars, message, duration, summary, options, timeoutMs }) => {
+  const text = window.__corpus.slice(0, chars);
+  const digest = async (value) => Array.from(
+    new Uint8Array(await crypto.subtle.digest('SHA-256', new TextEncoder().encode(value))),
+    (byte) => byte.toString(16).padStart(2, '0')).join('');
+  const worker = new Worker('worker.js');
+  try {
+    const { reply, latency_ms } = await new Promise((resolve, reject) => {
+      const timer = setTimeout(() => reject(new Error(`worker did not answer within ${timeoutMs} ms`)), timeoutMs);
+      let started;
+      worker.onmessage = (event) => {
+        const type = event.data && event.data.type;
+        if (type === 'ERROR' || type === 'error') {
+          clearTimeout(timer);
+          reject(new Error(JSON.stringify(event.data.payload ?? event.data)));
+        } else if (type === 'RESULT' || type === 'result') {
+          clearTimeout(timer);
+          resolve({ reply: event.data, latency_ms: performance.now() - started });
+        }
+      };
+      worker.onerror = (event) => {
+        clearTimeout(timer);
+        reject(new Error(event.message));
+      };
+      started = performance.now();
+      worker.postMessage((0, eval)(message)(text, options));
+    });
+    return {
+      latency_ms,
+      worker_ms: Number((0, eval)(duration)(reply)),
+      summary: await (0, eval)(summary)(reply, digest),
+    };
+  } finally {
+    worker.terminate();
+  }
+}
+"""
+
+
+def digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def halves(text):
+    middle = text.find("\n", len(text) >> 1)
+    middle = len(text) >> 1 if middle < 0 else middle
+    return text[:middle], text[middle:]
+
+
+def js_tokens(text):
+    """451's and 452's tokenizer: lowercase, drop everything but ASCII word characters and whitespace."""
+    cleaned = re.sub(r"[^\w\s]", "", text.lower(), flags=re.ASCII)
+    return [token for token in re.split(r"\s+", cleaned, flags=re.ASCII) if token]
+
+
+def search_reference(text, options):
+    pattern = options["pattern"]
+    lowered, needle = text.lower(), pattern.lower()
+    positions = []
+    start = lowered.find(needle)
+    while needle and start >= 0:
+        positions.append(start)
+        start = lowered.find(needle, start + 1)
+    # Matches are highlighted at their positions in the raw text, applied to
+    # the escaped text, as the worker does.
+    escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    width = len(pattern)
+    if all(later - earlier >= width for earlier, later in zip(positions, positions[1:])):
+        pieces, last = [], 0
+        for position in positions:
+            pieces += [escaped[last:position], OPEN_TAG, escaped[position:position + width], CLOSE_TAG]
+            last = position + width
+        pieces.append(escaped[last:])
+        highlighted = "".join(pieces)
+    else:
+        highlighted, offset = escaped, 0
+        for position in positions:
+            at = position + offset
+            highlighted = (highlighted[:at] + OPEN_TAG + highlighted[at:at + width] + CLOSE_TAG
+                           + highlighted[at + width:])
+            offset += len(OPEN_TAG) + len(CLOSE_TAG)
+    return {"count": len(positions), "positions": digest(",".join(map(str, positions))),
+            "highlighted": digest(highlighted)}
+
+
+def word_frequency_reference(text, options):
+    words = re.findall(r"[\w\u4e00-\u9fa5]+", text.lower(), flags=re.ASCII)
+    counts = Counter(words)
+    ranked = sorted(counts.items(), key=lambda item: -item[1])[:100]
+    return {"totalWords": len(words), "results": [{"word": word, "count": count} for word, count in ranked]}
+
+
+def segmentation_dictionary():
+    """The dictionary 448's worker segments with, read from its source."""
+    source = (EXAMPLES_DIR / CATEGORY / "448-chinese-word-segmentation" / "worker.js").read_text(encoding="utf-8")
+    body = re.search(r"new Set\(\[(.*?)\]\)", source, re.S).group(1)
+    return set(re.findall(r'"([^"]*)"', body))
+
+
+def segmentation_reference(text, options, max_length=5):
+    dictionary = segmentation_dictionary()
+    words = []
+    if options["algorithm"] == "fmm":
+        position = 0
+        while position < len(text):
+            length = min(max_length, len(text) - position)
+            while length > 1 and text[position:position + length] not in dictionary:
+                length -= 1
+            words.append(text[position:position + length])
+            position += length
+    else:
+        position = len(text)
+        while position > 0:
+            length = min(max_length, position)
+            while length > 1 and text[position - length:position] not in dictionary:
+                length -= 1
+            words.append(text[position - length:position])
+            position -= length
+        words.reverse()
+    return {"words": len(words), "digest": digest("\n".join(words))}
+
+
+def similarity_reference(text, options):
+    tokens1, tokens2 = (js_tokens(half) for half in halves(text))
+    set1, set2 = set(tokens1), set(tokens2)
+    union = set1 | set2
+    jaccard = len(set1 & set2) / len(union) if union else 0
+    tf1, tf2 = Counter(tokens1), Counter(tokens2)
+    vocabulary = dict.fromkeys(tokens1 + tokens2)
+    dot = sum(tf1[term] * tf2[term] for term in vocabulary)
+    magnitude1 = math.sqrt(sum(tf1[term] ** 2 for term in vocabulary))
+    magnitude2 = math.sqrt(sum(tf2[term] ** 2 for term in vocabulary))
+    cosine = dot / (magnitude1 * magnitude2) if magnitude1 and magnitude2 else 0
+    return {"jaccard": jaccard, "cosine": cosine}
+
+
+def plagiarism_reference(text, options):
+    n = options["n"]
+    shingles = []
+    for half in halves(text):
+        tokens = js_tokens(half)
+        shingles.append({" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)})
+    set1, set2 = shingles
+    if not set1 or not set2:
+        return {"score": 0}
+    common = len(set1 & set2)
+    return {"score": common / (len(set1) + len(set2) - common)}
+
+
+def deduplication_reference(text, options):
+    lines = re.split(r"\r?\n", text)
+    seen, unique = set(), []
+    for line in lines:
+        if options["trimWhitespace"]:
+            line = line.strip()
+        key = line.lower() if options["ignoreCase"] else line
+        if key not in seen:
+            seen.add(key)
+            unique.append(line)
+    return {"originalCount": len(lines), "newCount": len(unique), "result": digest("\n".join(unique))}
+
+
+def sensitive_words_reference(text, options):
+    matches = []
+    for word in options["words"]:
+        start = text.find(word)
+        while start >= 0:
+            matches.append((start, word))
+            start = text.find(word, start + 1)
+    matches.sort(key=lambda match: (match[0], -len(match[1])))
+    # 456 keeps a match only if it starts after the one it kept last ended.
+    merged = []
+    if matches:
+        current = matches[0]
+        for match in matches[1:]:
+            if match[0] < current[0] + len(current[1]):
+                continue
+            merged.append(current)
+            current = match
+        merged.append(current)
+    pieces, last = [], 0
+    for start, word in merged:
+        pieces += [text[last:start], options["replacement"] * len(word)]
+        last = start + len(word)
+    pieces.append(text[last:])
+    return {"matchCount": len(merged), "filteredText": digest("".join(pieces))}
+
+
+REFERENCES = {
+    "search": search_reference,
+    "word-frequency": word_frequency_reference,
+    "segmentation-fmm": segmentation_reference,
+    "segmentation-bmm": segmentation_reference,
+    "similarity": similarity_reference,
+    "plagiarism": plagiarism_reference,
+    "deduplication": deduplication_reference,
+    "sensitive-words": sensitive_words_reference,
+}
+
+
+def prefix_lengths(text, sizes_mb):
+    """``(mb, chars, bytes)`` for the longest whole-line prefix of ``text`` within each size."""
+    targets = sorted(sizes_mb)
+    prefixes = []
+    chars = size = 0
+    for line in text.splitlines(keepends=True):
+        line_bytes = len(line.encode("utf-8"))
+        while targets and size + line_bytes > targets[0] * 1024 * 1024:
+            prefixes.append((targets.pop(0), chars, size))
+        chars += len(line)
+        size += line_bytes
+    prefixes.extend((mb, chars, size) for mb in targets)
+    return prefixes
+
+
+def size_ladder(min_mb, max_mb):
+    sizes, size = [], min_mb
+    while size < max_mb:
+        sizes.append(size)
+        size *= 2
+    return sizes + [max_mb]
+
+
+def mismatches(actual, expected):
+    """The summary fields where the worker and the reference disagree."""
+    differing = {}
+    for key, value in expected.items():
+        got = actual.get(key)
+        if isinstance(value, float) and isinstance(got, (int, float)):
+            if not math.isclose(got, value, rel_tol=RTOL, abs_tol=RTOL):
+                differing[key] = {"worker": got, "reference": value}
+        elif got != value:
+            differing[key] = {"worker": got, "reference": value}
+    return differing
+
+
+async def run_case(page, name, text, prefixes, options):
+    spec = CASES[name]
+    results = []
+    stop = None
+    for mb, chars, size in prefixes:
+        result = {"example": f"{CATEGORY}/{spec['example']}", "case": name, "mb": mb, "chars": chars, "bytes": size}
+        if stop:
+            result.update(status="skipped", reason=stop)
+            results.append(result)
+            continue
+        try:
+            run = await page.evaluate(RUN, {
+                "chars": chars, "message": spec["message"], "duration": spec["duration"],
+                "summary": spec["summary"], "options": spec["options"], "timeoutMs": TIMEOUT_MS,
+            })
+            expected = REFERENCES[name](text[:chars], spec["options"])
+            differing = mismatches(run["summary"], expected)
+            result.update(
+                status="failed" if differing else "passed",
+                latency_ms=round(run["latency_ms"], 2),
+                worker_ms=round(run["worker_ms"], 2) if math.isfinite(run["worker_ms"]) else None,
+                mb_per_s=round(size / 1024 / 1024 / (run["latency_ms"] / 1000), 2) if run["latency_ms"] else None,
+            )
+            if differing:
+                result["mismatch"] = differing
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        # A size that failed (including a worker timeout) or ran too long
+        # ends the ladder: the larger sizes would only take longer.
+        if result["status"] == "failed":
+            stop = f"{mb} MB failed"
+        elif result["latency_ms"] > options.max_seconds * 1000:
+            stop = f"{mb} MB took over {options.max_seconds:g}s"
+        results.append(result)
+        print_result(result)
+    return results
+
+
+async def run_all(names, corpus_path, text, prefixes, options):
+    async def job(page, name):
+        example = CASES[name]["example"]
+        await page.goto(f"{options.base_url}/examples/{CATEGORY}/{example}/index.html")
+        loaded = await page.evaluate(PREPARE, {"url": fixture_url(options.base_url, corpus_path)})
+        if loaded["chars"] != len(text):
+            raise RuntimeError(f"page read {loaded['chars']} characters of a {len(text)}-character corpus")
+        return await run_case(page, name, text, prefixes, options)
+
+    results = []
+    # One example at a time so the timings do not compete for cores.
+    async with VerificationEngine(concurrency=1, init_scripts=[COMPLETION_SCRIPT]) as engine:
+        async for case_results in engine.imap(job, names):
+            results.extend(case_results)
+    return sorted(results, key=lambda result: (result["example"], result["case"], result["mb"]))
+
+
+def print_result(result):
+    label = f"{result['example']} [{result['case']}] {result['mb']:g} MB"
+    if "error" in result:
+        print(f"FAILED {label}: {result['error']}")
+        return
+    print(f"{result['status'].upper()} {label}: {result['mb_per_s']} MB/s, {result['latency_ms']:.0f} ms")
+    for key, values in result.get("mismatch", {}).items():
+        print(f"  {key}: worker {values['worker']!r}, reference {values['reference']!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure text-processing throughput on a large mixed-script corpus.")
+    parser.add_argument("--size-mb", type=int, default=8, help="largest prefix and corpus size (default: 8)")
+    parser.add_argument("--min-mb", type=float, default=0.25, help="smallest prefix; sizes double from here (default: 0.25)")
+    parser.add_argument("--max-seconds", type=float, default=60,
+                        help="stop growing an example's input after a run this slow (default: 60)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run cases whose example id or name contains this text (repeatable)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", action="store_true",
+                        help="serve the repository at --base-url with serve.py for the duration of the run")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    names = [name for name, spec in CASES.items()
+             if not args.filter or any(text in spec["example"] or text in name for text in args.filter)]
+    if not names:
+        print("No text cases selected.")
+        return 0
+
+    corpus_path = text_corpus(args.size_mb, args.seed)
+    text = corpus_path.read_bytes().decode("utf-8")
+    prefixes = prefix_lengths(text, size_ladder(args.min_mb, args.size_mb))
+    if args.serve:
+        serve_base_url(args.base_url)
+    print(f"Running {len(names)} text cases on up to {args.size_mb} MB of {corpus_path.name}...")
+    results = asyncio.run(run_all(names, corpus_path, text, prefixes, args))
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    report_path = args.output_dir / "text-throughput.json"
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "corpus": corpus_path.name, "results": results}
+    report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = sum(1 for result in results if result["status"] == "failed")
+    skipped = sum(1 for result in results if result["status"] == "skipped")
+    print("-" * 20)
+    print(f"{len(results) - failed - skipped} passed, {failed} failed, {skipped} skipped after a slow or failed size; "
+          f"saved {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
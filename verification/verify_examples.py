@@ -1,70 +0,0 @@
-from playwright.sync_api import sync_playwright
-import time
-
-
-def verify_examples():
-    examples = [
-        ("308-black-hat-transform", "Black-hat Transform"),
-        ("309-skeletonize", "Skeletonize"),
-        ("310-distance-transform", "Distance Transform"),
-        ("311-image-scaling", "Image Scaling"),
-        ("312-lanczos-scaling", "Lanczos Scaling"),
-        ("313-nearest-neighbor-scaling", "Nearest Neighbor Scaling"),
-        ("314-image-rotation", "Image Rotation"),
-        ("315-image-flip", "Image Flip"),
-        ("348-pointillism", "Pointillism Effect"),
-        ("349-halftone", "Halftone Effect"),
-        ("350-crosshatch", "Crosshatch Effect"),
-        ("351-glass-effect", "Glass Effect"),
-        ("352-frosted-glass", "Frosted Glass Effect"),
-        ("353-kaleidoscope", "Kaleidoscope Effect"),
-        ("354-mirror-effect", "Mirror Effect"),
-        ("355-tile-effect", "Tile Effect"),
-    ]
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        for folder, title in examples:
-            print(f"Verifying {folder}...")
-            url = f"http://localhost:8080/examples/03-image-processing/{folder}/index.html"
-            try:
-                page.goto(url)
-                page.wait_for_load_state("networkidle")
-
-                h1 = page.query_selector("h1")
-                if h1:
-                    h1_text = h1.inner_text()
-                    if title not in h1_text:
-                        print(
-                            f"Warning: Title mismatch for {folder}. Expected '{title}', got '{h1_text}'"
-                        )
-                    else:
-                        print(f"SUCCESS: Title verified for {folder}")
-                else:
-                    page_title = page.title()
-                    if title not in page_title:
-                        print(
-                            f"Warning: Title mismatch for {folder}. Expected '{title}', got '{page_title}'"
-                        )
-
-                canvas = page.query_selector("#originalCanvas")
-                if canvas:
-                    print(f"SUCCESS: Canvas found for {folder}")
-                else:
-                    print(f"Warning: Canvas not found for {folder}")
-
-                screenshot_path = f"verification/{folder}.png"
-                page.screenshot(path=screenshot_path)
-                print(f"Screenshot saved to {screenshot_path}")
-            except Exception as e:
-                print(f"FAILED: Error verifying {folder}: {e}")
-
-            print("-" * 20)
-
-        browser.close()
-
-
-if __name__ == "__main__":
-    verify_examples()